@@ -23,6 +23,12 @@ def pytest_collection_modifyitems(
                 if bn != preferred:
                     continue
 
+        # pytest -n auto --dist loadgroup: exclusive tests share one worker
+        if item.get_closest_marker("exclusive") and config.pluginmanager.hasplugin(
+            "xdist"
+        ):
+            item.add_marker(pytest.mark.xdist_group("exclusive"))
+
         filtered.append(item)
 
     items[:] = filtered
@@ -0,0 +1,71 @@
+"""Per-call validation overhead: fresh TypeAdapter vs AdapterRegistry.
+
+Run from the project root:
+    python -m scripts.benchmarks.adapter_cache
+"""
+
+import timeit
+
+from pydantic import TypeAdapter
+
+from src.main.api.models.agent_response import AgentsListResponse
+from src.main.api.models.build_list_response import BuildListResponse
+from src.main.api.models.build_response import BuildResponse
+from src.main.api.requests.skeleton.adapter_registry import AdapterRegistry
+
+CALLS = 2_000
+
+
+def _build(build_id: int) -> dict:
+    return {
+        "id": build_id,
+        "buildTypeId": "Project_TestBuild",
+        "state": "finished",
+        "status": "SUCCESS",
+        "statusText": "Success",
+        "queuedDate": "20260101T120000+0000",
+        "startDate": "20260101T120001+0000",
+        "finishDate": "20260101T120005+0000",
+    }
+
+
+def _agent(agent_id: int) -> dict:
+    return {
+        "id": agent_id,
+        "name": f"docker-agent-{agent_id:02d}",
+        "typeId": agent_id,
+        "connected": True,
+        "authorized": True,
+        "enabled": True,
+        "href": f"/app/rest/agents/id:{agent_id}",
+        "webUrl": f"http://localhost:8111/agentDetails.html?id={agent_id}",
+    }
+
+
+PAYLOADS = {
+    BuildResponse: _build(1),
+    BuildListResponse: {"count": 20, "build": [_build(i) for i in range(20)]},
+    AgentsListResponse: {"count": 3, "agent": [_agent(i) for i in range(3)]},
+}
+
+
+def _per_call_us(stmt) -> float:
+    # Best of several runs to keep scheduler noise out of the numbers
+    return min(timeit.repeat(stmt, number=CALLS, repeat=5)) / CALLS * 1e6
+
+
+def main() -> None:
+    print(f"{'model':<22}{'fresh adapter, us':>20}{'registry, us':>16}{'speedup':>10}")
+    for model, payload in PAYLOADS.items():
+        before = _per_call_us(lambda: TypeAdapter(model).validate_python(payload))
+        AdapterRegistry.get(model)
+        after = _per_call_us(
+            lambda: AdapterRegistry.get(model).validate_python(payload)
+        )
+        print(
+            f"{model.__name__:<22}{before:>20.1f}{after:>16.1f}{before / after:>9.1f}x"
+        )
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,80 @@
+"""Response parsing: response.json() + validate_python vs validate_json on bytes.
+
+Uses a synthetic 10k-build /builds payload. Run from the project root:
+    python -m scripts.benchmarks.json_validation
+
+Peak memory is measured with tracemalloc, which sees every Python object the
+parsers create (dicts, lists, strings, models) but not pydantic-core's
+internal Rust buffers.
+"""
+
+import json
+import time
+import tracemalloc
+
+from src.main.api.models.build_list_response import BuildListResponse
+from src.main.api.requests.skeleton.adapter_registry import AdapterRegistry
+
+BUILDS = 10_000
+RUNS = 5
+
+
+def _payload() -> bytes:
+    builds = [
+        {
+            "id": build_id,
+            "buildTypeId": f"Project{build_id % 50}_Build",
+            "number": str(build_id),
+            "state": "finished",
+            "status": "SUCCESS" if build_id % 7 else "FAILURE",
+            "statusText": "Tests passed: 42",
+            "href": f"/app/rest/builds/id:{build_id}",
+            "webUrl": f"http://localhost:8111/viewLog.html?buildId={build_id}",
+            "queuedDate": "20260101T120000+0000",
+            "startDate": "20260101T120001+0000",
+            "finishDate": "20260101T120005+0000",
+        }
+        for build_id in range(BUILDS)
+    ]
+    return json.dumps({"count": BUILDS, "build": builds}).encode("utf-8")
+
+
+def _dict_path(adapter, content: bytes):
+    # What requests.Response.json() does: decode text, then json.loads
+    return adapter.validate_python(json.loads(content.decode("utf-8")))
+
+
+def _bytes_path(adapter, content: bytes):
+    return adapter.validate_json(content)
+
+
+def _measure(fn, adapter, content: bytes) -> tuple[float, float]:
+    best = float("inf")
+    for _ in range(RUNS):
+        start = time.perf_counter()
+        fn(adapter, content)
+        best = min(best, time.perf_counter() - start)
+
+    tracemalloc.start()
+    result = fn(adapter, content)
+    _, peak = tracemalloc.get_traced_memory()
+    tracemalloc.stop()
+    assert len(result.build) == BUILDS
+    return best * 1000, peak / 2**20
+
+
+def main() -> None:
+    content = _payload()
+    adapter = AdapterRegistry.get(BuildListResponse)
+    print(f"payload: {BUILDS} builds, {len(content) / 2**20:.1f} MiB")
+    print(f"{'path':<34}{'time, ms':>10}{'peak, MiB':>12}")
+    for name, fn in (
+        ("response.json() + validate_python", _dict_path),
+        ("validate_json(response.content)", _bytes_path),
+    ):
+        elapsed, peak = _measure(fn, adapter, content)
+        print(f"{name:<34}{elapsed:>10.1f}{peak:>12.1f}")
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,64 @@
+"""Strict validate_json vs trusted construction of a 10k-build /builds payload.
+
+Three consumers are measured: reading `count` only, finding one build by id
+(the polling / cleanup pattern) and touching every build. Run from the
+project root:
+    python -m scripts.benchmarks.trusted_construct
+"""
+
+import timeit
+
+from pydantic_core import from_json
+
+from scripts.benchmarks.json_validation import BUILDS, _payload
+from src.main.api.models.build_list_response import BuildListResponse
+from src.main.api.requests.skeleton.adapter_registry import AdapterRegistry
+
+RUNS = 5
+TARGET_ID = BUILDS // 2
+
+
+def _strict(adapter, content: bytes):
+    return adapter.validate_json(content)
+
+
+def _trusted(adapter, content: bytes):
+    return BuildListResponse.construct_trusted(from_json(content))
+
+
+CONSUMERS = {
+    "count only": lambda builds: builds.count,
+    "find one id": lambda builds: next(b for b in builds.build if b.id == TARGET_ID),
+    "every build": lambda builds: [b.state for b in builds.build],
+}
+# LazyModelList helpers that read raw fields instead of building models
+TRUSTED_CONSUMERS = {
+    "count only": CONSUMERS["count only"],
+    "find one id": lambda builds: builds.build.find(id=TARGET_ID),
+    "every build": lambda builds: builds.build.values("state"),
+}
+
+
+def main() -> None:
+    content = _payload()
+    adapter = AdapterRegistry.get(BuildListResponse)
+    print(f"payload: {BUILDS} builds, {len(content) / 2**20:.1f} MiB")
+    print(f"{'consumer':<14}{'strict':>8}{'trusted':>9}{'trusted raw':>13}  (ms)")
+    for name, consume in CONSUMERS.items():
+        row = []
+        for parse, use in (
+            (_strict, consume),
+            (_trusted, consume),
+            (_trusted, TRUSTED_CONSUMERS[name]),
+        ):
+            best = min(
+                timeit.repeat(
+                    lambda: use(parse(adapter, content)), number=1, repeat=RUNS
+                )
+            )
+            row.append(best * 1000)
+        print(f"{name:<14}{row[0]:>8.1f}{row[1]:>9.1f}{row[2]:>13.1f}")
+
+
+if __name__ == "__main__":
+    main()
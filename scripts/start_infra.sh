@@ -1,41 +1,182 @@
 #!/usr/bin/env bash
+# Starts N TeamCity servers (default 1) on ports 8111, 8112, ... with M agents
+# each (default 1). New agents are authorized by the suite's agent_pool fixture.
+# Usage: start_infra.sh [compose-file] [servers] [agents-per-server]
+#
+# Snapshot mode (TC_SNAPSHOT):
+#   off     (default) cold start: setup wizard on a fresh data dir
+#   auto    restore the snapshot if one exists, otherwise cold start and save one
+#   save    cold start, then save a snapshot
+#   restore restore the snapshot, fail if there is none
+# A snapshot (TC_SNAPSHOT_DIR, default infra/snapshots/pair-<i>) holds the server
+# data dir and agent volumes after the admin was created, the agent authorized
+# and an access token issued (saved as "token"), so a restored pair is ready
+# as soon as its REST API answers.
+
 set -euo pipefail
 
 COMPOSE_FILE="${1:-infra/docker_compose/docker-compose.yml}"
-TC_URL="http://localhost:8111"
+SERVERS="${2:-${TC_SERVER_COUNT:-1}}"
+AGENTS="${3:-${TC_AGENT_COUNT:-1}}"
+SNAPSHOT="${TC_SNAPSHOT:-off}"
+SNAPSHOT_DIR="${TC_SNAPSHOT_DIR:-infra/snapshots}"
+BASE_PORT=8111
 TIMEOUT=600
+ADMIN="admin:admin"
+# Volumes worth snapshotting; logs are not
+SNAPSHOT_VOLUMES=(teamcity_data teamcity_agent)
 
-echo "▶ Starting TeamCity infrastructure from: $COMPOSE_FILE"
-docker compose -f "$COMPOSE_FILE" up -d
+# Pair i: project teamcity (i=0) or teamcity-i, port BASE_PORT+i
+project_name() { if [ "$1" -eq 0 ]; then echo "teamcity"; else echo "teamcity-$1"; fi; }
+instance_suffix() { if [ "$1" -eq 0 ]; then echo ""; else echo "-$1"; fi; }
+snapshot_path() { echo "$SNAPSHOT_DIR/pair-$1"; }
 
-echo "⏳ Waiting for TeamCity to respond..."
-elapsed=0
-until curl -s -o /dev/null -w "%{http_code}" "$TC_URL/" | grep -qE "^(200|302|401|404|503)"; do
-    if [ "$elapsed" -ge "$TIMEOUT" ]; then
-        echo "❌ TeamCity did not start within ${TIMEOUT}s"
-        docker compose -f "$COMPOSE_FILE" logs --tail=50
-        exit 1
+compose() {
+    local i="$1"
+    shift
+    TC_INSTANCE="$(instance_suffix "$i")" TC_PORT="$((BASE_PORT + i))" \
+        docker compose -p "$(project_name "$i")" -f "$COMPOSE_FILE" --profile scale "$@"
+}
+
+has_snapshot() { [ -f "$(snapshot_path "$1")/teamcity_data.tgz" ]; }
+
+# probe <description> <command...>: retry with 0.5s, 1s, 2s, ... (max 10s) delays
+probe() {
+    local what="$1"
+    shift
+    local delay=0.5 started=$SECONDS
+    until "$@"; do
+        if [ $((SECONDS - started)) -ge "$TIMEOUT" ]; then
+            echo "❌ $what: not ready within ${TIMEOUT}s"
+            return 1
+        fi
+        sleep "$delay"
+        delay=$(awk -v d="$delay" 'BEGIN { d *= 2; print (d > 10 ? 10 : d) }')
+    done
+    echo "  ✓ $what ($((SECONDS - started))s)"
+}
+
+http_code() { curl -s -o /dev/null -w "%{http_code}" "$@" || true; }
+server_responds() { http_code "$1/" | grep -qE "^(200|302|401|404|503)$"; }
+rest_ready() { [ "$(http_code -u "$ADMIN" "$1/app/rest/server")" = "200" ]; }
+agent_connected() {
+    curl -s -u "$ADMIN" -H "Accept: application/json" \
+        "$1/app/rest/agents?locator=connected:true,authorized:any" | grep -q '"id"'
+}
+
+run_setup_wizard() {
+    local TC_URL="$1"
+    # Complete setup wizard if needed
+    if [ "$(http_code "$TC_URL/showAgreement.html")" = "200" ]; then
+        echo "📋 Accepting license agreement..."
+        curl -s -X POST "$TC_URL/showAgreement.html" \
+            -d "accept=true" > /dev/null
+
+        echo "🔧 Completing setup..."
+        curl -s -X POST "$TC_URL/setupAdmin.html" \
+            -d "userName=admin&password=admin&retypedPassword=admin&submitCreate=1" > /dev/null
     fi
-    echo "  ... waiting (${elapsed}s)"
-    sleep 10
-    elapsed=$((elapsed + 10))
-done
+}
 
-echo "✅ TeamCity responded — checking if setup is needed..."
+# Authorize connected agents and issue a token, so the snapshot needs no setup
+prepare_for_snapshot() {
+    local i="$1" TC_URL="$2" dir
+    dir="$(snapshot_path "$i")"
+    probe "agent connected to $TC_URL" agent_connected "$TC_URL"
+    for id in $(curl -s -u "$ADMIN" -H "Accept: application/json" \
+        "$TC_URL/app/rest/agents?locator=connected:true,authorized:false" |
+        grep -oE '"id":[0-9]+' | cut -d: -f2); do
+        curl -s -u "$ADMIN" -X PUT -H "Content-Type: text/plain" \
+            "$TC_URL/app/rest/agents/id:$id/authorized" -d true > /dev/null
+    done
+    mkdir -p "$dir"
+    curl -s -u "$ADMIN" -X POST -H "Accept: application/json" \
+        "$TC_URL/app/rest/users/current/tokens/autotests-$(date +%s)" |
+        grep -oE '"value":"[^"]+"' | cut -d'"' -f4 > "$dir/token"
+}
 
-# Complete setup wizard if needed
-HTTP_CODE=$(curl -s -o /dev/null -w "%{http_code}" "$TC_URL/showAgreement.html")
-if [ "$HTTP_CODE" = "200" ]; then
-    echo "📋 Accepting license agreement..."
-    curl -s -X POST "$TC_URL/showAgreement.html" \
-        -d "accept=true" > /dev/null
+save_snapshot() {
+    local i="$1" dir project
+    dir="$(cd "$(snapshot_path "$i")" && pwd)"
+    project="$(project_name "$i")"
+    echo "📸 Saving snapshot of pair $i to $dir"
+    # Stopped containers give a consistent copy of the data dir
+    compose "$i" stop
+    for volume in "${SNAPSHOT_VOLUMES[@]}"; do
+        docker run --rm -v "${project}_${volume}:/volume:ro" -v "$dir:/backup" alpine \
+            tar czf "/backup/${volume}.tgz" -C /volume .
+    done
+    compose "$i" start
+}
 
-    echo "🔧 Completing setup..."
-    curl -s -X POST "$TC_URL/setupAdmin.html" \
-        -d "userName=admin&password=admin&retypedPassword=admin&submitCreate=1" > /dev/null
+restore_snapshot() {
+    local i="$1" dir project
+    dir="$(cd "$(snapshot_path "$i")" && pwd)"
+    project="$(project_name "$i")"
+    echo "♻️  Restoring pair $i from $dir"
+    for volume in "${SNAPSHOT_VOLUMES[@]}"; do
+        docker volume create "${project}_${volume}" > /dev/null
+        docker run --rm -v "${project}_${volume}:/volume" -v "$dir:/backup:ro" alpine \
+            sh -c "rm -rf /volume/* /volume/..?* /volume/.[!.]* && tar xzf /backup/${volume}.tgz -C /volume"
+    done
+}
 
-    echo "⏳ Waiting for setup to complete..."
-    sleep 30
-fi
+urls=()
+restored=()
+for ((i = 0; i < SERVERS; i++)); do
+    port=$((BASE_PORT + i))
+    use_snapshot=false
+    case "$SNAPSHOT" in
+        restore)
+            has_snapshot "$i" || { echo "❌ No snapshot for pair $i in $(snapshot_path "$i")"; exit 1; }
+            use_snapshot=true ;;
+        auto) has_snapshot "$i" && use_snapshot=true ;;
+    esac
+    if $use_snapshot; then
+        restore_snapshot "$i"
+    fi
+    restored+=("$use_snapshot")
+
+    echo "▶ Starting TeamCity pair $i (port $port) from: $COMPOSE_FILE"
+    echo "   with $AGENTS agent(s)"
+    compose "$i" up -d --scale teamcity-agent-extra="$((AGENTS - 1))"
+    urls+=("http://localhost:$port")
+done
 
-echo "✅ TeamCity is ready at $TC_URL"
\ No newline at end of file
+# Servers boot concurrently; wait for them one after another
+for ((i = 0; i < SERVERS; i++)); do
+    TC_URL="${urls[$i]}"
+    echo "⏳ Waiting for TeamCity $TC_URL..."
+    if ! probe "$TC_URL responds" server_responds "$TC_URL"; then
+        compose "$i" logs --tail=50
+        exit 1
+    fi
+    if [ "${restored[$i]}" = false ]; then
+        run_setup_wizard "$TC_URL"
+    fi
+    if ! probe "$TC_URL REST API" rest_ready "$TC_URL"; then
+        compose "$i" logs --tail=50
+        exit 1
+    fi
+    if [ "${restored[$i]}" = false ] && { [ "$SNAPSHOT" = auto ] || [ "$SNAPSHOT" = save ]; }; then
+        prepare_for_snapshot "$i" "$TC_URL"
+        save_snapshot "$i"
+        probe "$TC_URL REST API after snapshot" rest_ready "$TC_URL"
+    fi
+    echo "✅ TeamCity is ready at $TC_URL"
+    token_file="$(snapshot_path "$i")/token"
+    if [ "$SNAPSHOT" != off ] && [ -s "$token_file" ]; then
+        if [ "$SERVERS" -gt 1 ]; then
+            echo "    export TC_SERVERS_${i}_BEARERTOKEN=$(cat "$token_file")"
+        else
+            echo "    export TC_ADMIN_BEARERTOKEN=$(cat "$token_file")"
+        fi
+    fi
+done
+
+if [ "$SERVERS" -gt 1 ]; then
+    echo "ℹ️  Shard the suite across the servers with:"
+    echo "    export TC_SERVERS=$(IFS=,; echo "${urls[*]}")"
+    echo "    export TC_SERVERS_<i>_BEARERTOKEN=<token of server i>  # i = 0..$((SERVERS - 1))"
+    echo "    pytest -n $SERVERS --dist loadgroup"
+fi
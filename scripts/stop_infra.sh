@@ -1,10 +1,15 @@
 #!/usr/bin/env bash
-# Tears down the TeamCity containers and removes volumes.
+# Tears down the TeamCity containers and removes volumes (snapshots are kept).
+# Usage: stop_infra.sh [compose-file] [servers]
 
 set -euo pipefail
 
 COMPOSE_FILE="${1:-infra/docker_compose/docker-compose.yml}"
+SERVERS="${2:-${TC_SERVER_COUNT:-1}}"
 
 echo "▶ Stopping TeamCity infrastructure..."
-docker compose -f "$COMPOSE_FILE" down -v --remove-orphans
-echo "✅ Infrastructure stopped and volumes removed"
\ No newline at end of file
+for ((i = 0; i < SERVERS; i++)); do
+    if [ "$i" -eq 0 ]; then project="teamcity"; else project="teamcity-$i"; fi
+    docker compose -p "$project" -f "$COMPOSE_FILE" --profile scale down -v --remove-orphans
+done
+echo "✅ Infrastructure stopped and volumes removed"
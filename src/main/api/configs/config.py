@@ -2,6 +2,8 @@ import os
 from pathlib import Path
 from typing import Any
 
+from src.main.api.configs.server_router import ServerRouter
+
 
 def _env_key(key: str) -> str:
     """Имя переменной окружения для ключа: admin.bearerToken -> TC_ADMIN_BEARERTOKEN"""
@@ -12,6 +14,7 @@ class Config:
     """Загрузка config.properties относительно корня проекта.
     Секреты можно передавать через переменные окружения (приоритет над файлом):
     - admin.bearerToken -> TC_ADMIN_BEARERTOKEN
+    Несколько серверов: servers=url1,url2 (см. ServerRouter)
     """
 
     # Определяем корень проекта по текущему файлу
@@ -38,9 +41,17 @@ class Config:
                     cls._properties[key.strip()] = value.strip()
 
     @classmethod
-    def get(cls, key: str, default_value: Any = None) -> Any:
-        cls._load_properties()
+    def _lookup(cls, key: str, default_value: Any = None) -> Any:
         env_val = os.environ.get(_env_key(key))
         if env_val is not None and env_val != "":
             return env_val
         return cls._properties.get(key, default_value)
+
+    @classmethod
+    def get(cls, key: str, default_value: Any = None) -> Any:
+        cls._load_properties()
+        # server/admin.*/agent.name follow this process's server when sharding
+        routed = ServerRouter.resolve(key, cls._lookup)
+        if routed is not None:
+            return routed
+        return cls._lookup(key, default_value)
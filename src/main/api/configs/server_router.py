@@ -0,0 +1,54 @@
+from typing import Callable, List, Optional
+
+from src.main.api.utils.worker import worker_id
+
+Lookup = Callable[[str], Optional[str]]
+
+# Single-server key -> per-server suffix under servers.<index>.
+ROUTED_KEYS = {
+    "server": "url",
+    "admin.bearerToken": "bearerToken",
+    "admin.username": "username",
+    "admin.password": "password",
+    "agent.name": "agentName",
+}
+
+
+class ServerRouter:
+    """Sticky routing of a test process to one of several TeamCity servers.
+
+    servers=http://localhost:8111,http://localhost:8112 turns sharding on.
+    Each server may override servers.<index>.bearerToken/username/password/
+    agentName, falling back to the single-server keys. xdist worker gwN uses
+    server N % count for its whole life, so every object a worker creates
+    (and later deletes) lives on one server. server.index pins a run to one
+    server instead. Without servers the plain "server" key is used as before.
+    """
+
+    @staticmethod
+    def urls(lookup: Lookup) -> List[str]:
+        servers = lookup("servers") or ""
+        return [url.strip().rstrip("/") for url in servers.split(",") if url.strip()]
+
+    @staticmethod
+    def index(lookup: Lookup, count: int) -> int:
+        pinned = lookup("server.index")
+        if pinned not in (None, ""):
+            return int(pinned) % count
+        worker = worker_id()
+        number = worker.removeprefix("gw")
+        return int(number) % count if number.isdigit() else 0
+
+    @classmethod
+    def resolve(cls, key: str, lookup: Lookup) -> Optional[str]:
+        """Routed value of key, or None to use the plain key"""
+        suffix = ROUTED_KEYS.get(key)
+        if suffix is None:
+            return None
+        urls = cls.urls(lookup)
+        if not urls:
+            return None
+        index = cls.index(lookup, len(urls))
+        if key == "server":
+            return urls[index]
+        return lookup(f"servers.{index}.{suffix}")
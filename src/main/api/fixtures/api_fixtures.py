@@ -1,8 +1,23 @@
 import pytest
 
 from src.main.api.classes.api_manager import ApiManager
+from src.main.api.requests.skeleton.session_pool import SessionPool
+from src.main.api.utils.server_health import HealthReport, ServerHealth
+
+
+@pytest.fixture(scope="session", autouse=True)
+def http_session_pool():
+    """Close pooled keep-alive HTTP sessions once the test session ends."""
+    yield
+    SessionPool.close_all()
+
+
+@pytest.fixture(scope="session")
+def server_health() -> HealthReport:
+    """Wait once for the server; later tests fail fast on the cached diagnosis."""
+    return ServerHealth.ensure()
 
 
 @pytest.fixture(scope="function")
-def api_manager(created_objects):
+def api_manager(created_objects, server_health):
     return ApiManager(created_objects)
@@ -1,10 +1,6 @@
-import logging
-import sys
-import time
-import traceback
+from typing import Optional
 
 import pytest
-import requests
 
 from src.main.api.classes.api_manager import ApiManager
 from src.main.api.configs.config import Config
@@ -13,98 +9,90 @@ from src.main.api.generators.random_model_generator import RandomModelGenerator
 from src.main.api.models.create_build_step_request import CreateBuildStepRequest
 from src.main.api.models.create_buildtype_request import CreateBuildTypeRequest
 from src.main.api.models.create_project_request import CreateProjectRequest
-from src.main.api.specs.request_specs import RequestSpecs
-from src.main.api.specs.response_specs import ResponseSpecs
+from src.main.api.steps.agent_steps import AgentSteps
+from src.main.api.utils.build_type_pool import (
+    BuildTypePool,
+    create_profile_build_type,
+)
+from src.main.api.utils.server_health import ServerHealth
 from src.tests.ui.builds_helpers import cleanup_triggered_builds
 
 
-def _create_custom_build_type(
-    project_id: str,
-    build_type_name: str,
-    script_content: str,
-    artifact_rules: str | None = None,
-) -> str:
-    build_type_data = {
-        "name": build_type_name,
-        "project": {"id": project_id},
-        "steps": {
-            "step": [
-                {
-                    "name": "Custom Step",
-                    "type": "simpleRunner",
-                    "properties": {
-                        "property": [
-                            {"name": "script.content", "value": script_content},
-                            {"name": "teamcity.step.mode", "value": "default"},
-                            {"name": "use.custom.script", "value": "true"},
-                        ]
-                    },
-                }
-            ]
-        },
-    }
-    url = f"{Config.get('server')}{Config.get('apiVersion')}/buildTypes"
-    headers = {
-        **RequestSpecs.admin_auth_spec(),
-        "Content-Type": "application/json",
-        "Accept": "application/json",
-    }
-    response = requests.post(url, headers=headers, json=build_type_data, timeout=30)
-    ResponseSpecs.entity_was_created()(response)
-    build_type_id = response.json().get("id")
-
-    # TeamCity may ignore artifactRules in create payload; set it explicitly.
-    if artifact_rules:
-        artifact_url = (
-            f"{Config.get('server')}{Config.get('apiVersion')}"
-            f"/buildTypes/id:{build_type_id}/settings/artifactRules"
-        )
-        artifact_response = requests.put(
-            artifact_url,
-            headers={
-                **RequestSpecs.admin_auth_spec(),
-                "Content-Type": "text/plain",
-                "Accept": "*/*",
-            },
-            data=artifact_rules,
-            timeout=30,
+@pytest.fixture(scope="session")
+def agent_pool(server_health) -> int:
+    """Wait for ready agents, authorizing/enabling connected ones; returns idle count."""
+    ServerHealth.ensure(
+        min_agents=int(Config.get("health.minAgents", ServerHealth.DEFAULT_MIN_AGENTS)),
+        prepare_agents=True,
+    )
+    return AgentSteps([]).get_idle_agent_count()
+
+
+@pytest.fixture(scope="session")
+def build_type_pool(agent_pool: int):
+    """Warm pool of project + build type pairs, emptied once the session ends."""
+    if not BuildTypePool.enabled():
+        yield None
+        return
+    pool = BuildTypePool()
+    yield pool
+    pool.close()
+
+
+def _leased_build_type(
+    api_manager: ApiManager, pool: Optional[BuildTypePool], profile: str
+):
+    """Yield (build_type_id, project_id) from the pool, or a fresh pair without one"""
+    if pool is None:
+        project = api_manager.admin_steps.create_project(
+            CreateProjectRequest(
+                id=GenerateData.get_project_id(), name=GenerateData.get_project_name()
+            )
         )
-        ResponseSpecs.request_returns_ok()(artifact_response)
+        # The project is in created_objects; deleting it removes the build type
+        yield create_profile_build_type(project.id, profile), project.id
+        return
 
-    return build_type_id
+    pooled = pool.lease(profile)
+    try:
+        yield pooled.build_type_id, pooled.project_id
+    finally:
+        pool.release(pooled, api_manager.build_steps.created_objects)
 
 
 @pytest.fixture
-def build_type(api_manager: ApiManager):
-    """Create a project and a simple build type for testing.
+def build_type(api_manager: ApiManager, build_type_pool: Optional[BuildTypePool]):
+    """Lease a project with a simple build type for testing.
 
+    Server and agent readiness are gated once per session by agent_pool.
     Returns: tuple of (build_type_id, project_id)
     """
-    try:
-        # Create a test project
-        project_request = CreateProjectRequest(
-            id=GenerateData.get_project_id(), name=GenerateData.get_project_name()
-        )
-        project = api_manager.admin_steps.create_project(project_request)
+    yield from _leased_build_type(api_manager, build_type_pool, "simple")
 
-        # Create a simple build type
-        build_type_id = api_manager.admin_steps.create_simple_build_type(
-            project_id=project.id, build_type_name="Test Build"
-        )
 
-        # Return both build_type_id and project_id for UI tests
-        yield (build_type_id, project.id)
+@pytest.fixture
+def long_running_build_type(
+    api_manager: ApiManager, build_type_pool: Optional[BuildTypePool]
+):
+    """(build_type_id, project_id) of a build that logs for about a minute"""
+    yield from _leased_build_type(api_manager, build_type_pool, "long_running")
+
 
-        # Cleanup: delete build type (not tracked in created_objects)
-        # Project cleanup will be handled by created_objects fixture automatically
-        try:
-            api_manager.admin_steps.delete_build_type(build_type_id)
-        except Exception as e:
-            logging.warning(f"Could not delete build type {build_type_id}: {e}")
-    except Exception as e:
-        exc_info = "".join(traceback.format_exception(type(e), e, e.__traceback__))
-        logging.error(f"Full error in build_type fixture:\n{exc_info}")
-        pytest.skip(f"TeamCity server not ready (may be in maintenance mode): {e}")
+@pytest.fixture
+def artifact_build_type(
+    api_manager: ApiManager, build_type_pool: Optional[BuildTypePool]
+):
+    """(build_type_id, project_id) of a build publishing out/result.txt"""
+    yield from _leased_build_type(api_manager, build_type_pool, "artifact")
+
+
+@pytest.fixture
+def build_tracker(api_manager: ApiManager):
+    """Ids of builds a test triggers; queued/running ones are cancelled afterwards"""
+    build_ids: list[int] = []
+    yield build_ids
+    if build_ids:
+        cleanup_triggered_builds(api_manager, build_ids)
 
 
 @pytest.fixture
@@ -113,26 +101,33 @@ def queued_build(api_manager: ApiManager, build_type: tuple):
     # Extract build_type_id from tuple
     build_type_id, _ = build_type
 
-    # Trigger multiple builds to saturate agents and keep some in queue
-    builds = []
-    for _ in range(5):
-        build = api_manager.build_steps.trigger_build(build_type_id)
-        builds.append(build)
-
-    # Find a build that's still queued
-    for attempt in range(10):
-        for build in builds:
-            status = api_manager.build_steps.get_build_by_id(
-                build.id, fields="id,buildTypeId,state"
-            )
+    # Occupy every idle agent plus one build that has to wait in the queue
+    builds = api_manager.build_steps.trigger_builds(
+        build_type_id, count=api_manager.agent_steps.builds_to_saturate()
+    )
+
+    # Find a build that's still queued: the first one seen queued wins
+    queued = None
+    try:
+        for status in api_manager.build_steps.wait_for_builds(
+            [build.id for build in builds],
+            lambda found: found.state != "running",
+            timeout=5,
+            fields="id,buildTypeId,state",
+        ):
             if status.state == "queued":
-                # Remove this build from created_objects so it doesn't get auto-cleaned
-                # Test will handle cleanup (cancelling the build)
-                if build in api_manager.build_steps.created_objects:
-                    api_manager.build_steps.created_objects.remove(build)
-                yield build
-                return
-        time.sleep(0.5)
+                queued = status
+                break
+    except TimeoutError:
+        pass
+    for build in builds:
+        if queued is not None and build.id == queued.id:
+            # Remove this build from created_objects so it doesn't get auto-cleaned
+            # Test will handle cleanup (cancelling the build)
+            if build in api_manager.build_steps.created_objects:
+                api_manager.build_steps.created_objects.remove(build)
+            yield build
+            return
 
     pytest.skip("Build left queue too quickly to cancel")
 
@@ -143,14 +138,20 @@ def running_build(api_manager: ApiManager, build_type: tuple):
     build_type_id, _ = build_type
 
     build = api_manager.build_steps.trigger_build(build_type_id)
-    for _ in range(10):
-        build_status = api_manager.build_steps.get_build_by_id(
-            build.id, fields="id,buildTypeId,state"
+    try:
+        build_status = next(
+            api_manager.build_steps.wait_for_builds(
+                [build.id],
+                lambda found: found.state != "queued",
+                timeout=20,
+                fields="id,buildTypeId,state",
+            )
         )
-        if build_status.state == "running":
-            yield build
-            return
-        time.sleep(2)
+    except TimeoutError:
+        build_status = None
+    if build_status is not None and build_status.state == "running":
+        yield build
+        return
     pytest.skip("Build completed too quickly to catch in 'running' state")
 
 
@@ -170,10 +171,7 @@ def multiple_builds(api_manager: ApiManager, build_type: tuple):
     # Extract build_type_id from tuple
     build_type_id, _ = build_type
 
-    builds = []
-    for _ in range(3):
-        build = api_manager.build_steps.trigger_build(build_type_id)
-        builds.append(build)
+    builds = api_manager.build_steps.trigger_builds(build_type_id, count=3)
     yield builds
 
 
@@ -3,6 +3,7 @@ from typing import Any, List
 import pytest
 
 from src.main.api.utils.cleanup_helper import cleanup_objects
+from src.main.api.utils.deferred_cleanup import DeferredCleanup
 
 
 # Создание списка данных и очистка
@@ -10,4 +11,18 @@ from src.main.api.utils.cleanup_helper import cleanup_objects
 def created_objects():
     objects: List[Any] = []
     yield objects
-    cleanup_objects(objects)
+    if DeferredCleanup.enabled():
+        DeferredCleanup.defer(objects)
+    else:
+        cleanup_objects(objects)
+
+
+@pytest.fixture(scope="session", autouse=True)
+def deferred_cleanup(http_session_pool):
+    """Deferred teardown: delete what is left, plus tombstones of a crashed run.
+
+    Depends on http_session_pool, so it runs before pooled sessions are closed.
+    """
+    yield
+    if DeferredCleanup.enabled() or DeferredCleanup.path().is_file():
+        DeferredCleanup.flush()
@@ -1,12 +1,69 @@
+from contextlib import ExitStack
+
 import pytest
 
+from src.main.api.configs.config import Config
+from src.main.api.utils.file_lock import FileLock
 from src.main.api.utils.normalize_browsers import norm_browser_name
+from src.main.ui.classes.auth_state_cache import AuthStateCache
+from src.main.ui.classes.context_pool import ContextPool
+from src.main.ui.classes.network_policy import NetworkPolicy
 from src.tests.ui.base_test import BaseUITest
 
 
+@pytest.fixture(scope="session")
+def context_pool(browser):
+    yield ContextPool
+    ContextPool.close(browser)
+
+
+@pytest.fixture
+def context(browser, browser_context_args, context_pool, request):
+    """Contexts come from the pool; admin_session ones start logged in.
+
+    The test's NetworkPolicy (@pytest.mark.network) is routed on top.
+
+    Without the pool each test gets a fresh context from pytest-playwright.
+    """
+    username = None
+    if request.node.get_closest_marker("admin_session") and AuthStateCache.enabled():
+        username = Config.get("admin.username", "admin")
+
+    pooled = context_pool.enabled(request)
+    if pooled:
+
+        def new_context(**kwargs):
+            return browser.new_context(**browser_context_args, **kwargs)
+
+    else:
+        new_context = request.getfixturevalue("new_context")
+
+    def create():
+        if username is None:
+            return new_context()
+        return AuthStateCache.seed(
+            new_context, browser, username, Config.get("admin.password", "admin")
+        )
+
+    policy = NetworkPolicy.for_test(request)
+    if not pooled:
+        context = create()
+        policy.apply(context)
+        yield context
+        return
+    context = context_pool.acquire(browser, username, create)
+    policy.apply(context)
+    yield context
+    context_pool.release(browser, username, context)
+
+
 @pytest.fixture(autouse=True)
 def admin_session_autologin(request, page):
-    if request.node.get_closest_marker("admin_session"):
+    if not request.node.get_closest_marker("admin_session"):
+        return
+    if AuthStateCache.enabled():
+        page.set_viewport_size({"width": 1920, "height": 1080})
+    else:
         BaseUITest().auth_as_admin(page)
 
 
@@ -27,3 +84,26 @@ def browser_match_guard(request):
 
     if norm_browser_name(str(current)) not in allowed:
         pytest.skip(f"Пропущен: текущий браузер '{current}' не в {sorted(allowed)}")
+
+
+# Fixtures that run builds: such tests need the shared agent left enabled
+AGENT_FIXTURES = {"build_type", "long_running_build_type", "artifact_build_type"}
+
+
+@pytest.fixture(autouse=True)
+def exclusive_resource_lock(request):
+    """@pytest.mark.exclusive("agents", ...) takes cross-worker exclusive locks.
+
+    Tests that run builds hold a shared "agents" lock, so a test disabling
+    the agent waits for them and blocks them in turn. Locks are taken in
+    name order so two workers can never deadlock.
+    """
+    mark = request.node.get_closest_marker("exclusive")
+    exclusive = {str(name) for name in mark.args} if mark else set()
+    shared = set()
+    if AGENT_FIXTURES.intersection(request.fixturenames):
+        shared.add("agents")
+    with ExitStack() as locks:
+        for name in sorted(exclusive | shared):
+            locks.enter_context(FileLock.for_server(name, shared=name not in exclusive))
+        yield
@@ -1,9 +1,10 @@
 import random
 import string
-import time
 
 from faker import Faker
 
+from src.main.api.utils.worker import unique_suffix
+
 faker = Faker()
 
 
@@ -11,20 +12,17 @@ class GenerateData:
 
     @staticmethod
     def get_project_name() -> str:
-        # Add timestamp to ensure uniqueness
+        # Worker-aware suffix keeps names unique under pytest-xdist
         words = faker.words(nb=random.randint(1, 3))
-        timestamp = str(int(time.time() * 1000))[-6:]
-        return " ".join(words).title() + f" {timestamp}"
+        return " ".join(words).title() + f" {unique_suffix()}"
 
     @staticmethod
     def get_project_id() -> str:
-        # Use timestamp + random to ensure uniqueness
-        # Last 6 digits of ms timestamp
-        timestamp_suffix = str(int(time.time() * 1000))[-6:]
+        # Random readable part + run/worker/counter suffix: unique by construction
         first_char = random.choice(string.ascii_letters)
         allowed_chars = string.ascii_letters + string.digits + "_"
         rest = "".join(random.choices(allowed_chars, k=random.randint(4, 8)))
-        return first_char + rest + timestamp_suffix
+        return f"{first_char}{rest}_{unique_suffix()}"
 
     @staticmethod
     def get_project_id_with_length(length: int) -> str:
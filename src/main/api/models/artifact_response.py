@@ -0,0 +1,30 @@
+from typing import List, Optional
+
+from src.main.api.models.base_model import BaseModel
+
+
+class ArtifactHref(BaseModel):
+    href: str = ""
+
+
+class ArtifactFile(BaseModel):
+    """File or directory of a build's artifact tree."""
+
+    name: str
+    fullName: str = ""
+    size: Optional[int] = None
+    modificationTime: Optional[str] = None
+    # Only files have content, only directories (and archives) have children
+    content: Optional[ArtifactHref] = None
+    children: Optional[ArtifactHref] = None
+
+    @property
+    def is_file(self) -> bool:
+        return self.content is not None
+
+
+class ArtifactListResponse(BaseModel):
+    """GET /app/rest/builds/id:X/artifacts/children response."""
+
+    count: int = 0
+    file: List[ArtifactFile] = []
@@ -1,6 +1,167 @@
+import types
+from collections.abc import Sequence
+from typing import (
+    Any,
+    Callable,
+    Dict,
+    Generic,
+    List,
+    Tuple,
+    TypeVar,
+    Union,
+    get_args,
+    get_origin,
+)
+
 from pydantic import BaseModel as BM
 from pydantic import ConfigDict
+from pydantic_core import PydanticUndefined
 
 
 class BaseModel(BM):
     model_config = ConfigDict(validate_assignment=True)
+
+    @classmethod
+    def construct_trusted(cls, data: Any):
+        """Build the model from trusted server data without validation.
+
+        List-of-model fields become LazyModelList: elements are built only when
+        accessed, so reading `count` or finding one id does not pay for the
+        whole payload. Nested single models are built eagerly.
+        `data` must be a freshly parsed dict: it is reused as the model state,
+        and unknown keys stay there unless the model allows extras (dumps and
+        repr only read declared fields).
+        """
+        if not isinstance(data, dict):
+            return data
+        plan = _PLANS.get(cls) or _trusted_plan(cls)
+        defaults, keys, nested, allow_extra = plan
+
+        extra = None
+        if allow_extra:
+            extra = {key: data.pop(key) for key in data.keys() - keys}
+        fields_set = set(data)
+        for key, default in defaults:
+            if key not in data:
+                data[key] = default() if callable(default) else default
+        for key, build in nested:
+            value = data.get(key)
+            if value is not None:
+                data[key] = build(value)
+
+        model = cls.__new__(cls)
+        _set(model, "__dict__", data)
+        _set(model, "__pydantic_fields_set__", fields_set)
+        _set(model, "__pydantic_extra__", (extra or {}) if allow_extra else None)
+        _set(model, "__pydantic_private__", None)
+        return model
+
+
+_set = object.__setattr__
+_PLANS: Dict[type, Tuple] = {}
+
+M = TypeVar("M")
+
+
+class LazyModelList(Sequence, Generic[M]):
+    """Read-only list of trusted models, each built on first access.
+
+    find/filter/values scan the raw dicts, so lookups by id build at most the
+    matching models. Envelopes holding it are lookup views: model_dump() on
+    them is not supported, dump the elements instead.
+    """
+
+    __slots__ = ("_model", "_items")
+
+    def __init__(self, model: type, items: list):
+        self._model = model
+        self._items = items
+
+    def __len__(self) -> int:
+        return len(self._items)
+
+    def __getitem__(self, index):
+        if isinstance(index, slice):
+            return [self[i] for i in range(*index.indices(len(self._items)))]
+        item = self._items[index]
+        if isinstance(item, dict):
+            item = self._model.construct_trusted(item)
+            self._items[index] = item
+        return item
+
+    def __iter__(self):
+        items, build = self._items, self._model.construct_trusted
+        for index, item in enumerate(items):
+            if isinstance(item, dict):
+                item = build(item)
+                items[index] = item
+            yield item
+
+    def filter(self, **fields) -> list:
+        """Elements whose raw fields match, building only those models"""
+        return [self[index] for index in self._matches(fields)]
+
+    def find(self, **fields):
+        """First element whose raw fields match, building only that model"""
+        return next((self[index] for index in self._matches(fields)), None)
+
+    def _matches(self, fields: dict):
+        for index, item in enumerate(self._items):
+            raw = item if isinstance(item, dict) else item.__dict__
+            if all(raw.get(key) == value for key, value in fields.items()):
+                yield index
+
+    def values(self, field: str) -> list:
+        """One field from every element, read without building the models"""
+        return [
+            (item if isinstance(item, dict) else item.__dict__).get(field)
+            for item in self._items
+        ]
+
+    def __eq__(self, other) -> bool:
+        return isinstance(other, Sequence) and list(self) == list(other)
+
+    def __repr__(self) -> str:
+        return f"LazyModelList({self._model.__name__}, {len(self._items)} items)"
+
+
+def _trusted_plan(
+    cls: type,
+) -> Tuple:
+    """Per-model defaults, field names and nested-model builders (cached in _PLANS)"""
+    defaults: List[Tuple[str, Any]] = []
+    nested: List[Tuple[str, Callable]] = []
+    for name, field in cls.model_fields.items():
+        if field.alias and field.alias != name:
+            # Aliased fields need validation to be mapped; none of our models use them
+            raise TypeError(f"{cls.__name__}.{name} uses an alias")
+        if field.default_factory is not None:
+            defaults.append((name, field.default_factory))
+        elif isinstance(field.default, (list, dict, set)):
+            # Mutable defaults are copied per instance, never shared
+            defaults.append((name, field.default.copy))
+        elif field.default is not PydanticUndefined:
+            defaults.append((name, field.default))
+        build = _nested_builder(field.annotation)
+        if build is not None:
+            nested.append((name, build))
+    allow_extra = cls.model_config.get("extra") == "allow"
+    plan = (tuple(defaults), frozenset(cls.model_fields), tuple(nested), allow_extra)
+    _PLANS[cls] = plan
+    return plan
+
+
+def _nested_builder(annotation: Any) -> Callable[[Any], Any] | None:
+    origin = get_origin(annotation)
+    if origin in (Union, types.UnionType):
+        args = [arg for arg in get_args(annotation) if arg is not type(None)]
+        return _nested_builder(args[0]) if len(args) == 1 else None
+    if origin is list:
+        args = get_args(annotation)
+        item = args[0] if args else None
+        if isinstance(item, type) and issubclass(item, BaseModel):
+            return lambda items: LazyModelList(item, items)
+        return None
+    if isinstance(annotation, type) and issubclass(annotation, BaseModel):
+        return annotation.construct_trusted
+    return None
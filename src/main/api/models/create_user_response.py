@@ -1,5 +1,7 @@
 from typing import Any, Dict, List, Optional
 
+from pydantic import Field
+
 from src.main.api.models.base_model import BaseModel
 
 
@@ -11,7 +13,8 @@ class CreateUserResponse(BaseModel):
     properties: Optional[Dict[str, Any]] = None
     roles: Optional[Dict[str, Any]] = None
     groups: Optional[Dict[str, Any]] = None
-    password: Optional[str] = None
+    # Copied from the request by AdminSteps; TeamCity never returns it
+    password: Optional[str] = Field(None, json_schema_extra={"local": True})
 
 
 class UsersListResponse(BaseModel):
@@ -0,0 +1,77 @@
+import logging
+import threading
+from typing import Any, Dict, Iterable, Optional
+
+from pydantic import TypeAdapter, ValidationError
+from pydantic_core import from_json
+
+from src.main.api.requests.skeleton.endpoint import Endpoint
+
+
+class AdapterRegistry:
+    """Process-wide TypeAdapter cache keyed by response model.
+
+    Building a TypeAdapter compiles the pydantic core schema, so requesters
+    take adapters from here instead of creating one per instance.
+    Set validation.warmUp=true to build all endpoint adapters at import time.
+    """
+
+    _adapters: Dict[Any, TypeAdapter] = {}
+    _lock = threading.Lock()
+
+    @classmethod
+    def get(cls, model: Any) -> Optional[TypeAdapter]:
+        if model is None:
+            return None
+        adapter = cls._adapters.get(model)
+        if adapter is not None:
+            return adapter
+        with cls._lock:
+            adapter = cls._adapters.get(model)
+            if adapter is None:
+                adapter = TypeAdapter(model)
+                cls._adapters[model] = adapter
+            return adapter
+
+    @classmethod
+    def warm_up(cls, models: Optional[Iterable[Any]] = None) -> int:
+        """Build adapters ahead of time (all Endpoint response models by default)"""
+        if models is None:
+            models = {endpoint.value.response_model for endpoint in Endpoint}
+        built = 0
+        for model in models:
+            if model is not None and model not in cls._adapters:
+                cls.get(model)
+                built += 1
+        logging.debug(f"Warmed up {built} TypeAdapter(s)")
+        return built
+
+    @classmethod
+    def clear(cls) -> None:
+        with cls._lock:
+            cls._adapters.clear()
+
+
+def validate_response(adapter: TypeAdapter, response) -> Any:
+    """Validate the raw response bytes in a single pass.
+
+    Falls back to response.json() + validate_python only when the body is not
+    valid UTF-8 JSON bytes (e.g. a BOM or a non-UTF-8 charset that the HTTP
+    client can still decode).
+    """
+    try:
+        return adapter.validate_json(response.content)
+    except ValidationError as e:
+        if any(error["type"] != "json_invalid" for error in e.errors()):
+            raise
+    return adapter.validate_python(response.json())
+
+
+def construct_response(model: Any, response) -> Any:
+    """Trusted mode: parse the bytes and build models without validation"""
+    try:
+        data = from_json(response.content)
+    except ValueError:
+        # Same fallback as validate_response for bodies that are not UTF-8 JSON
+        data = response.json()
+    return model.construct_trusted(data)
@@ -0,0 +1,104 @@
+import asyncio
+import logging
+from concurrent.futures import ThreadPoolExecutor
+from http.cookiejar import CookieJar
+from typing import Awaitable, Dict, Optional, Tuple, TypeVar
+
+import httpx
+
+from src.main.api.configs.config import Config
+from src.main.api.requests.skeleton.session_pool import SessionPool, _RejectAllCookies
+
+T = TypeVar("T")
+
+
+class AsyncSessionPool:
+    """Pooled httpx.AsyncClient instances plus a per-loop concurrency limiter.
+
+    Clients are bound to the event loop that created them, so they are keyed by
+    loop as well as by server origin and auth header. Settings:
+    - http.poolSize       -> max connections per client (shared with SessionPool)
+    - http.keepAlive      -> reuse TCP connections between calls
+    - http.maxConcurrency -> max in-flight async requests per loop (default 8)
+    """
+
+    DEFAULT_MAX_CONCURRENCY = 8
+
+    _clients: Dict[Tuple[int, str, str], httpx.AsyncClient] = {}
+    _limiters: Dict[int, asyncio.Semaphore] = {}
+
+    @classmethod
+    def get(
+        cls, base_url: str, request_spec: Optional[Dict[str, str]] = None
+    ) -> httpx.AsyncClient:
+        loop_id = id(asyncio.get_running_loop())
+        key = (loop_id, *SessionPool._key(base_url, request_spec))
+        client = cls._clients.get(key)
+        if client is None:
+            client = cls._create_client()
+            cls._clients[key] = client
+            logging.debug(f"Opened async HTTP client for {key[1]}")
+        return client
+
+    @classmethod
+    def _create_client(cls) -> httpx.AsyncClient:
+        pool_size = int(Config.get("http.poolSize", SessionPool.DEFAULT_POOL_SIZE))
+        keep_alive = str(Config.get("http.keepAlive", "true")).lower() == "true"
+        limits = httpx.Limits(
+            max_connections=pool_size,
+            max_keepalive_connections=pool_size if keep_alive else 0,
+        )
+        return httpx.AsyncClient(
+            limits=limits,
+            timeout=None,
+            cookies=httpx.Cookies(CookieJar(policy=_RejectAllCookies())),
+        )
+
+    @classmethod
+    def limiter(cls) -> asyncio.Semaphore:
+        loop_id = id(asyncio.get_running_loop())
+        limiter = cls._limiters.get(loop_id)
+        if limiter is None:
+            limit = int(Config.get("http.maxConcurrency", cls.DEFAULT_MAX_CONCURRENCY))
+            limiter = asyncio.BoundedSemaphore(limit)
+            cls._limiters[loop_id] = limiter
+        return limiter
+
+    @classmethod
+    async def aclose_current_loop(cls) -> None:
+        loop_id = id(asyncio.get_running_loop())
+        keys = [key for key in cls._clients if key[0] == loop_id]
+        for key in keys:
+            await cls._clients.pop(key).aclose()
+        cls._limiters.pop(loop_id, None)
+
+    @staticmethod
+    async def _cancel_pending() -> None:
+        """Cancel and await the loop's other tasks, e.g. siblings of a failed gather"""
+        current = asyncio.current_task()
+        pending = [task for task in asyncio.all_tasks() if task is not current]
+        for task in pending:
+            task.cancel()
+        await asyncio.gather(*pending, return_exceptions=True)
+
+    @classmethod
+    def run(cls, coro: Awaitable[T]) -> T:
+        """Run coro on a fresh event loop and close the clients it opened.
+
+        When the calling thread already has a running loop (Playwright's sync
+        API keeps one set), the fresh loop runs on a helper thread instead.
+        """
+
+        async def _main() -> T:
+            try:
+                return await coro
+            finally:
+                await cls._cancel_pending()
+                await cls.aclose_current_loop()
+
+        try:
+            asyncio.get_running_loop()
+        except RuntimeError:
+            return asyncio.run(_main())
+        with ThreadPoolExecutor(1, thread_name_prefix="async-session-pool") as runner:
+            return runner.submit(asyncio.run, _main()).result()
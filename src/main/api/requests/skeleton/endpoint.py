@@ -3,7 +3,9 @@ from enum import Enum
 from typing import Optional
 
 from src.main.api.models.agent_response import AgentResponse, AgentsListResponse
+from src.main.api.models.artifact_response import ArtifactListResponse
 from src.main.api.models.base_model import BaseModel
+from src.main.api.models.build_cancel_request import BuildCancelRequest
 from src.main.api.models.build_list_response import BuildListResponse
 from src.main.api.models.build_queue_response import BuildQueueResponse
 from src.main.api.models.build_response import BuildResponse
@@ -76,6 +78,8 @@ class Endpoint(Enum):
         url="/projects", request_model=None, response_model=CreateProjectResponse
     )
 
+    SERVER_INFO = EndpointConfig(url="/server", request_model=None, response_model=None)
+
     # Agents API
     AGENTS_LIST = EndpointConfig(
         url="/agents", request_model=None, response_model=AgentsListResponse
@@ -123,14 +127,38 @@ class Endpoint(Enum):
         url="/buildQueue", request_model=None, response_model=BuildQueueResponse
     )
 
+    BUILD_QUEUE_CANCEL_BY_ID = EndpointConfig(
+        url="/buildQueue/id:{buildId}",
+        request_model=BuildCancelRequest,
+        response_model=BuildResponse,
+    )
+
     BUILDS = EndpointConfig(
         url="/builds", request_model=None, response_model=BuildResponse
     )
 
+    BUILD_CANCEL_BY_ID = EndpointConfig(
+        url="/builds/id:{buildId}",
+        request_model=BuildCancelRequest,
+        response_model=BuildResponse,
+    )
+
     BUILDS_LIST = EndpointConfig(
         url="/builds", request_model=None, response_model=BuildListResponse
     )
 
+    BUILD_ARTIFACTS_CHILDREN = EndpointConfig(
+        url="/builds/id:{buildId}/artifacts/children{path}",
+        request_model=None,
+        response_model=ArtifactListResponse,
+    )
+
+    BUILD_ARTIFACT_CONTENT = EndpointConfig(
+        url="/builds/id:{buildId}/artifacts/content{path}",
+        request_model=None,
+        response_model=None,
+    )
+
     ADMIN_DELETE_BUILD_STEP = EndpointConfig(
         url="/buildTypes/id:{BuildTypeId}/steps/{stepId}",
         request_model=None,
@@ -0,0 +1,83 @@
+import types
+from functools import lru_cache
+from typing import Any, Dict, Optional, Union, get_args, get_origin
+
+from src.main.api.configs.config import Config
+from src.main.api.models.base_model import BaseModel
+
+
+@lru_cache(maxsize=None)
+def fields_projection(model: Any) -> Optional[str]:
+    """TeamCity `fields=` value covering exactly the fields of a response model.
+
+    Nested models and lists of models become `name(...)` with every field of
+    the element model, e.g. BuildListResponse -> "build(id,buildTypeId,...),count",
+    so list elements come back in full rather than in TeamCity's short form.
+    Opaque Dict/Any fields are requested by name. A top-level model with
+    extra="allow" wants everything, so it gets None; nested ones get their
+    declared fields. Client-only fields, declared with
+    Field(json_schema_extra={"local": True}), are never requested.
+    """
+    if not _is_model(model) or model.model_config.get("extra") == "allow":
+        return None
+    return _projection(model)
+
+
+def _projection(model: type) -> str:
+    parts = []
+    for name, field in model.model_fields.items():
+        if _is_local(field):
+            continue
+        name = field.alias or name
+        inner = _inner_model(field.annotation)
+        parts.append(f"{name}({_projection(inner)})" if inner is not None else name)
+    return ",".join(sorted(parts))
+
+
+def _is_local(field: Any) -> bool:
+    extra = field.json_schema_extra
+    return isinstance(extra, dict) and bool(extra.get("local"))
+
+
+def _unwrap_optional(annotation: Any) -> Any:
+    if get_origin(annotation) in (Union, types.UnionType):
+        args = [arg for arg in get_args(annotation) if arg is not type(None)]
+        if len(args) == 1:
+            return args[0]
+    return annotation
+
+
+def _inner_model(annotation: Any) -> Optional[type]:
+    """Model class behind Model, Optional[Model] or List[Model]"""
+    annotation = _unwrap_optional(annotation)
+    if get_origin(annotation) is list:
+        args = get_args(annotation)
+        annotation = args[0] if args else None
+    return annotation if _is_model(annotation) else None
+
+
+def _is_model(annotation: Any) -> bool:
+    return isinstance(annotation, type) and issubclass(annotation, BaseModel)
+
+
+def with_fields(
+    query_params: Optional[Dict[str, str]],
+    url: str,
+    model: Any,
+    fields: Optional[str] = None,
+) -> Optional[Dict[str, str]]:
+    """Add a `fields` query param unless the call or endpoint URL already has one.
+
+    fields=None derives the projection from model, fields="" asks for the full
+    default representation, any other value is sent as is.
+    Set api.fieldsProjection=false to switch derived projections off.
+    """
+    if "fields=" in url or (query_params and "fields" in query_params):
+        return query_params
+    if fields is None:
+        if str(Config.get("api.fieldsProjection", "true")).lower() != "true":
+            return query_params
+        fields = fields_projection(model)
+    if not fields:
+        return query_params
+    return {**(query_params or {}), "fields": fields}
@@ -0,0 +1,88 @@
+from typing import Optional, TypeVar
+
+from src.main.api.models.base_model import BaseModel
+from src.main.api.requests.skeleton.adapter_registry import (
+    AdapterRegistry,
+    construct_response,
+    validate_response,
+)
+from src.main.api.requests.skeleton.fields_projection import with_fields
+from src.main.api.requests.skeleton.http_request import HttpRequest
+from src.main.api.requests.skeleton.requesters.async_crud_requester import (
+    AsyncCrudRequester,
+)
+
+T = TypeVar("T", bound=BaseModel)
+
+
+class AsyncValidatedCrudRequester(HttpRequest):
+    def __init__(
+        self, request_spec, endpoint, response_spec, trusted: bool = False, **kwargs
+    ):
+        super().__init__(request_spec, endpoint, response_spec)
+        self.crud_requester = AsyncCrudRequester(
+            request_spec=request_spec, endpoint=endpoint, response_spec=response_spec
+        )
+        endpoint_config = (
+            self.endpoint.value if hasattr(self.endpoint, "value") else self.endpoint
+        )
+        self._response_model = endpoint_config.response_model
+        self._endpoint_url = endpoint_config.url
+        self._adapter = AdapterRegistry.get(self._response_model)
+        # trusted=True skips field validation (e.g. id lookups, cleanup, polling)
+        self._trusted = trusted and hasattr(self._response_model, "construct_trusted")
+
+    def _parse(self, response):
+        if self._trusted:
+            return construct_response(self._response_model, response)
+        return validate_response(self._adapter, response)
+
+    async def post(self, model: Optional[T] = None, path_params: Optional[dict] = None):
+        response = await self.crud_requester.post(model, path_params=path_params)
+        if self._adapter is None:
+            return response
+        return self._parse(response)
+
+    async def get(
+        self,
+        id: Optional[int | str] = None,
+        path_params: Optional[dict] = None,
+        query_params: Optional[dict] = None,
+        fields: Optional[str] = None,
+    ):
+        """GET and parse; fields overrides the projection derived from the model"""
+        query_params = with_fields(
+            query_params, self._endpoint_url, self._response_model, fields
+        )
+        response = await self.crud_requester.get(
+            id=id, path_params=path_params, query_params=query_params
+        )
+        if self._adapter is None:
+            return response
+        return self._parse(response)
+
+    async def delete(self, id: int | str, path_params: Optional[dict] = None):
+        return await self.crud_requester.delete(id, path_params=path_params)
+
+    async def update(self, model=None, path_params=None, data=None, content_type=None):
+        """Alias so callers can use .update(model, path_params=...) or .put()"""
+        actual_data = model if data is None else data
+        return await self.put(
+            path_params=path_params, data=actual_data, content_type=content_type
+        )
+
+    async def put(
+        self,
+        path_params: Optional[dict] = None,
+        data: Optional[object] = None,
+        content_type: Optional[str] = None,
+    ):
+        response = await self.crud_requester.update(
+            path_params=path_params, data=data, content_type=content_type
+        )
+        if self._adapter is None:
+            return response
+        # Handle empty response bodies
+        if not response.text or response.text.strip() == "":
+            return None
+        return self._parse(response)
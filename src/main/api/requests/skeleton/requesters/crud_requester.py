@@ -1,4 +1,5 @@
-from typing import Any, Dict, Optional, TypeVar
+import json
+from typing import Any, Dict, Optional, Tuple, TypeVar
 from urllib.parse import urlencode
 
 import requests
@@ -9,9 +10,13 @@ from src.main.api.requests.skeleton.http_request import HttpRequest
 from src.main.api.requests.skeleton.interfaces.crud_end_interface import (
     CrudEndpointInterface,
 )
+from src.main.api.requests.skeleton.session_pool import SessionPool
 
 T = TypeVar("T", bound=BaseModel)
 
+# Keep TeamCity locators and fields= projections readable: "build(id,state)"
+QUERY_SAFE = ",():"
+
 
 class CrudRequester(HttpRequest, CrudEndpointInterface):
     def _endpoint_config(self):
@@ -21,6 +26,10 @@ class CrudRequester(HttpRequest, CrudEndpointInterface):
     def base_url(self) -> str:
         return f"{Config.get('server')}{Config.get('apiVersion')}"
 
+    @property
+    def session(self) -> requests.Session:
+        return SessionPool.get(self.base_url, self.request_spec)
+
     def _build_url(
         self,
         path_params: Optional[Dict[str, Any]] = None,
@@ -32,14 +41,62 @@ class CrudRequester(HttpRequest, CrudEndpointInterface):
             for key, value in path_params.items():
                 url = url.replace(f"{{{key}}}", str(value))
         if query_params:
-            url += "?" + urlencode(query_params)
+            url += ("&" if "?" in url else "?") + urlencode(
+                query_params, safe=QUERY_SAFE
+            )
         return url
 
+    def _resolve_url(
+        self,
+        id: Optional[int | str] = None,
+        path_params: Optional[Dict[str, Any]] = None,
+        query_params: Optional[Dict[str, str]] = None,
+    ) -> str:
+        if path_params is not None:
+            return self._build_url(path_params=path_params, query_params=query_params)
+        endpoint_config = self._endpoint_config()
+        url = f"{self.base_url}{endpoint_config.url}"
+        if id is not None:
+            url += f"/id:{id}"
+        if query_params:
+            url += ("&" if "?" in url else "?") + urlencode(
+                query_params, safe=QUERY_SAFE
+            )
+        return url
+
+    def _update_request(
+        self, data: Optional[Any] = None, content_type: Optional[str] = None
+    ) -> Tuple[Dict[str, str], Dict[str, Any]]:
+        """Headers and body kwargs ("json" or "data") for a PUT request"""
+        headers = {**self.request_spec}
+        if content_type:
+            headers["Content-Type"] = content_type
+            headers["Accept"] = content_type
+        else:
+            headers["Content-Type"] = "text/plain"
+            headers["Accept"] = "text/plain"
+
+        # Handle different data types
+        if data is None:
+            return headers, {"data": ""}
+        if content_type == "application/json":
+            # For JSON, check for model_dump first (pydantic models)
+            if isinstance(data, BaseModel):
+                return headers, {"json": data.model_dump()}
+            if isinstance(data, dict):
+                return headers, {"json": data}
+            # Last resort - try to convert to string and parse
+            return headers, {
+                "json": json.loads(data if isinstance(data, str) else str(data))
+            }
+        # For text/plain, expect string data
+        return headers, {"data": data if isinstance(data, str) else str(data)}
+
     def post(
         self, model: Optional[T] = None, path_params: Optional[Dict[str, Any]] = None
     ) -> requests.Response:
         body = model.model_dump() if model is not None else ""
-        response = requests.post(
+        response = self.session.post(
             url=self._build_url(path_params=path_params),
             headers=self.request_spec,
             json=body,
@@ -54,7 +111,7 @@ class CrudRequester(HttpRequest, CrudEndpointInterface):
         # Merge custom headers with auth headers
         merged_headers = {**self.request_spec, **headers}
 
-        response = requests.post(
+        response = self.session.post(
             url=f"{self.base_url}{endpoint_config.url}",
             headers=merged_headers,
             data=body,
@@ -68,16 +125,10 @@ class CrudRequester(HttpRequest, CrudEndpointInterface):
         path_params: Optional[Dict[str, Any]] = None,
         query_params: Optional[Dict[str, str]] = None,
     ) -> requests.Response:
-        if path_params is not None:
-            url = self._build_url(path_params=path_params, query_params=query_params)
-        else:
-            endpoint_config = self._endpoint_config()
-            url = f"{self.base_url}{endpoint_config.url}"
-            if id is not None:
-                url += f"/id:{id}"
-            if query_params:
-                url += "?" + urlencode(query_params)
-        response = requests.get(url, headers=self.request_spec)
+        url = self._resolve_url(
+            id=id, path_params=path_params, query_params=query_params
+        )
+        response = self.session.get(url, headers=self.request_spec)
         self.response_spec(response)
         return response
 
@@ -89,39 +140,8 @@ class CrudRequester(HttpRequest, CrudEndpointInterface):
         content_type: Optional[str] = None,
     ) -> requests.Response:
         url = self._build_url(path_params=path_params)
-        headers = {**self.request_spec}
-        if content_type:
-            headers["Content-Type"] = content_type
-            headers["Accept"] = content_type
-        else:
-            headers["Content-Type"] = "text/plain"
-            headers["Accept"] = "text/plain"
-
-        # Handle different data types
-        if data is None:
-            response = requests.put(url, headers=headers, data="")
-        elif content_type == "application/json":
-            # For JSON, check for model_dump first (pydantic models)
-            if isinstance(data, BaseModel):
-                response = requests.put(url, headers=headers, json=data.model_dump())
-            elif isinstance(data, dict):
-                response = requests.put(url, headers=headers, json=data)
-            elif isinstance(data, str):
-                import json
-
-                response = requests.put(url, headers=headers, json=json.loads(data))
-            else:
-                import json
-
-                # Last resort - try to convert to string and parse
-                response = requests.put(
-                    url, headers=headers, json=json.loads(str(data))
-                )
-        else:
-            # For text/plain, expect string data
-            body = data if isinstance(data, str) else str(data)
-            response = requests.put(url, headers=headers, data=body)
-
+        headers, body = self._update_request(data, content_type)
+        response = self.session.put(url, headers=headers, **body)
         self.response_spec(response)
         return response
 
@@ -142,17 +162,9 @@ class CrudRequester(HttpRequest, CrudEndpointInterface):
         path_params: Optional[Dict[str, Any]] = None,
         query_params: Optional[Dict[str, str]] = None,
     ) -> requests.Response:
-
-        if path_params is not None:
-            url = self._build_url(path_params=path_params, query_params=query_params)
-        else:
-            url = f"{self.base_url}{self.endpoint.value.url}"
-            if id is not None:
-                url += f"/id:{id}"
-            if query_params:
-                url += "?" + urlencode(query_params)
-
-        response = requests.delete(url=url, headers=self.request_spec)
-
+        url = self._resolve_url(
+            id=id, path_params=path_params, query_params=query_params
+        )
+        response = self.session.delete(url=url, headers=self.request_spec)
         self.response_spec(response)
         return response
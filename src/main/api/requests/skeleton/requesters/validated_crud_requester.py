@@ -1,16 +1,26 @@
 from typing import Optional, TypeVar, Union
 
-from pydantic import TypeAdapter
-
+from src.main.api.configs.config import Config
 from src.main.api.models.base_model import BaseModel
+from src.main.api.requests.skeleton.adapter_registry import (
+    AdapterRegistry,
+    construct_response,
+    validate_response,
+)
+from src.main.api.requests.skeleton.fields_projection import with_fields
 from src.main.api.requests.skeleton.http_request import HttpRequest
 from src.main.api.requests.skeleton.requesters.crud_requester import CrudRequester
 
 T = TypeVar("T", bound=BaseModel)
 
+if str(Config.get("validation.warmUp", "false")).lower() == "true":
+    AdapterRegistry.warm_up()
+
 
 class ValidatedCrudRequester(HttpRequest):
-    def __init__(self, request_spec, endpoint, response_spec, **kwargs):
+    def __init__(
+        self, request_spec, endpoint, response_spec, trusted: bool = False, **kwargs
+    ):
         super().__init__(request_spec, endpoint, response_spec)
         self.crud_requester = CrudRequester(
             request_spec=request_spec, endpoint=endpoint, response_spec=response_spec
@@ -18,30 +28,40 @@ class ValidatedCrudRequester(HttpRequest):
         endpoint_config = (
             self.endpoint.value if hasattr(self.endpoint, "value") else self.endpoint
         )
-        self._adapter = (
-            TypeAdapter(endpoint_config.response_model)
-            if endpoint_config.response_model is not None
-            else None
-        )
+        self._response_model = endpoint_config.response_model
+        self._endpoint_url = endpoint_config.url
+        self._adapter = AdapterRegistry.get(self._response_model)
+        # trusted=True skips field validation (e.g. id lookups, cleanup, polling)
+        self._trusted = trusted and hasattr(self._response_model, "construct_trusted")
+
+    def _parse(self, response):
+        if self._trusted:
+            return construct_response(self._response_model, response)
+        return validate_response(self._adapter, response)
 
     def post(self, model: Optional[T] = None, path_params: Optional[dict] = None):
         response = self.crud_requester.post(model, path_params=path_params)
         if self._adapter is None:
             return response
-        return self._adapter.validate_python(response.json())
+        return self._parse(response)
 
     def get(
         self,
         id: Optional[int | str] = None,
         path_params: Optional[dict] = None,
         query_params: Optional[dict] = None,
+        fields: Optional[str] = None,
     ):
+        """GET and parse; fields overrides the projection derived from the model"""
+        query_params = with_fields(
+            query_params, self._endpoint_url, self._response_model, fields
+        )
         response = self.crud_requester.get(
             id=id, path_params=path_params, query_params=query_params
         )
         if self._adapter is None:
             return response
-        return self._adapter.validate_python(response.json())
+        return self._parse(response)
 
     def get_text(
         self,
@@ -80,4 +100,4 @@ class ValidatedCrudRequester(HttpRequest):
         # Handle empty response bodies
         if not response.text or response.text.strip() == "":
             return None
-        return self._adapter.validate_python(response.json())
+        return self._parse(response)
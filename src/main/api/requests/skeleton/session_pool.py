@@ -0,0 +1,84 @@
+import logging
+import threading
+from http.cookiejar import DefaultCookiePolicy
+from typing import Dict, Optional, Tuple
+from urllib.parse import urlsplit
+
+import requests
+from requests.adapters import HTTPAdapter
+
+from src.main.api.configs.config import Config
+
+
+class _RejectAllCookies(DefaultCookiePolicy):
+    """Keep pooled sessions stateless: auth always comes from the request spec."""
+
+    def set_ok(self, cookie, request) -> bool:
+        return False
+
+
+class SessionPool:
+    """Shared keep-alive HTTP sessions keyed by server origin and auth header.
+
+    Pool settings come from config.properties (or TC_HTTP_* env vars):
+    - http.poolSize  -> max pooled connections per host (default 20)
+    - http.keepAlive -> reuse TCP connections between calls (default true)
+    """
+
+    DEFAULT_POOL_SIZE = 20
+
+    _sessions: Dict[Tuple[str, str], requests.Session] = {}
+    _lock = threading.Lock()
+
+    @staticmethod
+    def _origin(base_url: str) -> str:
+        parts = urlsplit(base_url)
+        return f"{parts.scheme}://{parts.netloc}"
+
+    @classmethod
+    def _key(
+        cls, base_url: str, request_spec: Optional[Dict[str, str]]
+    ) -> Tuple[str, str]:
+        auth = (request_spec or {}).get("Authorization", "")
+        return cls._origin(base_url), auth
+
+    @classmethod
+    def _create_session(cls) -> requests.Session:
+        pool_size = int(Config.get("http.poolSize", cls.DEFAULT_POOL_SIZE))
+        keep_alive = str(Config.get("http.keepAlive", "true")).lower() == "true"
+
+        session = requests.Session()
+        session.cookies.set_policy(_RejectAllCookies())
+        adapter = HTTPAdapter(pool_connections=pool_size, pool_maxsize=pool_size)
+        session.mount("http://", adapter)
+        session.mount("https://", adapter)
+        if not keep_alive:
+            session.headers["Connection"] = "close"
+        return session
+
+    @classmethod
+    def get(
+        cls, base_url: str, request_spec: Optional[Dict[str, str]] = None
+    ) -> requests.Session:
+        """Return the pooled session for base_url + auth spec, creating it once."""
+        key = cls._key(base_url, request_spec)
+        session = cls._sessions.get(key)
+        if session is not None:
+            return session
+        with cls._lock:
+            session = cls._sessions.get(key)
+            if session is None:
+                session = cls._create_session()
+                cls._sessions[key] = session
+                logging.debug(f"Opened pooled HTTP session for {key[0]}")
+            return session
+
+    @classmethod
+    def close_all(cls) -> None:
+        with cls._lock:
+            sessions = list(cls._sessions.values())
+            cls._sessions.clear()
+        for session in sessions:
+            session.close()
+        if sessions:
+            logging.info(f"Closed {len(sessions)} pooled HTTP session(s)")
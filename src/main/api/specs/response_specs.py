@@ -45,6 +45,15 @@ class ResponseSpecs:
 
         return check
 
+    @staticmethod
+    def any_status() -> Callable[[Response], None]:
+        """Без проверки статуса: ответ разбирает вызывающий код."""
+
+        def check(response: Response):
+            pass
+
+        return check
+
     @staticmethod
     def request_returns_ok() -> Callable[[Response], None]:
         return ResponseSpecs._make_status_checker([HTTPStatus.OK])
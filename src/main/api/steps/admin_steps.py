@@ -1,11 +1,12 @@
+import asyncio
 import logging
-from typing import List, Optional
+from typing import List, Literal, Optional, Union, overload
 
-import requests
 from playwright.sync_api import Page
 
 from src.main.api.configs.config import Config
 from src.main.api.models.alert_messages import AlertMessages
+from src.main.api.models.base_model import LazyModelList
 from src.main.api.models.build_steps_response import BuildStepsListResponse
 from src.main.api.models.create_build_step_request import CreateBuildStepRequest
 from src.main.api.models.create_build_step_response import CreateBuildStepResponse
@@ -15,11 +16,16 @@ from src.main.api.models.create_project_request import CreateProjectRequest
 from src.main.api.models.create_project_response import CreateProjectResponse
 from src.main.api.models.create_user_request import CreateUserRequest
 from src.main.api.models.create_user_response import CreateUserResponse
+from src.main.api.requests.skeleton.async_session_pool import AsyncSessionPool
 from src.main.api.requests.skeleton.endpoint import Endpoint
+from src.main.api.requests.skeleton.requesters.async_validated_crud_requester import (
+    AsyncValidatedCrudRequester,
+)
 from src.main.api.requests.skeleton.requesters.crud_requester import CrudRequester
 from src.main.api.requests.skeleton.requesters.validated_crud_requester import (
     ValidatedCrudRequester,
 )
+from src.main.api.requests.skeleton.session_pool import SessionPool
 from src.main.api.specs.request_specs import RequestSpecs
 from src.main.api.specs.response_specs import ResponseSpecs
 from src.main.api.steps.base_steps import BaseSteps
@@ -27,14 +33,9 @@ from src.main.api.utils.retry import RetryUtils
 
 
 class AdminSteps(BaseSteps):
-    def create_user(self, user_request: CreateUserRequest) -> CreateUserResponse:
-        """Создание пользователя через админа"""
-        user = ValidatedCrudRequester(
-            RequestSpecs.admin_auth_spec(),
-            Endpoint.ADMIN_CREATE_USER,
-            ResponseSpecs.entity_was_created(),
-        ).post(user_request)
-
+    def _register_user(
+        self, user: CreateUserResponse, user_request: CreateUserRequest
+    ) -> CreateUserResponse:
         user.password = user_request.password
         # Assertions
         assert (
@@ -46,6 +47,26 @@ class AdminSteps(BaseSteps):
         logging.info(f"User created: {user.username}, ID: {user.id}")
         return user
 
+    def create_user(self, user_request: CreateUserRequest) -> CreateUserResponse:
+        """Создание пользователя через админа"""
+        user = ValidatedCrudRequester(
+            RequestSpecs.admin_auth_spec(),
+            Endpoint.ADMIN_CREATE_USER,
+            ResponseSpecs.entity_was_created(),
+        ).post(user_request)
+        return self._register_user(user, user_request)
+
+    async def create_user_async(
+        self, user_request: CreateUserRequest
+    ) -> CreateUserResponse:
+        """Асинхронное создание пользователя через админа"""
+        user = await AsyncValidatedCrudRequester(
+            RequestSpecs.admin_auth_spec(),
+            Endpoint.ADMIN_CREATE_USER,
+            ResponseSpecs.entity_was_created(),
+        ).post(user_request)
+        return self._register_user(user, user_request)
+
     @staticmethod
     def create_invalid_user(
         user_request: CreateUserRequest,
@@ -73,13 +94,24 @@ class AdminSteps(BaseSteps):
             ResponseSpecs.entity_was_deleted(),
         ).delete(id)
 
+    @overload
+    @staticmethod
+    def get_all_users(trusted: Literal[False] = False) -> List[CreateUserResponse]: ...
+
+    @overload
+    @staticmethod
+    def get_all_users(trusted: Literal[True]) -> LazyModelList[CreateUserResponse]: ...
+
     @staticmethod
-    def get_all_users() -> List[CreateUserResponse]:
-        """Получение всех Юзеров"""
+    def get_all_users(
+        trusted: bool = False,
+    ) -> Union[List[CreateUserResponse], LazyModelList[CreateUserResponse]]:
+        """Получение всех Юзеров (trusted=True - без валидации полей)"""
         users_list_response = ValidatedCrudRequester(
             RequestSpecs.admin_auth_spec(),
             Endpoint.ADMIN_GET_ALL_USERS,
             ResponseSpecs.request_returns_ok(),
+            trusted=trusted,
         ).get()
         users = users_list_response.user
         assert len(users) > 0, "users list should not be empty"
@@ -87,16 +119,11 @@ class AdminSteps(BaseSteps):
         logging.info(f"Retrieved {len(users)} users")
         return users
 
-    def create_project(
-        self, project_request: CreateProjectRequest
+    def _register_project(
+        self,
+        create_project_response: CreateProjectResponse,
+        project_request: CreateProjectRequest,
     ) -> CreateProjectResponse:
-        """Создание проекта через админа"""
-        create_project_response = ValidatedCrudRequester(
-            RequestSpecs.admin_auth_spec(),
-            Endpoint.ADMIN_CREATE_PROJECT,
-            ResponseSpecs.entity_was_created(),
-        ).post(project_request)
-
         project_id_response = create_project_response.id
 
         # Assertions
@@ -112,13 +139,62 @@ class AdminSteps(BaseSteps):
         )
         return create_project_response
 
+    def create_project(
+        self, project_request: CreateProjectRequest
+    ) -> CreateProjectResponse:
+        """Создание проекта через админа"""
+        create_project_response = ValidatedCrudRequester(
+            RequestSpecs.admin_auth_spec(),
+            Endpoint.ADMIN_CREATE_PROJECT,
+            ResponseSpecs.entity_was_created(),
+        ).post(project_request)
+        return self._register_project(create_project_response, project_request)
+
+    async def create_project_async(
+        self, project_request: CreateProjectRequest
+    ) -> CreateProjectResponse:
+        """Асинхронное создание проекта через админа"""
+        create_project_response = await AsyncValidatedCrudRequester(
+            RequestSpecs.admin_auth_spec(),
+            Endpoint.ADMIN_CREATE_PROJECT,
+            ResponseSpecs.entity_was_created(),
+        ).post(project_request)
+        return self._register_project(create_project_response, project_request)
+
+    def create_projects(
+        self, project_requests: List[CreateProjectRequest]
+    ) -> List[CreateProjectResponse]:
+        """Параллельное создание нескольких проектов"""
+
+        async def _create_all():
+            return await asyncio.gather(
+                *(self.create_project_async(request) for request in project_requests)
+            )
+
+        return list(AsyncSessionPool.run(_create_all()))
+
+    @overload
+    @staticmethod
+    def get_all_projects(
+        trusted: Literal[False] = False,
+    ) -> List[CreateProjectResponse]: ...
+
+    @overload
+    @staticmethod
+    def get_all_projects(
+        trusted: Literal[True],
+    ) -> LazyModelList[CreateProjectResponse]: ...
+
     @staticmethod
-    def get_all_projects() -> List[CreateProjectResponse]:
-        """Получение всех проектов"""
+    def get_all_projects(
+        trusted: bool = False,
+    ) -> Union[List[CreateProjectResponse], LazyModelList[CreateProjectResponse]]:
+        """Получение всех проектов (trusted=True - без валидации полей)"""
         projects_list = ValidatedCrudRequester(
             RequestSpecs.admin_auth_spec(),
             Endpoint.ADMIN_GET_ALL_PROJECTS,
             ResponseSpecs.request_returns_ok(),
+            trusted=trusted,
         ).get()
 
         projects = projects_list.project
@@ -255,13 +331,28 @@ class AdminSteps(BaseSteps):
         )
         return steps
 
+    @overload
+    @staticmethod
+    def get_all_buildtypes(
+        trusted: Literal[False] = False,
+    ) -> List[CreateBuildTypeResponse]: ...
+
+    @overload
     @staticmethod
-    def get_all_buildtypes() -> List[CreateBuildTypeResponse]:
-        """Получение всех build types"""
+    def get_all_buildtypes(
+        trusted: Literal[True],
+    ) -> LazyModelList[CreateBuildTypeResponse]: ...
+
+    @staticmethod
+    def get_all_buildtypes(
+        trusted: bool = False,
+    ) -> Union[List[CreateBuildTypeResponse], LazyModelList[CreateBuildTypeResponse]]:
+        """Получение всех build types (trusted=True - без валидации полей)"""
         response = ValidatedCrudRequester(
             RequestSpecs.admin_auth_spec(),
             Endpoint.GET_ALL_BUILDTYPES,
             ResponseSpecs.request_returns_ok(),
+            trusted=trusted,
         ).get()
         build_types = response.buildType
         assert len(build_types) > 0, "build types list should not be empty"
@@ -354,6 +445,7 @@ class AdminSteps(BaseSteps):
         )
         return response
 
+    @staticmethod
     def create_simple_build_type(project_id: str, build_type_name: str) -> str:
         """
         Create a simple build type with a basic command line runner.
@@ -397,7 +489,9 @@ class AdminSteps(BaseSteps):
             "Accept": "application/json",
         }
 
-        response = requests.post(url, headers=headers, json=build_type_data)
+        response = SessionPool.get(url, headers).post(
+            url, headers=headers, json=build_type_data
+        )
         ResponseSpecs.request_returns_ok()(response)
 
         # Extract the build type ID from the response
@@ -407,6 +501,75 @@ class AdminSteps(BaseSteps):
         logging.info(f"Created build type: {build_type_id}")
         return build_type_id
 
+    @staticmethod
+    def create_custom_build_type(
+        project_id: str,
+        build_type_name: str,
+        script_content: str,
+        artifact_rules: Optional[str] = None,
+    ) -> str:
+        """
+        Create a build type with a single command line step running script_content.
+
+        Args:
+            project_id: ID of the project to create the build type in
+            build_type_name: Name for the build type
+            script_content: Shell script of the step
+            artifact_rules: Optional artifact rules, e.g. "out/*.txt"
+
+        Returns:
+            str: Build type ID
+        """
+        build_type_data = {
+            "name": build_type_name,
+            "project": {"id": project_id},
+            "steps": {
+                "step": [
+                    {
+                        "name": "Custom Step",
+                        "type": "simpleRunner",
+                        "properties": {
+                            "property": [
+                                {"name": "script.content", "value": script_content},
+                                {"name": "teamcity.step.mode", "value": "default"},
+                                {"name": "use.custom.script", "value": "true"},
+                            ]
+                        },
+                    }
+                ]
+            },
+        }
+        url = f"{Config.get('server')}{Config.get('apiVersion')}/buildTypes"
+        headers = {
+            **RequestSpecs.admin_auth_spec(),
+            "Content-Type": "application/json",
+            "Accept": "application/json",
+        }
+        response = SessionPool.get(url, headers).post(
+            url, headers=headers, json=build_type_data, timeout=30
+        )
+        ResponseSpecs.entity_was_created()(response)
+        build_type_id = response.json().get("id")
+
+        # TeamCity may ignore artifactRules in create payload; set it explicitly.
+        if artifact_rules:
+            artifact_url = f"{url}/id:{build_type_id}/settings/artifactRules"
+            artifact_headers = {
+                **RequestSpecs.admin_auth_spec(),
+                "Content-Type": "text/plain",
+                "Accept": "*/*",
+            }
+            artifact_response = SessionPool.get(artifact_url, artifact_headers).put(
+                artifact_url,
+                headers=artifact_headers,
+                data=artifact_rules,
+                timeout=30,
+            )
+            ResponseSpecs.request_returns_ok()(artifact_response)
+
+        logging.info(f"Created build type: {build_type_id}")
+        return build_type_id
+
     @staticmethod
     def delete_build_type(build_type_id: str):
         """
@@ -419,7 +582,7 @@ class AdminSteps(BaseSteps):
         url = f"{Config.get('server')}{Config.get('apiVersion')}/buildTypes/id:{build_type_id}"
         headers = RequestSpecs.admin_auth_spec()
 
-        response = requests.delete(url, headers=headers)
+        response = SessionPool.get(url, headers).delete(url, headers=headers)
         ResponseSpecs.entity_was_deleted()(response)
 
         logging.info(f"Deleted build type: {build_type_id}")
@@ -434,27 +597,28 @@ class AdminSteps(BaseSteps):
         """Ожидает появления проекта в списке проектов"""
 
         def action():
-            projects = self.get_all_projects()
+            # trusted: ищем только по id, модели не строятся для всего списка
+            projects = self.get_all_projects(trusted=True)
             logging.info(
                 f"Attempt: looking for project_id='{project_id}', "
-                f"found projects: {[p.id for p in projects]}"
+                f"found projects: {projects.values('id')}"
             )
             return projects
 
         projects = RetryUtils.retry(
             title=f"Wait for project '{project_id}' to appear in API",
             action=action,
-            condition=lambda pl: project_id in [p.id for p in pl],
+            condition=lambda pl: project_id in pl.values("id"),
             max_attempts=max_attempts,
             delay_seconds=delay_seconds,
             page=page,
         )
 
         # Найти и вернуть конкретный проект
-        for project in projects:
-            if project.id == project_id:
-                logging.info(f"Project '{project_id}' found successfully")
-                return project
+        project = projects.find(id=project_id)
+        if project is not None:
+            logging.info(f"Project '{project_id}' found successfully")
+            return project
 
         raise ValueError(f"Project '{project_id}' not found in projects list")
 
@@ -473,9 +637,10 @@ class AdminSteps(BaseSteps):
                 "locator": f"username:{username}",
                 "fields": "user(username,id,href,name)",
             }
-            response = requests.get(
+            headers = RequestSpecs.admin_auth_spec()
+            response = SessionPool.get(url, headers).get(
                 url=url,
-                headers=RequestSpecs.admin_auth_spec(),
+                headers=headers,
                 params=params,
                 timeout=10,
             )
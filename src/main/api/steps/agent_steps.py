@@ -57,6 +57,38 @@ class AgentSteps(BaseSteps):
         ).update(path_params={"id": agent_id}, data="true" if authorized else "false")
         logging.info(f"Agent id:{agent_id} authorized={authorized}")
 
+    def authorize_all_agents(self) -> List[int]:
+        """Authorize every connected agent that is not authorized yet"""
+        agents = self.get_all_agents("connected:true,authorized:false").agent
+        for agent in agents:
+            self.authorize_agent(agent.id)
+        return [agent.id for agent in agents]
+
+    def enable_all_agents(self) -> List[int]:
+        """Enable every authorized agent that is disabled"""
+        agents = self.get_all_agents("authorized:true,enabled:false").agent
+        for agent in agents:
+            self.enable_agent(agent.id)
+        return [agent.id for agent in agents]
+
+    def get_idle_agent_count(self) -> int:
+        """Connected, authorized and enabled agents not running a build right now"""
+        agents = ValidatedCrudRequester(
+            RequestSpecs.admin_auth_spec(),
+            Endpoint.AGENTS_LIST,
+            ResponseSpecs.request_returns_ok(),
+        ).get(
+            query_params={"locator": "connected:true,authorized:true,enabled:true"},
+            fields="count,agent(id,build(id))",
+        )
+        idle = sum(1 for agent in agents.agent if not agent.build)
+        logging.info(f"Idle agents: {idle}/{len(agents.agent)}")
+        return idle
+
+    def builds_to_saturate(self) -> int:
+        """Builds that occupy every idle agent and leave exactly one queued"""
+        return self.get_idle_agent_count() + 1
+
     def disable_agent(self, agent_id: int):
         """Disable agent"""
         original_state = self._get_agent_enabled_state(agent_id)
@@ -1,13 +1,31 @@
+import asyncio
 import logging
 import time
-from typing import List, Optional
+from pathlib import Path
+from typing import (
+    Callable,
+    Iterable,
+    Iterator,
+    List,
+    Literal,
+    Optional,
+    Union,
+    overload,
+)
 
+from src.main.api.configs.config import Config
+from src.main.api.models.artifact_response import ArtifactFile
+from src.main.api.models.base_model import LazyModelList
 from src.main.api.models.build_cancel_request import BuildCancelRequest
 from src.main.api.models.build_list_response import BuildListResponse
 from src.main.api.models.build_response import BuildResponse
 from src.main.api.models.build_status_response import BuildStatusResponse
 from src.main.api.models.start_build_request import BuildTypeRef, StartBuildRequest
+from src.main.api.requests.skeleton.async_session_pool import AsyncSessionPool
 from src.main.api.requests.skeleton.endpoint import Endpoint, EndpointConfig
+from src.main.api.requests.skeleton.requesters.async_validated_crud_requester import (
+    AsyncValidatedCrudRequester,
+)
 from src.main.api.requests.skeleton.requesters.crud_requester import CrudRequester
 from src.main.api.requests.skeleton.requesters.validated_crud_requester import (
     ValidatedCrudRequester,
@@ -15,26 +33,33 @@ from src.main.api.requests.skeleton.requesters.validated_crud_requester import (
 from src.main.api.specs.request_specs import RequestSpecs
 from src.main.api.specs.response_specs import ResponseSpecs
 from src.main.api.steps.base_steps import BaseSteps
+from src.main.api.utils.artifact_downloader import ArtifactDownloader, DownloadResult
+from src.main.api.utils.build_state_cache import (
+    BuildStateCache,
+    BuildStateCacheUnavailable,
+)
+from src.main.api.utils.poller import Poller
 
 
 class BuildSteps(BaseSteps):
-    POLL_INTERVAL = 0.5
     DEFAULT_TIMEOUT = 300
+    # Builds per /builds?locator=item:(...) request
+    BATCH_SIZE = 50
+    # Fields the shared BuildStateCache fetches for every cached build
+    WATCH_FIELDS = "id,buildTypeId,state,status,statusText"
 
-    def trigger_build(
-        self, build_type_id: str, properties: Optional[dict] = None
-    ) -> BuildResponse:
-        build_request = StartBuildRequest(
+    @staticmethod
+    def _start_build_request(
+        build_type_id: str, properties: Optional[dict] = None
+    ) -> StartBuildRequest:
+        return StartBuildRequest(
             buildType=BuildTypeRef(id=build_type_id),
             properties=properties,
         )
 
-        build_response = ValidatedCrudRequester(
-            RequestSpecs.admin_auth_spec(),
-            Endpoint.BUILD_QUEUE,
-            ResponseSpecs.entity_was_created(),
-        ).post(build_request)
-
+    def _register_triggered_build(
+        self, build_response: BuildResponse, build_type_id: str
+    ) -> BuildResponse:
         assert build_response.id > 0, "Build ID should be positive"
         assert (
             build_response.buildTypeId == build_type_id
@@ -48,53 +73,248 @@ class BuildSteps(BaseSteps):
         logging.info(f"Build triggered: ID {build_response.id}, Type: {build_type_id}")
         return build_response
 
+    def trigger_build(
+        self, build_type_id: str, properties: Optional[dict] = None
+    ) -> BuildResponse:
+        build_response = ValidatedCrudRequester(
+            RequestSpecs.admin_auth_spec(),
+            Endpoint.BUILD_QUEUE,
+            ResponseSpecs.entity_was_created(),
+        ).post(self._start_build_request(build_type_id, properties))
+        return self._register_triggered_build(build_response, build_type_id)
+
+    async def trigger_build_async(
+        self, build_type_id: str, properties: Optional[dict] = None
+    ) -> BuildResponse:
+        build_response = await AsyncValidatedCrudRequester(
+            RequestSpecs.admin_auth_spec(),
+            Endpoint.BUILD_QUEUE,
+            ResponseSpecs.entity_was_created(),
+        ).post(self._start_build_request(build_type_id, properties))
+        return self._register_triggered_build(build_response, build_type_id)
+
+    def trigger_builds(
+        self, build_type_id: str, count: int, properties: Optional[dict] = None
+    ) -> List[BuildResponse]:
+        """Trigger count builds of one build type concurrently"""
+
+        async def _trigger_all():
+            return await asyncio.gather(
+                *(
+                    self.trigger_build_async(build_type_id, properties)
+                    for _ in range(count)
+                )
+            )
+
+        return list(AsyncSessionPool.run(_trigger_all()))
+
+    @staticmethod
+    def _build_fields(fields: Optional[str] = None) -> Optional[str]:
+        """Explicit fields always keep id/buildTypeId/state; None -> model projection"""
+        if not fields:
+            return None
+        requested = {field.strip() for field in fields.split(",") if field.strip()}
+        return ",".join(sorted(requested | {"id", "buildTypeId", "state"}))
+
     def get_build_by_id(
         self, build_id: int, fields: Optional[str] = None
     ) -> BuildResponse:
-        # Build URL manually to avoid URL-encoding commas in fields parameter
-        url = f"{Endpoint.BUILDS.value.url}/id:{build_id}"
-        if fields:
-            # Merge and sort fields like the original _merge_required_fields did
-            requested = {field.strip() for field in fields.split(",") if field.strip()}
-            required = {"id", "buildTypeId", "state"}
-            merged = requested.union(required)
-            all_fields = ",".join(sorted(merged))
-            url += f"?fields={all_fields}"
-
-        endpoint_config = EndpointConfig(
-            url=url, response_model=BuildResponse, request_model=None
-        )
         build_response = ValidatedCrudRequester(
             RequestSpecs.admin_auth_spec(),
-            endpoint_config,
+            Endpoint.BUILDS,
             ResponseSpecs.request_returns_ok(),
-        ).get()
+        ).get(id=build_id, fields=self._build_fields(fields))
+
+        logging.info(f"Retrieved build: ID {build_id}, State: {build_response.state}")
+        return build_response
+
+    async def get_build_by_id_async(
+        self, build_id: int, fields: Optional[str] = None
+    ) -> BuildResponse:
+        build_response = await AsyncValidatedCrudRequester(
+            RequestSpecs.admin_auth_spec(),
+            Endpoint.BUILDS,
+            ResponseSpecs.request_returns_ok(),
+        ).get(id=build_id, fields=self._build_fields(fields))
 
         logging.info(f"Retrieved build: ID {build_id}, State: {build_response.state}")
         return build_response
 
-    def get_builds_by_buildtype(self, build_type_id: str) -> List[BuildResponse]:
+    def get_builds_concurrently(
+        self, build_ids: List[int], fields: Optional[str] = None
+    ) -> List[BuildResponse]:
+        """Fetch several builds in parallel, preserving the order of build_ids"""
+
+        async def _get_all():
+            return await asyncio.gather(
+                *(
+                    self.get_build_by_id_async(build_id, fields)
+                    for build_id in build_ids
+                )
+            )
+
+        return list(AsyncSessionPool.run(_get_all()))
+
+    @classmethod
+    def get_builds_by_ids(
+        cls, build_ids: Iterable[int], fields: Optional[str] = None
+    ) -> List[BuildResponse]:
+        """Fetch many builds with one /builds?locator=item:(id:..) call per chunk.
+
+        Queued, running and finished builds are all returned, in build_ids order;
+        ids the server no longer knows are left out.
+        """
+        build_ids = list(dict.fromkeys(build_ids))
+        build_fields = cls._build_fields(fields)
+        found = {}
+        for start in range(0, len(build_ids), cls.BATCH_SIZE):
+            chunk = build_ids[start : start + cls.BATCH_SIZE]
+            locator = ",".join(f"item:(id:{build_id})" for build_id in chunk)
+            builds_list = ValidatedCrudRequester(
+                RequestSpecs.admin_auth_spec(),
+                Endpoint.BUILDS_LIST,
+                ResponseSpecs.request_returns_ok(),
+            ).get(
+                query_params={"locator": locator},
+                fields=f"count,build({build_fields})" if build_fields else None,
+            )
+            found.update((build.id, build) for build in builds_list.build)
+
+        logging.info(f"Retrieved {len(found)}/{len(build_ids)} builds in one batch")
+        return [found[build_id] for build_id in build_ids if build_id in found]
+
+    def wait_for_builds(
+        self,
+        build_ids: Iterable[int],
+        predicate: Callable[[BuildResponse], bool],
+        timeout: int = DEFAULT_TIMEOUT,
+        fields: Optional[str] = None,
+    ) -> Iterator[BuildResponse]:
+        """Wait for a set of builds, yielding each as soon as predicate(build) holds.
+
+        Reads the shared BuildStateCache when enabled, otherwise (or once it gives
+        up) polls the pending builds with one batched request per tick.
+        Raises TimeoutError naming the builds that did not settle in time.
+        """
+        pending = set(build_ids)
+        deadline = time.monotonic() + timeout
+        cache = self._state_cache()
+        if cache is not None:
+            try:
+                for build in cache.wait_many(set(pending), predicate, timeout):
+                    pending.discard(build.id)
+                    yield build
+                return
+            except BuildStateCacheUnavailable:
+                logging.warning(
+                    "Build state cache unavailable, falling back to polling"
+                )
+
+        poller = Poller(max(0.0, deadline - time.monotonic()))
+        for _ in poller.ticks():
+            for build in self.get_builds_by_ids(sorted(pending), fields):
+                if predicate(build):
+                    pending.discard(build.id)
+                    poller.progress(done=not pending)
+                    yield build
+            if not pending:
+                logging.info(f"Builds settled: {poller.metrics}")
+                return
+        raise TimeoutError(
+            f"Builds {sorted(pending)} did not settle within {timeout} seconds "
+            f"({poller.metrics})"
+        )
+
+    @classmethod
+    def get_build_history(
+        cls, build_type_id: str, fields: Optional[str] = None
+    ) -> List[BuildResponse]:
+        """Every build of a build type: queued, running, finished and canceled"""
+        build_fields = cls._build_fields(fields)
+        builds_list = ValidatedCrudRequester(
+            RequestSpecs.admin_auth_spec(),
+            Endpoint.BUILDS_LIST,
+            ResponseSpecs.request_returns_ok(),
+        ).get(
+            query_params={
+                "locator": f"buildType:(id:{build_type_id}),defaultFilter:false,"
+                "state:any"
+            },
+            fields=f"count,build({build_fields})" if build_fields else None,
+        )
+        return list(builds_list.build)
+
+    @overload
+    def get_builds_by_buildtype(
+        self, build_type_id: str, trusted: Literal[False] = False
+    ) -> List[BuildResponse]: ...
+
+    @overload
+    def get_builds_by_buildtype(
+        self, build_type_id: str, trusted: Literal[True]
+    ) -> LazyModelList[BuildResponse]: ...
+
+    def get_builds_by_buildtype(
+        self, build_type_id: str, trusted: bool = False
+    ) -> Union[List[BuildResponse], LazyModelList[BuildResponse]]:
+        """All builds of a build type (trusted=True skips field validation)"""
         builds_list = ValidatedCrudRequester(
             RequestSpecs.admin_auth_spec(),
             Endpoint.BUILDS_LIST,
             ResponseSpecs.request_returns_ok(),
+            trusted=trusted,
         ).get(query_params={"locator": f"buildType:id:{build_type_id},state:any"})
 
         builds = builds_list.build
 
-        for build in builds:
+        if trusted:
+            # Check ownership on the raw fields so no BuildResponse is built
+            owners = zip(builds.values("id"), builds.values("buildTypeId"))
+        else:
+            owners = ((build.id, build.buildTypeId) for build in builds)
+        for build_id, owner in owners:
             assert (
-                build.buildTypeId == build_type_id
-            ), f"Build {build.id} belongs to {build.buildTypeId}, expected {build_type_id}"
+                owner == build_type_id
+            ), f"Build {build_id} belongs to {owner}, expected {build_type_id}"
 
         logging.info(f"Retrieved {len(builds)} builds for type {build_type_id}")
         return builds
 
-    def get_build_queue(self) -> List[BuildResponse]:
+    @staticmethod
+    def list_artifacts(
+        build_id: int, path: str = "", recursive: bool = True
+    ) -> List[ArtifactFile]:
+        """Artifact files of a build (the whole tree unless recursive=False)"""
+        return ArtifactDownloader(build_id).list(path, recursive)
+
+    @staticmethod
+    def download_artifacts(
+        build_id: int,
+        target_dir: Path,
+        artifacts: Optional[Iterable[ArtifactFile]] = None,
+    ) -> List[DownloadResult]:
+        """Download artifacts (all by default) with sizes checked; see ArtifactDownloader"""
+        return ArtifactDownloader(build_id).download_all(target_dir, artifacts)
+
+    @overload
+    def get_build_queue(
+        self, trusted: Literal[False] = False
+    ) -> List[BuildResponse]: ...
+
+    @overload
+    def get_build_queue(
+        self, trusted: Literal[True]
+    ) -> LazyModelList[BuildResponse]: ...
+
+    def get_build_queue(
+        self, trusted: bool = False
+    ) -> Union[List[BuildResponse], LazyModelList[BuildResponse]]:
+        """Current build queue (trusted=True skips field validation)"""
         queue_response = ValidatedCrudRequester(
             RequestSpecs.admin_auth_spec(),
             Endpoint.BUILD_QUEUE_LIST,
             ResponseSpecs.request_returns_ok(),
+            trusted=trusted,
         ).get()
 
         logging.info(f"Retrieved build queue: {len(queue_response.build)} builds")
@@ -134,75 +354,241 @@ class BuildSteps(BaseSteps):
         logging.info(f"Cancelled running build: ID {build_id}")
         return build_response
 
-    def wait_for_build_completion(
-        self, build_id: int, timeout: int = DEFAULT_TIMEOUT
-    ) -> BuildResponse:
-        elapsed = 0
-        while elapsed < timeout:
-            build = self.get_build_by_id(build_id, fields="id,buildTypeId,state,status")
+    @classmethod
+    def _state_cache(cls) -> Optional[BuildStateCache]:
+        """Shared build state cache, or None when disabled or unavailable"""
+        if not BuildStateCache.enabled():
+            return None
+        cache = BuildStateCache.shared(
+            fetch_queue=cls._queued_builds,
+            fetch_recent=cls._recent_builds,
+            fetch_ids=lambda build_ids: cls.get_builds_by_ids(
+                build_ids, cls.WATCH_FIELDS
+            ),
+        )
+        return cache if cache.available else None
+
+    @classmethod
+    def _queued_builds(cls) -> List[BuildResponse]:
+        return (
+            ValidatedCrudRequester(
+                RequestSpecs.admin_auth_spec(),
+                Endpoint.BUILD_QUEUE_LIST,
+                ResponseSpecs.request_returns_ok(),
+            )
+            .get(fields=f"count,build({cls.WATCH_FIELDS})")
+            .build
+        )
 
-            if build.state == "finished":
-                logging.info(f"Build {build_id} completed with status: {build.status}")
-                return build
+    @classmethod
+    def _recent_builds(cls) -> List[BuildResponse]:
+        """Running and most recently finished builds of any build type"""
+        count = Config.get("build.cacheRecent", BuildStateCache.DEFAULT_RECENT)
+        return (
+            ValidatedCrudRequester(
+                RequestSpecs.admin_auth_spec(),
+                Endpoint.BUILDS_LIST,
+                ResponseSpecs.request_returns_ok(),
+            )
+            .get(
+                query_params={"locator": f"defaultFilter:false,count:{count}"},
+                fields=f"count,build({cls.WATCH_FIELDS})",
+            )
+            .build
+        )
 
-            assert build.state in [
-                "queued",
-                "running",
-            ], f"Unexpected build state: {build.state}"
+    @staticmethod
+    def _settled(build: BuildResponse) -> bool:
+        """Finished, or in a state that will never finish (early exit)"""
+        return build.state not in ("queued", "running")
 
-            time.sleep(self.POLL_INTERVAL)
-            elapsed += self.POLL_INTERVAL
+    @staticmethod
+    def _finished(build: BuildResponse) -> bool:
+        return build.state == "finished"
 
-        raise TimeoutError(
-            f"Build {build_id} did not complete within {timeout} seconds"
+    @staticmethod
+    def _not_pending(build: BuildResponse) -> bool:
+        """Early exit: anything but queued/running will never finish"""
+        return build.state not in ("queued", "running", "finished")
+
+    def _completed(self, build_id: int, build: BuildResponse, metrics) -> BuildResponse:
+        assert build.state == "finished", f"Unexpected build state: {build.state}"
+        logging.info(
+            f"Build {build_id} completed with status: {build.status} ({metrics})"
         )
+        return build
+
+    def wait_for_build_completion(
+        self, build_id: int, timeout: int = DEFAULT_TIMEOUT
+    ) -> BuildResponse:
+        cache = self._state_cache()
+        if cache is not None:
+            start = time.monotonic()
+            try:
+                build = cache.wait(build_id, self._settled, timeout)
+                elapsed = time.monotonic() - start
+                return self._completed(build_id, build, f"cached, {elapsed:.2f}s")
+            except TimeoutError:
+                raise TimeoutError(
+                    f"Build {build_id} did not complete within {timeout} seconds"
+                )
+            except BuildStateCacheUnavailable:
+                logging.warning(
+                    "Build state cache unavailable, falling back to polling"
+                )
+                timeout = max(1, int(timeout - (time.monotonic() - start)))
+
+        poller = Poller(timeout)
+        try:
+            build = poller.poll(
+                lambda: self.get_build_by_id(
+                    build_id, fields="id,buildTypeId,state,status"
+                ),
+                until=self._finished,
+                stop_when=self._not_pending,
+                description=f"Build {build_id} completion",
+            )
+        except TimeoutError:
+            raise TimeoutError(
+                f"Build {build_id} did not complete within {timeout} seconds "
+                f"({poller.metrics})"
+            )
+        return self._completed(build_id, build, poller.metrics)
+
+    async def wait_for_build_completion_async(
+        self, build_id: int, timeout: int = DEFAULT_TIMEOUT
+    ) -> BuildResponse:
+        if self._state_cache() is not None:
+            # Blocks on the shared cache in a worker thread, no requests of its own
+            return await asyncio.to_thread(
+                self.wait_for_build_completion, build_id, timeout
+            )
+
+        poller = Poller(timeout)
+        try:
+            build = await poller.poll_async(
+                lambda: self.get_build_by_id_async(
+                    build_id, fields="id,buildTypeId,state,status"
+                ),
+                until=self._finished,
+                stop_when=self._not_pending,
+                description=f"Build {build_id} completion",
+            )
+        except TimeoutError:
+            raise TimeoutError(
+                f"Build {build_id} did not complete within {timeout} seconds "
+                f"({poller.metrics})"
+            )
+        return self._completed(build_id, build, poller.metrics)
+
+    def wait_for_builds_completion(
+        self, build_ids: List[int], timeout: int = DEFAULT_TIMEOUT
+    ) -> List[BuildResponse]:
+        """Wait for several builds at once, preserving the order of build_ids"""
+        start = time.monotonic()
+        settled = {
+            build.id: build
+            for build in self.wait_for_builds(
+                build_ids, self._settled, timeout, fields="id,buildTypeId,state,status"
+            )
+        }
+        elapsed = f"all settled in {time.monotonic() - start:.2f}s"
+        return [
+            self._completed(build_id, settled[build_id], elapsed)
+            for build_id in build_ids
+        ]
 
     def get_build_status(self, build_id: int) -> BuildStatusResponse:
-        # Build URL manually to avoid URL-encoding commas in fields parameter
-        url = f"{Endpoint.BUILDS.value.url}/id:{build_id}?fields=status,statusText"
+        # fields=status,statusText is derived from BuildStatusResponse
         endpoint_config = EndpointConfig(
-            url=url, response_model=BuildStatusResponse, request_model=None
+            url=Endpoint.BUILDS.value.url,
+            response_model=BuildStatusResponse,
+            request_model=None,
         )
 
         status_response = ValidatedCrudRequester(
             RequestSpecs.admin_auth_spec(),
             endpoint_config,
             ResponseSpecs.request_returns_ok(),
-        ).get()
+        ).get(id=build_id)
 
         logging.info(f"Build {build_id} status: {status_response.status}")
         return status_response
 
+    def latest_build_id(
+        self, build_type_id: str, after_build_id: Optional[int] = None
+    ) -> Optional[int]:
+        """Newest build of the type on the server (queued first), above after_build_id"""
+        floor = after_build_id if after_build_id is not None else 0
+        # Only ids are needed here, so both lists are parsed in trusted mode.
+        queue = self.get_build_queue(trusted=True)
+        queued = [b.id for b in queue.filter(buildTypeId=build_type_id) if b.id > floor]
+        if queued:
+            return max(queued)
+        recent = self.get_builds_by_buildtype(build_type_id, trusted=True)
+        return max((i for i in recent.values("id") if i > floor), default=None)
+
     def get_latest_build_and_wait(
-        self, build_type_id: str, timeout: int = DEFAULT_TIMEOUT
+        self,
+        build_type_id: str,
+        timeout: int = DEFAULT_TIMEOUT,
+        after_build_id: Optional[int] = None,
     ) -> BuildResponse:
         """
         Find the latest build for a build type and wait for completion.
 
         This method tolerates eventual consistency after clicking "Run" in UI:
         for a short period the build can be absent from both queue and recent list.
+        after_build_id (the newest id before the trigger) skips older builds.
         """
-        start = time.time()
-        while (time.time() - start) < timeout:
-            # Prefer queue first, then fallback to recent list.
-            queue = self.get_build_queue()
-            queued_builds = [b for b in queue if b.buildTypeId == build_type_id]
-            if queued_builds:
-                latest_queued = max(queued_builds, key=lambda b: b.id)
-                remaining = max(1, int(timeout - (time.time() - start)))
-                return self.wait_for_build_completion(latest_queued.id, remaining)
-
-            recent_builds = self.get_builds_by_buildtype(build_type_id)
-            if recent_builds:
-                latest_recent = max(recent_builds, key=lambda b: b.id)
-                remaining = max(1, int(timeout - (time.time() - start)))
-                return self.wait_for_build_completion(latest_recent.id, remaining)
-
-            time.sleep(self.POLL_INTERVAL)
-
-        raise TimeoutError(
-            f"No builds found for build type '{build_type_id}' within {timeout} seconds"
-        )
+        start = time.monotonic()
+        cache = self._state_cache()
+        if cache is not None:
+            build_id = self.latest_build_id(build_type_id, after_build_id)
+            if build_id is not None:
+                return self.wait_for_build_completion(build_id, timeout)
+            # Nothing newer on the server yet: cached builds of the type up to
+            # now are stale (a pool reset may have deleted them), skip them too
+            floor = max(
+                [after_build_id or 0]
+                + [b.id for b in cache.cached() if b.buildTypeId == build_type_id]
+            )
+            try:
+                builds = cache.wait_for_any(
+                    lambda build: build.buildTypeId == build_type_id
+                    and build.id > floor,
+                    max(0.0, timeout - (time.monotonic() - start)),
+                )
+            except TimeoutError:
+                raise TimeoutError(
+                    f"No builds found for build type '{build_type_id}' within {timeout} seconds"
+                )
+            except BuildStateCacheUnavailable:
+                logging.warning(
+                    "Build state cache unavailable, falling back to polling"
+                )
+                builds = None
+            if builds is not None:
+                # Prefer queue first, then the most recent known build
+                queued = [build for build in builds if build.state == "queued"]
+                build_id = max(build.id for build in (queued or builds))
+                remaining = max(1, int(timeout - (time.monotonic() - start)))
+                return self.wait_for_build_completion(build_id, remaining)
+            timeout = max(1, int(timeout - (time.monotonic() - start)))
+
+        poller = Poller(timeout)
+        try:
+            build_id = poller.poll(
+                lambda: self.latest_build_id(build_type_id, after_build_id),
+                until=lambda found: found is not None,
+                description=f"First build of '{build_type_id}'",
+            )
+        except TimeoutError:
+            raise TimeoutError(
+                f"No builds found for build type '{build_type_id}' within {timeout} seconds"
+            )
+        remaining = max(1, int(poller.remaining()))
+        return self.wait_for_build_completion(build_id, remaining)
 
     @staticmethod
     def delete_build(build_id: int) -> None:
@@ -0,0 +1,309 @@
+import asyncio
+import hashlib
+import logging
+import os
+import time
+from dataclasses import dataclass
+from http import HTTPStatus
+from pathlib import Path
+from typing import Iterable, List, Optional
+from urllib.parse import quote
+
+from src.main.api.configs.config import Config
+from src.main.api.models.artifact_response import ArtifactFile
+from src.main.api.requests.skeleton.async_session_pool import AsyncSessionPool
+from src.main.api.requests.skeleton.endpoint import Endpoint
+from src.main.api.requests.skeleton.requesters.crud_requester import CrudRequester
+from src.main.api.requests.skeleton.requesters.validated_crud_requester import (
+    ValidatedCrudRequester,
+)
+from src.main.api.requests.skeleton.session_pool import SessionPool
+from src.main.api.specs.request_specs import RequestSpecs
+from src.main.api.specs.response_specs import ResponseSpecs
+from src.main.api.utils.mapped_file import MappedFile
+
+
+class _RangeUnsupported(Exception):
+    """The server answered a ranged GET with the whole file"""
+
+
+@dataclass
+class DownloadResult:
+    name: str
+    path: Path
+    size: int
+    sha256: str
+    elapsed: float
+    # 0: one streamed GET, N: N parallel range requests
+    parts: int = 0
+
+    def verify(
+        self, size: Optional[int] = None, sha256: Optional[str] = None
+    ) -> "DownloadResult":
+        assert (
+            size is None or self.size == size
+        ), f"Artifact {self.name}: expected {size} bytes, downloaded {self.size}"
+        assert (
+            sha256 is None or self.sha256 == sha256.lower()
+        ), f"Artifact {self.name}: expected sha256 {sha256}, got {self.sha256}"
+        return self
+
+
+class ArtifactDownloader:
+    """Lists and downloads a build's artifacts over REST with bounded memory.
+
+    Files are streamed to disk chunk by chunk (sha256 computed on the way)
+    and renamed into place when complete. Files of rangeThreshold bytes or
+    more are split into rangeParts parallel range requests; a server that
+    ignores Range gets one streamed GET instead. download_all() fetches small
+    files concurrently, within http.maxConcurrency. Settings:
+    - artifacts.chunkSize      -> bytes per read (default 1 MiB)
+    - artifacts.rangeThreshold -> size from which ranged fetches are used (8 MiB)
+    - artifacts.rangeParts     -> parallel range requests per file (default 4)
+    """
+
+    DEFAULT_CHUNK_SIZE = 1 << 20
+    DEFAULT_RANGE_THRESHOLD = 8 << 20
+    DEFAULT_RANGE_PARTS = 4
+
+    def __init__(self, build_id: int):
+        self.build_id = build_id
+        self.chunk_size = int(
+            Config.get("artifacts.chunkSize", self.DEFAULT_CHUNK_SIZE)
+        )
+        self.range_threshold = int(
+            Config.get("artifacts.rangeThreshold", self.DEFAULT_RANGE_THRESHOLD)
+        )
+        self.range_parts = int(
+            Config.get("artifacts.rangeParts", self.DEFAULT_RANGE_PARTS)
+        )
+
+    @staticmethod
+    def _path_param(full_name: str) -> str:
+        return f"/{quote(full_name.strip('/'), safe='/')}" if full_name else ""
+
+    def content_url(self, full_name: str) -> str:
+        return CrudRequester(
+            RequestSpecs.admin_auth_spec(),
+            Endpoint.BUILD_ARTIFACT_CONTENT,
+            ResponseSpecs.any_status(),
+        )._build_url(
+            path_params={"buildId": self.build_id, "path": self._path_param(full_name)}
+        )
+
+    # ---- listing -----------------------------------------------------------
+
+    def list(self, path: str = "", recursive: bool = True) -> List[ArtifactFile]:
+        """Entries under path; recursive=True returns every file of the tree"""
+        entries: List[ArtifactFile] = []
+        directories = [path]
+        while directories:
+            directory = directories.pop(0)
+            children = (
+                ValidatedCrudRequester(
+                    RequestSpecs.admin_auth_spec(),
+                    Endpoint.BUILD_ARTIFACTS_CHILDREN,
+                    ResponseSpecs.request_returns_ok(),
+                )
+                .get(
+                    path_params={
+                        "buildId": self.build_id,
+                        "path": self._path_param(directory),
+                    }
+                )
+                .file
+            )
+            for entry in children:
+                entry.fullName = entry.fullName or f"{directory}/{entry.name}".strip(
+                    "/"
+                )
+                if not recursive:
+                    entries.append(entry)
+                elif entry.is_file:
+                    # Archives list their contents as children too; keep them whole
+                    entries.append(entry)
+                elif entry.children is not None:
+                    directories.append(entry.fullName)
+        logging.info(
+            f"Build {self.build_id} artifacts under '{path or '/'}': {len(entries)}"
+        )
+        return entries
+
+    # ---- downloads ---------------------------------------------------------
+
+    def download(self, artifact: ArtifactFile, target_dir: Path) -> DownloadResult:
+        """One file, ranged when large; its size is checked against the listing"""
+        target = self._target(target_dir, artifact.fullName)
+        if artifact.size is not None and artifact.size >= self.range_threshold:
+            result = self.fetch_ranged(artifact.fullName, target, artifact.size)
+        else:
+            result = self.stream(artifact.fullName, target)
+        return result.verify(size=artifact.size)
+
+    def download_all(
+        self, target_dir: Path, artifacts: Optional[Iterable[ArtifactFile]] = None
+    ) -> List[DownloadResult]:
+        """Every file (or the given ones): small concurrently, large ranged"""
+        artifacts = list(self.list() if artifacts is None else artifacts)
+        large = [
+            artifact
+            for artifact in artifacts
+            if artifact.size is not None and artifact.size >= self.range_threshold
+        ]
+        small = [artifact for artifact in artifacts if artifact not in large]
+        # Reject every unsafe name before anything is written
+        targets = {a.fullName: self._target(target_dir, a.fullName) for a in artifacts}
+
+        async def _fetch_small():
+            return await asyncio.gather(
+                *(self._stream_async(a.fullName, targets[a.fullName]) for a in small)
+            )
+
+        results = {}
+        if small:
+            for artifact, result in zip(small, AsyncSessionPool.run(_fetch_small())):
+                results[artifact.fullName] = result.verify(size=artifact.size)
+        for artifact in large:
+            results[artifact.fullName] = self.download(artifact, target_dir)
+        total = sum(result.size for result in results.values())
+        logging.info(
+            f"Downloaded {len(results)} artifacts of build {self.build_id} "
+            f"({total} bytes)"
+        )
+        return [results[artifact.fullName] for artifact in artifacts]
+
+    def stream(self, full_name: str, target: Path) -> DownloadResult:
+        """Single GET written to disk chunk by chunk"""
+        started = time.monotonic()
+        url = self.content_url(full_name)
+        spec = RequestSpecs.admin_auth_spec()
+        with SessionPool.get(url, spec).get(url, headers=spec, stream=True) as response:
+            ResponseSpecs.request_returns_ok()(response)
+            size, digest = self._write(
+                target, response.iter_content(chunk_size=self.chunk_size)
+            )
+        return DownloadResult(
+            full_name, target, size, digest, time.monotonic() - started
+        )
+
+    def fetch_ranged(
+        self, full_name: str, target: Path, size: int, parts: Optional[int] = None
+    ) -> DownloadResult:
+        """parts parallel range requests, each writing its slice of the file"""
+        started = time.monotonic()
+        parts = max(1, min(parts or self.range_parts, size // self.chunk_size or 1))
+        step = -(-size // parts)
+        ranges = [
+            (start, min(start + step, size) - 1) for start in range(0, size, step)
+        ]
+        url = self.content_url(full_name)
+        tmp = self._tmp(target)
+        with open(tmp, "wb") as file:
+            file.truncate(size)
+
+        async def _fetch_parts():
+            await asyncio.gather(
+                *(self._fetch_range(url, tmp, first, last) for first, last in ranges)
+            )
+
+        try:
+            AsyncSessionPool.run(_fetch_parts())
+        except _RangeUnsupported:
+            tmp.unlink(missing_ok=True)
+            logging.info(f"No range support for {full_name}; streaming it whole")
+            return self.stream(full_name, target)
+        except BaseException:
+            tmp.unlink(missing_ok=True)
+            raise
+        digest = MappedFile.file_digest(tmp)
+        os.replace(tmp, target)
+        return DownloadResult(
+            full_name,
+            target,
+            size,
+            digest,
+            time.monotonic() - started,
+            parts=len(ranges),
+        )
+
+    # ---- helpers -----------------------------------------------------------
+
+    async def _stream_async(self, full_name: str, target: Path) -> DownloadResult:
+        started = time.monotonic()
+        url = self.content_url(full_name)
+        spec = RequestSpecs.admin_auth_spec()
+        client = AsyncSessionPool.get(url, spec)
+        async with AsyncSessionPool.limiter():
+            async with client.stream("GET", url, headers=spec) as response:
+                if response.status_code != HTTPStatus.OK:
+                    await response.aread()
+                    raise AssertionError(
+                        f"Artifact {full_name} returned {response.status_code}: "
+                        f"{response.text[:200]}"
+                    )
+                tmp = self._tmp(target)
+                digest = hashlib.sha256()
+                size = 0
+                with open(tmp, "wb") as file:
+                    async for chunk in response.aiter_bytes(self.chunk_size):
+                        file.write(chunk)
+                        digest.update(chunk)
+                        size += len(chunk)
+        os.replace(tmp, target)
+        return DownloadResult(
+            full_name, target, size, digest.hexdigest(), time.monotonic() - started
+        )
+
+    async def _fetch_range(self, url: str, tmp: Path, first: int, last: int):
+        spec = RequestSpecs.admin_auth_spec()
+        client = AsyncSessionPool.get(url, spec)
+        headers = {**spec, "Range": f"bytes={first}-{last}"}
+        async with AsyncSessionPool.limiter():
+            async with client.stream("GET", url, headers=headers) as response:
+                if response.status_code == HTTPStatus.OK:
+                    raise _RangeUnsupported()
+                if response.status_code != HTTPStatus.PARTIAL_CONTENT:
+                    await response.aread()
+                    raise AssertionError(
+                        f"Range {first}-{last} of {url} returned "
+                        f"{response.status_code}: {response.text[:200]}"
+                    )
+                written = 0
+                with open(tmp, "r+b") as file:
+                    file.seek(first)
+                    async for chunk in response.aiter_bytes(self.chunk_size):
+                        file.write(chunk)
+                        written += len(chunk)
+        # The file is pre-sized: a short part would leave a zero-filled hole
+        # that the size check cannot see, a long one overwrites the next part
+        if written != last - first + 1:
+            raise AssertionError(
+                f"Range {first}-{last} of {url}: expected {last - first + 1} bytes, "
+                f"got {written}"
+            )
+
+    @staticmethod
+    def _target(target_dir: Path, full_name: str) -> Path:
+        """Where full_name goes under target_dir; names leaving it are rejected"""
+        root = Path(target_dir).resolve()
+        target = (root / full_name).resolve()
+        if target == root or not target.is_relative_to(root):
+            raise ValueError(f"Artifact name {full_name!r} points outside {root}")
+        return target
+
+    @staticmethod
+    def _tmp(target: Path) -> Path:
+        target.parent.mkdir(parents=True, exist_ok=True)
+        return target.with_name(f"{target.name}.part")
+
+    def _write(self, target: Path, chunks: Iterable[bytes]) -> tuple[int, str]:
+        tmp = self._tmp(target)
+        digest = hashlib.sha256()
+        size = 0
+        with open(tmp, "wb") as file:
+            for chunk in chunks:
+                file.write(chunk)
+                digest.update(chunk)
+                size += len(chunk)
+        os.replace(tmp, target)
+        return size, digest.hexdigest()
@@ -0,0 +1,154 @@
+import logging
+import re
+import time
+from dataclasses import dataclass
+from http import HTTPStatus
+from typing import Iterator, List, Optional
+
+from src.main.api.configs.config import Config
+from src.main.api.requests.skeleton.session_pool import SessionPool
+from src.main.api.specs.request_specs import RequestSpecs
+from src.main.api.steps.build_steps import BuildSteps
+from src.main.api.utils.poller import Poller
+
+# "[10:27:54] :\t [Step 1/1] " and "[10:27:54]i: " prefixes of plain build logs
+_PREFIX = re.compile(r"^(?:\[[^\]]*\](?:\s*[a-zA-Z]?:)?\s*)+")
+
+
+@dataclass(frozen=True)
+class LogLine:
+    number: int
+    text: str
+    # time.time() when the line was read, not the agent's own timestamp
+    received_at: float
+
+    @property
+    def message(self) -> str:
+        """The text without timestamp and step prefixes, as the UI shows it"""
+        return _PREFIX.sub("", self.text).strip()
+
+
+@dataclass
+class LogStreamMetrics:
+    lines: int = 0
+    bytes: int = 0
+    reads: int = 0
+    # Reads the server answered with 206 (or 416: nothing new)
+    ranged_reads: int = 0
+    first_line_at: Optional[float] = None
+    last_line_at: Optional[float] = None
+
+    def lines_per_second(self) -> float:
+        if self.first_line_at is None or self.last_line_at == self.first_line_at:
+            return 0.0
+        return (self.lines - 1) / (self.last_line_at - self.first_line_at)
+
+    def __str__(self) -> str:
+        return (
+            f"lines={self.lines}, bytes={self.bytes}, reads={self.reads} "
+            f"({self.ranged_reads} ranged), {self.lines_per_second():.2f} lines/s"
+        )
+
+
+class BuildLogStreamer:
+    """Tails a build's log from /downloadBuildLog.html with ranged reads.
+
+    Every read asks for "Range: bytes=<offset>-", so only the new tail is
+    transferred; a server that ignores Range answers 200 and the already
+    seen prefix is dropped locally. A trailing line without a newline is held
+    back until it is complete or the build finishes. Settings:
+    - buildLog.pollInterval -> seconds between reads (default 1)
+    """
+
+    DEFAULT_INTERVAL = 1.0
+
+    def __init__(self, build_id: int):
+        self.build_id = build_id
+        self.offset = 0
+        self.metrics = LogStreamMetrics()
+        self._partial = b""
+
+    @property
+    def url(self) -> str:
+        server = str(Config.get("server")).rstrip("/")
+        return f"{server}/downloadBuildLog.html?buildId={self.build_id}&plain=true"
+
+    def read_new(self, final: bool = False) -> List[LogLine]:
+        """Lines appended since the last read; final=True flushes a partial line"""
+        spec = RequestSpecs.admin_auth_spec()
+        response = SessionPool.get(self.url, spec).get(
+            self.url,
+            headers={**spec, "Accept": "text/plain", "Range": f"bytes={self.offset}-"},
+        )
+        self.metrics.reads += 1
+        if response.status_code == HTTPStatus.REQUESTED_RANGE_NOT_SATISFIABLE:
+            self.metrics.ranged_reads += 1
+            chunk = b""
+        elif response.status_code == HTTPStatus.PARTIAL_CONTENT:
+            self.metrics.ranged_reads += 1
+            chunk = response.content
+        elif response.status_code == HTTPStatus.OK:
+            chunk = response.content[self.offset :]
+        else:
+            raise AssertionError(
+                f"Build log of {self.build_id} returned {response.status_code}: "
+                f"{response.text[:200]}"
+            )
+        self.offset += len(chunk)
+        self.metrics.bytes += len(chunk)
+        return self._split(self._partial + chunk, final)
+
+    def lines(self, timeout: float) -> Iterator[LogLine]:
+        """Yield log lines as they appear until the build finishes or timeout"""
+        interval = float(Config.get("buildLog.pollInterval", self.DEFAULT_INTERVAL))
+        poller = Poller(timeout, initial_delay=interval, max_delay=interval, factor=1)
+        for _ in poller.ticks():
+            finished = self._finished()
+            new_lines = self.read_new(final=finished)
+            if new_lines:
+                poller.progress()
+            yield from new_lines
+            if finished:
+                logging.info(f"Build log of {self.build_id} streamed: {self.metrics}")
+                return
+        raise TimeoutError(
+            f"Build {self.build_id} still running after {timeout}s; {self.metrics}"
+        )
+
+    def wait_for_new_lines(self, count: int = 1, timeout: float = 30) -> List[LogLine]:
+        """The next count lines; fails if the log stops growing first"""
+        received: List[LogLine] = []
+        for line in self.lines(timeout):
+            received.append(line)
+            if len(received) >= count:
+                return received
+        raise AssertionError(
+            f"Build {self.build_id} finished after {len(received)} of {count} "
+            f"new log lines; {self.metrics}"
+        )
+
+    def _finished(self) -> bool:
+        builds = BuildSteps.get_builds_by_ids([self.build_id], fields="id,state")
+        return not builds or builds[0].state == "finished"
+
+    def _split(self, data: bytes, final: bool) -> List[LogLine]:
+        *complete, self._partial = data.split(b"\n")
+        if final and self._partial:
+            complete.append(self._partial)
+            self._partial = b""
+        now = time.time()
+        lines = []
+        for raw in complete:
+            self.metrics.lines += 1
+            lines.append(
+                LogLine(
+                    self.metrics.lines,
+                    raw.decode("utf-8", errors="replace").rstrip("\r"),
+                    now,
+                )
+            )
+        if lines:
+            if self.metrics.first_line_at is None:
+                self.metrics.first_line_at = now
+            self.metrics.last_line_at = now
+        return lines
@@ -0,0 +1,346 @@
+import logging
+import threading
+import time
+from typing import Callable, Dict, Iterable, Iterator, List, Optional
+
+from src.main.api.configs.config import Config
+from src.main.api.models.build_response import BuildResponse
+
+FetchBuilds = Callable[[], List[BuildResponse]]
+FetchBuildsByIds = Callable[[List[int]], List[BuildResponse]]
+
+
+class BuildStateCacheUnavailable(RuntimeError):
+    """The refresher is cooling down after failures; callers poll on their own"""
+
+
+class _Entry:
+    __slots__ = ("build", "changed", "seen_at", "finished_at", "watchers")
+
+    def __init__(self, lock: threading.Lock):
+        self.build: Optional[BuildResponse] = None
+        self.changed = threading.Condition(lock)
+        self.seen_at = 0.0
+        self.finished_at: Optional[float] = None
+        self.watchers = 0
+
+
+class BuildStateCache:
+    """Process-wide view of build states kept fresh by one daemon thread.
+
+    While at most build.cacheDirectIds unfinished builds are watched, a tick
+    is one batched item:(id:..) request for them. With more, or while a
+    wait_for_any() scan needs builds nobody named, a tick reads the build
+    queue and the most recent builds (running and just finished) instead,
+    plus an item:(id:..) lookup for watched builds neither list contained.
+    Either way the cost does not grow with the number of waiting tests.
+    Waiters block on a per-build Condition, or on the tick Condition for
+    whole-cache queries.
+
+    TeamCity's REST API has no push or long-poll for build state, so this
+    polling thread is the subscription. Settings from config.properties:
+    - build.waitMode      -> "cache" (default) or "poll" to bypass the cache
+    - build.cacheInterval -> first tick delay (default 0.5s); it doubles while
+      nothing changes, up to poll.maxDelay, and resets on change/new waiter
+    - build.cacheTtl      -> seconds an unwatched finished build stays cached
+    - build.cacheRecent   -> how many recent builds each tick reads (default 50)
+    - build.cacheDirectIds -> watched builds fetched by id alone (default 20)
+    - build.cacheCooldown -> seconds the cache stays unavailable after
+      MAX_FAILURES failed ticks in a row (default 30); then it restarts
+    """
+
+    DEFAULT_INTERVAL = 0.5
+    DEFAULT_MAX_INTERVAL = 5.0
+    DEFAULT_TTL = 120.0
+    DEFAULT_RECENT = 50
+    DEFAULT_DIRECT_IDS = 20
+    DEFAULT_COOLDOWN = 30.0
+    MAX_FAILURES = 3
+    # The thread exits after this long without waiters and restarts on demand
+    IDLE_EXIT = 30.0
+
+    _shared: Optional["BuildStateCache"] = None
+    _shared_lock = threading.Lock()
+
+    def __init__(
+        self,
+        fetch_queue: FetchBuilds,
+        fetch_recent: FetchBuilds,
+        fetch_ids: FetchBuildsByIds,
+    ):
+        self._fetch_queue = fetch_queue
+        self._fetch_recent = fetch_recent
+        self._fetch_ids = fetch_ids
+        self._lock = threading.Lock()
+        self._tick = threading.Condition(self._lock)
+        self._wake = threading.Event()
+        self._entries: Dict[int, _Entry] = {}
+        # wait_for_any() calls in progress; they keep the refresher alive too
+        self._scans = 0
+        self._thread: Optional[threading.Thread] = None
+        self._last_used = time.monotonic()
+        # monotonic time from which a failed cache may run again
+        self._retry_at = 0.0
+        self.ticks = 0
+        self.requests = 0
+        self.interval = float(Config.get("build.cacheInterval", self.DEFAULT_INTERVAL))
+        self.max_interval = float(
+            Config.get("poll.maxDelay", self.DEFAULT_MAX_INTERVAL)
+        )
+        self.ttl = float(Config.get("build.cacheTtl", self.DEFAULT_TTL))
+        self.direct_ids = int(
+            Config.get("build.cacheDirectIds", self.DEFAULT_DIRECT_IDS)
+        )
+        self.cooldown = float(Config.get("build.cacheCooldown", self.DEFAULT_COOLDOWN))
+
+    @staticmethod
+    def enabled() -> bool:
+        return str(Config.get("build.waitMode", "cache")).lower() == "cache"
+
+    @property
+    def available(self) -> bool:
+        return time.monotonic() >= self._retry_at
+
+    @classmethod
+    def shared(
+        cls,
+        fetch_queue: FetchBuilds,
+        fetch_recent: FetchBuilds,
+        fetch_ids: FetchBuildsByIds,
+    ) -> "BuildStateCache":
+        with cls._shared_lock:
+            if cls._shared is None:
+                cls._shared = cls(fetch_queue, fetch_recent, fetch_ids)
+            return cls._shared
+
+    # ---- waiting -----------------------------------------------------------
+
+    def wait(
+        self,
+        build_id: int,
+        predicate: Callable[[BuildResponse], bool],
+        timeout: float,
+    ) -> BuildResponse:
+        """Block on the build's own Condition until predicate(build) holds"""
+        deadline = time.monotonic() + timeout
+        self._watch([build_id])
+        try:
+            with self._lock:
+                entry = self._entries[build_id]
+                while entry.build is None or not predicate(entry.build):
+                    self._check_waitable(deadline, [build_id], timeout)
+                    entry.changed.wait(deadline - time.monotonic())
+                return entry.build
+        finally:
+            self._unwatch([build_id])
+
+    def wait_many(
+        self,
+        build_ids: Iterable[int],
+        predicate: Callable[[BuildResponse], bool],
+        timeout: float,
+    ) -> Iterator[BuildResponse]:
+        """Yield each build as soon as predicate(build) holds for it"""
+        pending = set(build_ids)
+        watched = list(pending)
+        deadline = time.monotonic() + timeout
+        self._watch(watched)
+        try:
+            while pending:
+                with self._lock:
+                    settled = self._matching(pending, predicate)
+                    while not settled:
+                        self._check_waitable(deadline, pending, timeout)
+                        self._tick.wait(deadline - time.monotonic())
+                        settled = self._matching(pending, predicate)
+                # Yield outside the lock so the refresher is never blocked
+                for build in settled:
+                    pending.discard(build.id)
+                    yield build
+        finally:
+            self._unwatch(watched)
+
+    def wait_for_any(
+        self, match: Callable[[BuildResponse], bool], timeout: float
+    ) -> List[BuildResponse]:
+        """Block until at least one cached build matches; returns all matches"""
+        deadline = time.monotonic() + timeout
+        with self._lock:
+            self._scans += 1
+        try:
+            return self._wait_for_any(match, deadline, timeout)
+        finally:
+            with self._lock:
+                self._scans -= 1
+
+    def cached(self) -> List[BuildResponse]:
+        """Snapshot of every build currently cached, watched or not"""
+        with self._lock:
+            return [e.build for e in self._entries.values() if e.build is not None]
+
+    def _wait_for_any(self, match, deadline: float, timeout: float):
+        self._ensure_running()
+        with self._lock:
+            while True:
+                found = [
+                    entry.build
+                    for entry in self._entries.values()
+                    if entry.build is not None and match(entry.build)
+                ]
+                if found:
+                    return found
+                self._check_waitable(deadline, [], timeout)
+                self._tick.wait(deadline - time.monotonic())
+
+    def _matching(self, pending, predicate) -> List[BuildResponse]:
+        builds = (self._entries[build_id].build for build_id in sorted(pending))
+        return [build for build in builds if build is not None and predicate(build)]
+
+    def _check_waitable(self, deadline: float, build_ids, timeout: float) -> None:
+        """Raise if the wait cannot succeed any more (called with the lock held)"""
+        if not self.available:
+            raise BuildStateCacheUnavailable("Build state cache stopped")
+        if time.monotonic() >= deadline:
+            raise TimeoutError(
+                f"Builds {sorted(build_ids)} did not settle within {timeout} seconds"
+                if build_ids
+                else f"No matching build appeared within {timeout} seconds"
+            )
+
+    def _watch(self, build_ids: List[int]) -> None:
+        with self._lock:
+            if not self.available:
+                raise BuildStateCacheUnavailable("Build state cache stopped")
+            for build_id in build_ids:
+                entry = self._entries.get(build_id)
+                if entry is None:
+                    entry = self._entries[build_id] = _Entry(self._lock)
+                entry.watchers += 1
+        self._ensure_running()
+
+    def _unwatch(self, build_ids: List[int]) -> None:
+        with self._lock:
+            for build_id in build_ids:
+                entry = self._entries.get(build_id)
+                if entry is not None:
+                    entry.watchers -= 1
+
+    def _ensure_running(self) -> None:
+        with self._lock:
+            if not self.available:
+                raise BuildStateCacheUnavailable("Build state cache stopped")
+            self._last_used = time.monotonic()
+            if self._thread is None:
+                self._thread = threading.Thread(
+                    target=self._run, name="build-state-cache", daemon=True
+                )
+                self._thread.start()
+        self._wake.set()
+
+    # ---- refreshing --------------------------------------------------------
+
+    def _run(self) -> None:
+        interval = self.interval
+        failures = 0
+        while True:
+            with self._lock:
+                watched = self._scans or any(
+                    entry.watchers for entry in self._entries.values()
+                )
+                if not watched and time.monotonic() - self._last_used > self.IDLE_EXIT:
+                    self._thread = None
+                    return
+            try:
+                changed = self._refresh()
+                failures = 0
+            except Exception as e:
+                failures += 1
+                logging.warning(f"Build state cache refresh failed ({failures}): {e}")
+                if failures >= self.MAX_FAILURES:
+                    logging.warning(
+                        f"Build state cache paused for {self.cooldown}s; "
+                        f"waiters fall back to polling"
+                    )
+                    with self._lock:
+                        self._retry_at = time.monotonic() + self.cooldown
+                        self._thread = None
+                        self._notify_all()
+                    return
+                changed = False
+            interval = (
+                self.interval if changed else min(interval * 2, self.max_interval)
+            )
+            # A new waiter cuts the sleep short so its first state arrives fast
+            if self._wake.wait(interval):
+                interval = self.interval
+            self._wake.clear()
+
+    def _refresh(self) -> bool:
+        with self._lock:
+            scanning = self._scans > 0
+            pending = [
+                build_id
+                for build_id, entry in self._entries.items()
+                if entry.watchers and not self._is_finished(entry.build)
+            ]
+        if not scanning and len(pending) <= self.direct_ids:
+            builds = self._fetch_ids(sorted(pending)) if pending else []
+            self.requests += 1 if pending else 0
+        else:
+            builds = self._fetch_lists(pending)
+
+        now = time.monotonic()
+        changed = False
+        with self._lock:
+            for build in builds:
+                changed |= self._store(build, now)
+            self._evict(now)
+            self.ticks += 1
+            self._tick.notify_all()
+        return changed
+
+    def _fetch_lists(self, pending: List[int]) -> List[BuildResponse]:
+        queue = self._fetch_queue()
+        recent = self._fetch_recent()
+        self.requests += 2
+        seen = {build.id for build in queue} | {build.id for build in recent}
+        # Watched builds that left the queue but are not among the recent ones
+        missing = [build_id for build_id in pending if build_id not in seen]
+        extra = self._fetch_ids(sorted(missing)) if missing else []
+        if missing:
+            self.requests += 1
+        return [*queue, *recent, *extra]
+
+    def _store(self, build: BuildResponse, now: float) -> bool:
+        entry = self._entries.get(build.id)
+        if entry is None:
+            entry = self._entries[build.id] = _Entry(self._lock)
+        previous = entry.build
+        entry.build = build
+        entry.seen_at = now
+        if entry.finished_at is None and self._is_finished(build):
+            entry.finished_at = now
+        if previous is None or previous.state != build.state:
+            entry.changed.notify_all()
+            return entry.watchers > 0
+        return False
+
+    def _evict(self, now: float) -> None:
+        """Drop unwatched builds that finished, or were last seen, over ttl ago"""
+        expired = [
+            build_id
+            for build_id, entry in self._entries.items()
+            if not entry.watchers
+            and now - (entry.finished_at or entry.seen_at) > self.ttl
+        ]
+        for build_id in expired:
+            del self._entries[build_id]
+
+    def _notify_all(self) -> None:
+        for entry in self._entries.values():
+            entry.changed.notify_all()
+        self._tick.notify_all()
+
+    @staticmethod
+    def _is_finished(build: Optional[BuildResponse]) -> bool:
+        return build is not None and build.state == "finished"
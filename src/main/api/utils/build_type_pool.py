@@ -0,0 +1,272 @@
+import logging
+import threading
+from collections import deque
+from dataclasses import dataclass
+from typing import Any, Deque, Dict, List, Optional
+
+from src.main.api.configs.config import Config
+from src.main.api.generators.generate_data import GenerateData
+from src.main.api.models.build_response import BuildResponse
+from src.main.api.models.create_project_request import CreateProjectRequest
+from src.main.api.models.create_project_response import CreateProjectResponse
+from src.main.api.steps.admin_steps import AdminSteps
+from src.main.api.steps.build_steps import BuildSteps
+from src.main.api.utils.cleanup_planner import CleanupPlanner, CleanupTarget
+from src.main.api.utils.poller import Poller
+
+
+@dataclass(frozen=True)
+class PoolProfile:
+    """Script (and artifact rules) a pooled build type is created with"""
+
+    name: str
+    script: str
+    artifact_rules: Optional[str] = None
+
+
+PROFILES: Dict[str, PoolProfile] = {
+    "simple": PoolProfile("simple", "echo 'Test build executed successfully'"),
+    "long_running": PoolProfile(
+        "long_running",
+        'for i in $(seq 1 30); do echo "Progress $i/30"; sleep 2; done',
+    ),
+    "artifact": PoolProfile(
+        "artifact",
+        'mkdir -p out && echo "Artifact created at $(date)" > out/result.txt',
+        artifact_rules="out/result.txt",
+    ),
+}
+
+
+def create_profile_build_type(project_id: str, profile: str) -> str:
+    spec = PROFILES[profile]
+    return AdminSteps.create_custom_build_type(
+        project_id=project_id,
+        build_type_name=f"Test Build {spec.name}",
+        script_content=spec.script,
+        artifact_rules=spec.artifact_rules,
+    )
+
+
+@dataclass
+class PooledBuildType:
+    profile: str
+    project: CreateProjectResponse
+    build_type_id: str
+    uses: int = 0
+
+    @property
+    def project_id(self) -> str:
+        return self.project.id
+
+
+class BuildTypePool:
+    """Warm pool of project + build type pairs, one queue per profile.
+
+    lease() hands out an idle pair, or creates one when the queue is empty.
+    When a queue falls to the low-water mark, a daemon thread refills it
+    to the pool size. release() resets the pair for the next test: its
+    queued/running builds are cancelled and its whole build history is
+    deleted. A pair that fails to reset, or has been used max_uses times,
+    is deleted instead. close() deletes every project the pool created.
+    Settings from config.properties:
+    - pool.size     -> idle pairs kept per profile (default 2, 0 disables the pool)
+    - pool.lowWater -> refill once a profile has this many idle pairs (default 1)
+    - pool.maxUses  -> leases before a pair is replaced (default 20)
+    Tests that change build type settings must create their own build type.
+    """
+
+    DEFAULT_SIZE = 2
+    DEFAULT_LOW_WATER = 1
+    DEFAULT_MAX_USES = 20
+    MAX_FAILURES = 3
+    RESET_TIMEOUT = 60
+
+    def __init__(self):
+        self.size = int(Config.get("pool.size", self.DEFAULT_SIZE))
+        self.low_water = int(Config.get("pool.lowWater", self.DEFAULT_LOW_WATER))
+        self.max_uses = int(Config.get("pool.maxUses", self.DEFAULT_MAX_USES))
+        self._lock = threading.Lock()
+        self._wake = threading.Event()
+        self._idle: Dict[str, Deque[PooledBuildType]] = {}
+        self._creating: Dict[str, int] = {}
+        self._refilling: Dict[str, bool] = {}
+        self._owned: List[PooledBuildType] = []
+        self._thread: Optional[threading.Thread] = None
+        self._closed = False
+        self.hits = 0
+        self.misses = 0
+
+    @classmethod
+    def enabled(cls) -> bool:
+        return int(Config.get("pool.size", cls.DEFAULT_SIZE)) > 0
+
+    def lease(self, profile: str) -> PooledBuildType:
+        if profile not in PROFILES:
+            raise ValueError(f"Unknown pool profile: {profile}")
+        with self._lock:
+            idle = self._idle.setdefault(profile, deque())
+            pooled = idle.popleft() if idle else None
+            if len(idle) <= self.low_water:
+                self._refilling[profile] = True
+        self._ensure_filler()
+        if pooled is None:
+            self.misses += 1
+            pooled = self._create(profile)
+        else:
+            self.hits += 1
+        pooled.uses += 1
+        logging.info(f"Leased {profile} build type {pooled.build_type_id}")
+        return pooled
+
+    def release(self, pooled: PooledBuildType, tracked: Optional[List[Any]] = None):
+        """Reset the pair and put it back; tracked builds of it are forgotten"""
+        if tracked is not None:
+            # Reset or discard removes these builds; created_objects must not
+            tracked[:] = [
+                obj
+                for obj in tracked
+                if not (
+                    isinstance(obj, BuildResponse)
+                    and obj.buildTypeId == pooled.build_type_id
+                )
+            ]
+        try:
+            self._reset(pooled)
+        except Exception as e:
+            logging.warning(
+                f"Could not reset build type {pooled.build_type_id}, discarding: {e}"
+            )
+            self._discard(pooled)
+            return
+        if self._closed or pooled.uses >= self.max_uses:
+            self._discard(pooled)
+            return
+        with self._lock:
+            self._idle[pooled.profile].append(pooled)
+
+    def close(self) -> None:
+        self._closed = True
+        self._wake.set()
+        if self._thread is not None:
+            self._thread.join()
+        with self._lock:
+            projects = [pooled.project for pooled in self._owned]
+            self._owned.clear()
+            self._idle.clear()
+        if projects:
+            report = CleanupPlanner(projects).run()
+            logging.info(
+                f"Build type pool closed (hits={self.hits}, misses={self.misses}): "
+                f"{report}"
+            )
+
+    # ---- lifecycle of one pair ---------------------------------------------
+
+    def _create(self, profile: str) -> PooledBuildType:
+        # Pool-owned: kept out of any test's created_objects
+        project = AdminSteps([]).create_project(
+            CreateProjectRequest(
+                id=GenerateData.get_project_id(), name=GenerateData.get_project_name()
+            )
+        )
+        try:
+            build_type_id = create_profile_build_type(project.id, profile)
+        except Exception:
+            AdminSteps.delete_project(project.id)
+            raise
+        pooled = PooledBuildType(profile, project, build_type_id)
+        with self._lock:
+            self._owned.append(pooled)
+        return pooled
+
+    def _reset(self, pooled: PooledBuildType) -> None:
+        build_steps = BuildSteps([])
+        builds = BuildSteps.get_build_history(pooled.build_type_id, fields="id,state")
+        active = []
+        for build in builds:
+            if build.state == "queued":
+                build_steps.cancel_queued_build(build.id, comment="Pool reset")
+            elif build.state == "running":
+                build_steps.cancel_running_build(build.id, comment="Pool reset")
+                active.append(build.id)
+        if active:
+            for _ in build_steps.wait_for_builds(
+                active, BuildSteps._finished, timeout=self.RESET_TIMEOUT
+            ):
+                pass
+        report = CleanupPlanner.from_targets(
+            CleanupTarget("build", build.id, ("buildType", pooled.build_type_id))
+            for build in builds
+        ).run()
+        if report.failed:
+            raise RuntimeError(f"{len(report.failed)} builds were not deleted")
+
+    def _discard(self, pooled: PooledBuildType) -> None:
+        with self._lock:
+            if pooled in self._owned:
+                self._owned.remove(pooled)
+        try:
+            AdminSteps.delete_project(pooled.project_id)
+        except Exception as e:
+            logging.warning(f"Could not delete pooled project {pooled.project_id}: {e}")
+
+    # ---- background refill -------------------------------------------------
+
+    def _ensure_filler(self) -> None:
+        with self._lock:
+            if self._thread is None and not self._closed:
+                self._thread = threading.Thread(
+                    target=self._fill, name="build-type-pool", daemon=True
+                )
+                self._thread.start()
+        self._wake.set()
+
+    def _next_profile(self) -> Optional[str]:
+        """A profile still refilling, reserving one creation slot for it"""
+        with self._lock:
+            for profile, refilling in self._refilling.items():
+                if not refilling:
+                    continue
+                if len(self._idle[profile]) + self._creating.get(profile, 0) >= (
+                    self.size
+                ):
+                    self._refilling[profile] = False
+                    continue
+                self._creating[profile] = self._creating.get(profile, 0) + 1
+                return profile
+        return None
+
+    def _create_with_backoff(self, profile: str) -> Optional[PooledBuildType]:
+        """Up to MAX_FAILURES attempts with backoff between them; None if all fail"""
+        poller = Poller(max_attempts=self.MAX_FAILURES)
+        for attempt in poller.ticks():
+            try:
+                return self._create(profile)
+            except Exception as e:
+                logging.warning(f"Pool refill of {profile} failed ({attempt}): {e}")
+            if self._closed:
+                break
+        return None
+
+    def _fill(self) -> None:
+        while not self._closed:
+            profile = self._next_profile()
+            if profile is None:
+                self._wake.wait()
+                self._wake.clear()
+                continue
+            try:
+                pooled = self._create_with_backoff(profile)
+            finally:
+                with self._lock:
+                    self._creating[profile] -= 1
+            if pooled is None:
+                # Leases keep working, creating pairs on demand; the next
+                # lease starts a new filler
+                logging.error("Build type pool stops refilling")
+                with self._lock:
+                    self._thread = None
+                return
+            with self._lock:
+                self._idle[profile].append(pooled)
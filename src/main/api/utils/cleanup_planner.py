@@ -0,0 +1,206 @@
+import logging
+import threading
+import time
+from concurrent.futures import ThreadPoolExecutor
+from dataclasses import dataclass, field
+from typing import Any, Callable, Dict, Iterable, List, Optional, Tuple
+
+from src.main.api.configs.config import Config
+from src.main.api.models.build_response import BuildResponse
+from src.main.api.models.build_type_response import BuildTypeResponse
+from src.main.api.models.create_buildtype_response import CreateBuildTypeResponse
+from src.main.api.models.create_project_response import CreateProjectResponse
+from src.main.api.models.create_user_response import CreateUserResponse
+from src.main.api.requests.skeleton.session_pool import SessionPool
+from src.main.api.steps.admin_steps import AdminSteps
+from src.main.api.steps.build_steps import BuildSteps
+
+
+@dataclass(frozen=True)
+class CleanupTarget:
+    """One server entity to delete; owner is the (kind, id) it cascades from"""
+
+    kind: str
+    id: Any
+    owner: Optional[Tuple[str, Any]] = None
+    label: str = ""
+
+    @property
+    def key(self) -> Tuple[str, Any]:
+        return self.kind, self.id
+
+
+@dataclass
+class CleanupReport:
+    tracked: int = 0
+    planned: int = 0
+    pruned: int = 0
+    deleted: int = 0
+    failed: List[Tuple[CleanupTarget, str]] = field(default_factory=list)
+    unhandled: int = 0
+    elapsed: float = 0.0
+    seconds_by_kind: Dict[str, float] = field(default_factory=dict)
+
+    def __str__(self) -> str:
+        kinds = ", ".join(f"{k}={v:.2f}s" for k, v in self.seconds_by_kind.items())
+        return (
+            f"tracked={self.tracked}, planned={self.planned}, pruned={self.pruned}, "
+            f"deleted={self.deleted}, failed={len(self.failed)}, "
+            f"unhandled={self.unhandled}, elapsed={self.elapsed:.2f}s [{kinds}]"
+        )
+
+
+def _project_owner(project: CreateProjectResponse) -> Optional[Tuple[str, Any]]:
+    parent = project.parentProjectId
+    return ("project", parent) if parent and parent != "_Root" else None
+
+
+def _build_type_owner(build_type) -> Optional[Tuple[str, Any]]:
+    project_id = getattr(build_type, "projectId", None)
+    if project_id is None and getattr(build_type, "project", None):
+        project_id = build_type.project.get("id")
+    return ("project", project_id) if project_id else None
+
+
+# model type -> (kind, owner, label); replaces the isinstance chain
+_TARGETS: Dict[type, Tuple[str, Callable[[Any], Any], Callable[[Any], str]]] = {
+    CreateProjectResponse: ("project", _project_owner, lambda o: o.name),
+    CreateUserResponse: ("user", lambda o: None, lambda o: o.username),
+    BuildTypeResponse: ("buildType", _build_type_owner, lambda o: o.name),
+    CreateBuildTypeResponse: ("buildType", _build_type_owner, lambda o: o.name),
+    BuildResponse: (
+        "build",
+        lambda o: ("buildType", o.buildTypeId),
+        lambda o: f"#{o.id}",
+    ),
+}
+
+# kind -> delete call
+_DELETES: Dict[str, Callable[[Any], None]] = {
+    "project": AdminSteps.delete_project,
+    "user": AdminSteps.delete_user,
+    "buildType": AdminSteps.delete_build_type,
+    "build": BuildSteps.delete_build,
+}
+
+# Children first (users own nothing): a level starts once the previous one is done
+_LEVELS = (("build", "user"), ("buildType",), ("project",))
+
+
+class CleanupPlanner:
+    """Plans and runs teardown deletes for created_objects.
+
+    Objects become CleanupTargets in an ownership graph (project -> subprojects
+    -> build types -> builds). Targets whose ancestor is also being deleted
+    are pruned: TeamCity removes them with the parent. A build type without a
+    known project falls back to the "<ProjectId>_" id prefix TeamCity uses.
+    The rest run level by level on a thread pool; every delete takes a
+    per-host semaphore slot. Settings from config.properties:
+    - cleanup.workers     -> pool size (default 8)
+    - cleanup.maxPerHost  -> concurrent deletes per server (default 4)
+    """
+
+    DEFAULT_WORKERS = 8
+    DEFAULT_MAX_PER_HOST = 4
+
+    _host_slots: Dict[str, threading.BoundedSemaphore] = {}
+    _host_lock = threading.Lock()
+
+    def __init__(self, objects: List[Any]):
+        self.report = CleanupReport(tracked=len(objects))
+        self.targets = self._collect(objects)
+
+    @classmethod
+    def from_targets(cls, targets: Iterable[CleanupTarget]) -> "CleanupPlanner":
+        planner = cls([])
+        planner.targets = {target.key: target for target in targets}
+        planner.report.tracked = len(planner.targets)
+        return planner
+
+    def ancestors(self, target: CleanupTarget) -> List[Tuple[str, Any]]:
+        """Tracked targets whose delete cascades to this one"""
+        return [owner for owner in self._ancestors(target) if owner in self.targets]
+
+    def _collect(self, objects: List[Any]) -> Dict[Tuple[str, Any], CleanupTarget]:
+        targets: Dict[Tuple[str, Any], CleanupTarget] = {}
+        for obj in objects:
+            spec = _TARGETS.get(type(obj))
+            if spec is None:
+                logging.warning(f"Object type: {type(obj)} is not handled in cleanup")
+                self.report.unhandled += 1
+                continue
+            kind, owner, label = spec
+            target = CleanupTarget(kind, obj.id, owner(obj), label(obj))
+            # Deduplicate by kind and ID to avoid double cleanup
+            targets.setdefault(target.key, target)
+        return targets
+
+    def _ancestors(self, target: CleanupTarget):
+        seen = set()
+        owner = target.owner
+        while owner is not None and owner not in seen:
+            seen.add(owner)
+            yield owner
+            parent = self.targets.get(owner)
+            owner = parent.owner if parent else None
+        if target.kind in ("build", "buildType"):
+            # Build type ids default to "<ProjectId>_<Name>"
+            build_type_id = target.id if target.kind == "buildType" else target.owner[1]
+            for key in self.targets:
+                if key[0] == "project" and str(build_type_id).startswith(f"{key[1]}_"):
+                    yield key
+
+    def plan(self) -> List[List[CleanupTarget]]:
+        """Deletes still needed after pruning, grouped into ordered levels"""
+        remaining = [
+            target for target in self.targets.values() if not self.ancestors(target)
+        ]
+        self.report.planned = len(remaining)
+        self.report.pruned = len(self.targets) - len(remaining)
+        return [
+            [target for target in remaining if target.kind in kinds]
+            for kinds in _LEVELS
+        ]
+
+    @classmethod
+    def _slot(cls) -> threading.BoundedSemaphore:
+        host = SessionPool._origin(str(Config.get("server")))
+        with cls._host_lock:
+            slot = cls._host_slots.get(host)
+            if slot is None:
+                limit = int(Config.get("cleanup.maxPerHost", cls.DEFAULT_MAX_PER_HOST))
+                slot = cls._host_slots[host] = threading.BoundedSemaphore(limit)
+            return slot
+
+    def _delete(self, target: CleanupTarget) -> float:
+        start = time.perf_counter()
+        with self._slot():
+            _DELETES[target.kind](target.id)
+        logging.info(f"Cleaned up {target.kind}: {target.label} (ID: {target.id})")
+        return time.perf_counter() - start
+
+    def run(self) -> CleanupReport:
+        start = time.perf_counter()
+        levels = self.plan()
+        workers = int(Config.get("cleanup.workers", self.DEFAULT_WORKERS))
+        with ThreadPoolExecutor(
+            max_workers=workers, thread_name_prefix="cleanup"
+        ) as pool:
+            for level in levels:
+                futures = [
+                    (target, pool.submit(self._delete, target)) for target in level
+                ]
+                for target, future in futures:
+                    try:
+                        seconds = future.result()
+                    except Exception as e:
+                        logging.error(
+                            f"Failed to cleanup {target.kind} {target.id}: {e}"
+                        )
+                        self.report.failed.append((target, str(e)))
+                        continue
+                    self.report.deleted += 1
+                    by_kind = self.report.seconds_by_kind
+                    by_kind[target.kind] = by_kind.get(target.kind, 0.0) + seconds
+        self.report.elapsed = time.perf_counter() - start
+        return self.report
@@ -0,0 +1,233 @@
+import json
+import logging
+import os
+import threading
+from pathlib import Path
+from typing import Any, Dict, List, Optional, Set, Tuple
+
+from src.main.api.configs.config import Config
+from src.main.api.steps.build_steps import BuildSteps
+from src.main.api.utils.cleanup_planner import (
+    CleanupPlanner,
+    CleanupReport,
+    CleanupTarget,
+)
+from src.main.api.utils.worker import worker_id
+
+
+class DeferredCleanup:
+    """Session-wide tombstone list drained by a background thread.
+
+    With cleanup.mode=deferred created_objects does not delete anything at
+    teardown: its targets are appended to a tombstone file and a daemon thread
+    deletes them while later tests run. The deferred_cleanup session fixture
+    calls flush().
+
+    - The file is rewritten on every change, so a crashed run leaves its
+      tombstones behind; the next session loads and drains them.
+    - Queued or running builds, and every tracked project/build type above
+      them, wait until flush(). Agents are never tracked, so never touched.
+    - A target that fails MAX_ATTEMPTS drains in a row is dropped with an error.
+
+    Settings from config.properties:
+    - cleanup.mode          -> "sync" (default) or "deferred"
+    - cleanup.tombstoneFile -> path, relative to the project root; xdist
+      workers add their id, e.g. cleanup-tombstones.gw1.json
+    - cleanup.drainInterval -> seconds between background drains (default 2)
+    """
+
+    DEFAULT_PATH = ".pytest_cache/cleanup-tombstones.json"
+    DEFAULT_INTERVAL = 2.0
+    MAX_ATTEMPTS = 3
+    BUSY_STATES = ("queued", "running")
+
+    _lock = threading.Lock()
+    # Serialises drains: the worker and flush() never delete concurrently
+    _drain_lock = threading.Lock()
+    _tombstones: Dict[Tuple[str, Any], CleanupTarget] = {}
+    _attempts: Dict[Tuple[str, Any], int] = {}
+    _loaded = False
+    _thread: Optional[threading.Thread] = None
+    _wake = threading.Event()
+    _stop = threading.Event()
+    reports: List[CleanupReport] = []
+
+    @staticmethod
+    def enabled() -> bool:
+        return str(Config.get("cleanup.mode", "sync")).lower() == "deferred"
+
+    @classmethod
+    def path(cls) -> Path:
+        path = Path(str(Config.get("cleanup.tombstoneFile", cls.DEFAULT_PATH)))
+        path = path if path.is_absolute() else Config.BASE_DIR / path
+        worker = worker_id()
+        # One file per xdist worker: workers never rewrite each other's list
+        return path if worker == "master" else path.with_stem(f"{path.stem}.{worker}")
+
+    @classmethod
+    def pending(cls) -> int:
+        with cls._lock:
+            cls._load()
+            return len(cls._tombstones)
+
+    @classmethod
+    def defer(cls, objects: List[Any]) -> None:
+        """Record the objects' targets as tombstones and wake the worker"""
+        if not objects:
+            return
+        targets = CleanupPlanner(objects).targets.values()
+        with cls._lock:
+            cls._load()
+            for target in targets:
+                cls._tombstones.setdefault(target.key, target)
+            cls._save()
+        logging.info(f"Deferred cleanup of {len(targets)} objects")
+        cls._ensure_worker()
+        cls._wake.set()
+
+    @classmethod
+    def flush(cls) -> Optional[CleanupReport]:
+        """Stop the worker and delete everything left, builds in use included"""
+        cls._stop.set()
+        cls._wake.set()
+        thread = cls._thread
+        if thread is not None:
+            thread.join()
+        cls._thread = None
+        cls._stop.clear()
+        report = cls._drain(final=True)
+        if report is not None:
+            logging.info(f"Deferred cleanup flushed: {report}")
+        return report
+
+    # ---- tombstone file ----------------------------------------------------
+
+    @classmethod
+    def _load(cls) -> None:
+        """Pick up tombstones a crashed session left (called with the lock held)"""
+        if cls._loaded:
+            return
+        cls._loaded = True
+        path = cls.path()
+        if not path.is_file():
+            return
+        try:
+            records = json.loads(path.read_text(encoding="utf-8"))
+        except (OSError, ValueError) as e:
+            logging.error(f"Unreadable tombstone file {path}: {e}")
+            return
+        for record in records:
+            owner = record.get("owner")
+            target = CleanupTarget(
+                record["kind"],
+                record["id"],
+                tuple(owner) if owner else None,
+                record.get("label", ""),
+            )
+            cls._tombstones.setdefault(target.key, target)
+            cls._attempts[target.key] = record.get("attempts", 0)
+        logging.warning(f"Loaded {len(records)} leftover tombstones from {path}")
+
+    @classmethod
+    def _save(cls) -> None:
+        """Rewrite the file atomically (called with the lock held)"""
+        path = cls.path()
+        if not cls._tombstones:
+            path.unlink(missing_ok=True)
+            return
+        records = [
+            {
+                "kind": target.kind,
+                "id": target.id,
+                "owner": list(target.owner) if target.owner else None,
+                "label": target.label,
+                "attempts": cls._attempts.get(key, 0),
+            }
+            for key, target in cls._tombstones.items()
+        ]
+        path.parent.mkdir(parents=True, exist_ok=True)
+        tmp = path.with_name(f"{path.name}.{os.getpid()}.tmp")
+        tmp.write_text(json.dumps(records), encoding="utf-8")
+        os.replace(tmp, path)
+
+    # ---- draining ----------------------------------------------------------
+
+    @classmethod
+    def _ensure_worker(cls) -> None:
+        with cls._lock:
+            if cls._thread is None:
+                cls._thread = threading.Thread(
+                    target=cls._run, name="deferred-cleanup", daemon=True
+                )
+                cls._thread.start()
+
+    @classmethod
+    def _run(cls) -> None:
+        interval = float(Config.get("cleanup.drainInterval", cls.DEFAULT_INTERVAL))
+        while not cls._stop.is_set():
+            cls._wake.wait(interval)
+            cls._wake.clear()
+            if cls._stop.is_set():
+                return
+            try:
+                cls._drain(final=False)
+            except Exception as e:
+                logging.warning(f"Deferred cleanup drain failed: {e}")
+
+    @classmethod
+    def _busy(cls, planner: CleanupPlanner) -> Set[Tuple[str, Any]]:
+        """Keys to hold back: builds still in use and the tracked targets above them"""
+        builds = [t for t in planner.targets.values() if t.kind == "build"]
+        if not builds:
+            return set()
+        try:
+            states = {
+                build.id: build.state
+                for build in BuildSteps.get_builds_by_ids(
+                    [target.id for target in builds], fields="id,state"
+                )
+            }
+        except Exception as e:
+            logging.warning(f"Could not read build states, holding builds back: {e}")
+            states = {target.id: "unknown" for target in builds}
+        busy: Set[Tuple[str, Any]] = set()
+        for target in builds:
+            state = states.get(target.id)
+            if state in cls.BUSY_STATES or state == "unknown":
+                busy.add(target.key)
+                busy.update(planner.ancestors(target))
+        return busy
+
+    @classmethod
+    def _drain(cls, final: bool) -> Optional[CleanupReport]:
+        with cls._drain_lock:
+            with cls._lock:
+                cls._load()
+                targets = list(cls._tombstones.values())
+            if not targets:
+                return None
+            if not final:
+                busy = cls._busy(CleanupPlanner.from_targets(targets))
+                targets = [target for target in targets if target.key not in busy]
+                if not targets:
+                    return None
+
+            report = CleanupPlanner.from_targets(targets).run()
+            failed = {target.key for target, _ in report.failed}
+            with cls._lock:
+                for target in targets:
+                    key = target.key
+                    if key in failed:
+                        cls._attempts[key] = cls._attempts.get(key, 0) + 1
+                        if cls._attempts[key] < cls.MAX_ATTEMPTS:
+                            continue
+                        logging.error(
+                            f"Giving up on {target.kind} {target.id} "
+                            f"after {cls.MAX_ATTEMPTS} attempts"
+                        )
+                    # Deleted, pruned (gone with its parent) or given up on
+                    cls._tombstones.pop(key, None)
+                    cls._attempts.pop(key, None)
+                cls._save()
+            cls.reports.append(report)
+            return report
@@ -0,0 +1,105 @@
+import logging
+import os
+import re
+import threading
+from pathlib import Path
+from typing import Dict, Optional
+
+from src.main.api.configs.config import Config
+from src.main.api.utils.poller import Poller
+
+try:
+    import fcntl
+except ImportError:  # Windows: only threads of one process are serialised
+    fcntl = None
+
+
+class FileLock:
+    """Lock on a file in a directory every xdist worker shares.
+
+    Serialises tests touching one server resource (the agent, the build
+    queue) across worker processes: shared=False is an exclusive lock,
+    shared=True a read lock that many holders may take at once.
+    Settings from config.properties:
+    - parallel.lockDir     -> lock directory, relative to the project root
+    - parallel.lockTimeout -> seconds to wait for a lock (default 600)
+    """
+
+    DEFAULT_DIR = ".pytest_cache/locks"
+    DEFAULT_TIMEOUT = 600.0
+
+    _thread_locks: Dict[str, threading.Lock] = {}
+    _guard = threading.Lock()
+
+    def __init__(
+        self, name: str, shared: bool = False, timeout: Optional[float] = None
+    ):
+        self.name = name
+        self.shared = shared
+        self.timeout = float(
+            timeout
+            if timeout is not None
+            else Config.get("parallel.lockTimeout", self.DEFAULT_TIMEOUT)
+        )
+        self._fd: Optional[int] = None
+
+    @classmethod
+    def directory(cls) -> Path:
+        path = Path(str(Config.get("parallel.lockDir", cls.DEFAULT_DIR)))
+        return path if path.is_absolute() else Config.BASE_DIR / path
+
+    @classmethod
+    def for_server(cls, name: str, shared: bool = False) -> "FileLock":
+        """Lock on a resource of the server this process talks to"""
+        server = re.sub(r"\W+", "_", str(Config.get("server"))).strip("_")
+        return cls(f"{name}.{server}", shared=shared)
+
+    def _thread_lock(self) -> threading.Lock:
+        with self._guard:
+            return self._thread_locks.setdefault(self.name, threading.Lock())
+
+    def acquire(self) -> None:
+        if not self._thread_lock().acquire(timeout=self.timeout):
+            raise TimeoutError(f"Lock '{self.name}' not acquired in {self.timeout}s")
+        if fcntl is None:
+            return
+        directory = self.directory()
+        directory.mkdir(parents=True, exist_ok=True)
+        self._fd = os.open(directory / f"{self.name}.lock", os.O_RDWR | os.O_CREAT)
+        try:
+            Poller(self.timeout, max_delay=1.0).poll(
+                self._try_lock, until=bool, description=f"Lock '{self.name}'"
+            )
+        except TimeoutError:
+            self._close()
+            raise
+        mode = "shared" if self.shared else "exclusive"
+        logging.debug(f"Acquired {mode} lock {self.name}")
+
+    def _try_lock(self) -> bool:
+        mode = fcntl.LOCK_SH if self.shared else fcntl.LOCK_EX
+        try:
+            fcntl.flock(self._fd, mode | fcntl.LOCK_NB)
+            return True
+        except BlockingIOError:
+            return False
+
+    def release(self) -> None:
+        try:
+            if self._fd is not None:
+                fcntl.flock(self._fd, fcntl.LOCK_UN)
+        finally:
+            self._close()
+
+    def _close(self) -> None:
+        if self._fd is not None:
+            os.close(self._fd)
+            self._fd = None
+        self._thread_lock().release()
+
+    def __enter__(self) -> "FileLock":
+        self.acquire()
+        return self
+
+    def __exit__(self, *exc) -> None:
+        self.release()
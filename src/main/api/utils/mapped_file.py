@@ -0,0 +1,117 @@
+import hashlib
+import mmap
+import re
+from pathlib import Path
+from typing import Iterator, Optional, Union
+
+Pattern = Union[bytes, "re.Pattern[bytes]"]
+
+
+class MappedFile:
+    """Read-only memory map of a downloaded artifact or build log.
+
+    Searches run over the map itself: mmap.find for byte patterns and re on
+    the buffer for regexes, so a multi-hundred-MB file is never read into a
+    Python string. Hashing and comparison walk memoryview blocks. Use it as a
+    context manager; matches must be read before the map is closed.
+
+        with MappedFile(path) as log:
+            assert log.contains(b"Build finished")
+            assert log.search(rb"Progress \\d+/30")
+    """
+
+    BLOCK_SIZE = 1 << 20
+
+    def __init__(self, path: Path):
+        self.path = Path(path)
+        self._file = None
+        self._map: Union[mmap.mmap, bytes, None] = None
+
+    def __enter__(self) -> "MappedFile":
+        self._file = open(self.path, "rb")
+        size = self.path.stat().st_size
+        # mmap cannot map an empty file
+        self._map = (
+            mmap.mmap(self._file.fileno(), 0, access=mmap.ACCESS_READ) if size else b""
+        )
+        return self
+
+    def __exit__(self, *exc) -> None:
+        if isinstance(self._map, mmap.mmap):
+            self._map.close()
+        self._map = None
+        self._file.close()
+        self._file = None
+
+    @property
+    def data(self) -> Union[mmap.mmap, bytes]:
+        if self._map is None:
+            raise RuntimeError(f"{self.path} is not open; use 'with MappedFile(...)'")
+        return self._map
+
+    def __len__(self) -> int:
+        return len(self.data)
+
+    # ---- search ------------------------------------------------------------
+
+    def find(self, pattern: bytes, start: int = 0) -> int:
+        """Offset of the first occurrence from start, -1 if absent"""
+        return self.data.find(pattern, start)
+
+    def contains(self, pattern: bytes) -> bool:
+        return self.find(pattern) >= 0
+
+    def count(self, pattern: bytes) -> int:
+        found, offset = 0, self.find(pattern)
+        while offset >= 0:
+            found += 1
+            offset = self.find(pattern, offset + len(pattern))
+        return found
+
+    def search(self, pattern: Pattern, flags: int = 0) -> Optional[re.Match]:
+        return re.search(pattern, self.data, flags)
+
+    def finditer(self, pattern: Pattern, flags: int = 0) -> Iterator[re.Match]:
+        return re.finditer(pattern, self.data, flags)
+
+    def line_at(self, offset: int) -> bytes:
+        """The line holding offset (a small copy), e.g. to report a match"""
+        data = self.data
+        start = data.rfind(b"\n", 0, offset) + 1
+        end = data.find(b"\n", offset)
+        return data[start : end if end >= 0 else len(data)]
+
+    # ---- hashing and comparison ---------------------------------------------
+
+    def digest(self, algorithm: str = "sha256") -> str:
+        """Hash fed block by block from the map, without copying the file"""
+        hasher = hashlib.new(algorithm)
+        with memoryview(self.data) as view:
+            for start in range(0, len(view), self.BLOCK_SIZE):
+                hasher.update(view[start : start + self.BLOCK_SIZE])
+        return hasher.hexdigest()
+
+    def first_difference(self, other: "MappedFile") -> Optional[int]:
+        """Offset of the first differing byte, None if the files are equal.
+
+        Blocks are compared as memoryviews; only a differing block is scanned
+        byte by byte. A file that is a prefix of the other differs at its end.
+        """
+        with memoryview(self.data) as a, memoryview(other.data) as b:
+            size = min(len(a), len(b))
+            for start in range(0, size, self.BLOCK_SIZE):
+                end = min(start + self.BLOCK_SIZE, size)
+                if a[start:end] != b[start:end]:
+                    return next(i for i in range(start, end) if a[i] != b[i])
+            return None if len(a) == len(b) else size
+
+    @staticmethod
+    def file_digest(path: Path, algorithm: str = "sha256") -> str:
+        with MappedFile(path) as mapped:
+            return mapped.digest(algorithm)
+
+    @staticmethod
+    def compare_files(a: Path, b: Path) -> Optional[int]:
+        """first_difference of two files on disk"""
+        with MappedFile(a) as first, MappedFile(b) as second:
+            return first.first_difference(second)
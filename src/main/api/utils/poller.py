@@ -0,0 +1,183 @@
+import asyncio
+import logging
+import random
+import time
+from dataclasses import dataclass
+from typing import AsyncIterator, Awaitable, Callable, Iterator, Optional, TypeVar
+
+from src.main.api.configs.config import Config
+
+T = TypeVar("T")
+
+
+@dataclass
+class PollMetrics:
+    """What one wait cost: polls made, polls that changed nothing, time to settle"""
+
+    attempts: int = 0
+    wasted_polls: int = 0
+    time_to_settle: Optional[float] = None
+    stopped_early: bool = False
+
+    def __str__(self) -> str:
+        settle = "-" if self.time_to_settle is None else f"{self.time_to_settle:.2f}s"
+        return (
+            f"attempts={self.attempts}, wasted={self.wasted_polls}, "
+            f"settled in {settle}{', stopped early' if self.stopped_early else ''}"
+        )
+
+
+class Poller:
+    """Polling engine with jittered exponential backoff and a monotonic deadline.
+
+    Delay after attempt n is min(max_delay, initial_delay * factor ** n) +/- jitter,
+    never sleeping past the deadline. Defaults come from config.properties:
+    - poll.initialDelay -> first delay in seconds (default 0.25)
+    - poll.maxDelay     -> backoff ceiling in seconds (default 5)
+    - poll.factor       -> backoff multiplier (default 2)
+    - poll.jitter       -> +/- share of each delay (default 0.2)
+
+    Use poll()/poll_async() for "call until a condition holds", or iterate
+    ticks() when one tick can settle several things (call progress()).
+    """
+
+    DEFAULT_INITIAL_DELAY = 0.25
+    DEFAULT_MAX_DELAY = 5.0
+    DEFAULT_FACTOR = 2.0
+    DEFAULT_JITTER = 0.2
+
+    def __init__(
+        self,
+        timeout: Optional[float] = None,
+        max_attempts: Optional[int] = None,
+        initial_delay: Optional[float] = None,
+        max_delay: Optional[float] = None,
+        factor: Optional[float] = None,
+        jitter: Optional[float] = None,
+    ):
+        if timeout is None and max_attempts is None:
+            raise ValueError("Poller needs a timeout or max_attempts")
+        self.timeout = timeout
+        self.max_attempts = max_attempts
+        self.initial_delay = self._setting(
+            initial_delay, "poll.initialDelay", self.DEFAULT_INITIAL_DELAY
+        )
+        self.max_delay = self._setting(
+            max_delay, "poll.maxDelay", self.DEFAULT_MAX_DELAY
+        )
+        self.factor = self._setting(factor, "poll.factor", self.DEFAULT_FACTOR)
+        self.jitter = self._setting(jitter, "poll.jitter", self.DEFAULT_JITTER)
+        self.metrics = PollMetrics()
+        self._started: Optional[float] = None
+        self._progressed = False
+
+    @staticmethod
+    def _setting(value: Optional[float], key: str, default: float) -> float:
+        return float(value if value is not None else Config.get(key, default))
+
+    def elapsed(self) -> float:
+        return 0.0 if self._started is None else time.monotonic() - self._started
+
+    def remaining(self) -> float:
+        if self.timeout is None:
+            return float("inf")
+        return max(0.0, self.timeout - self.elapsed())
+
+    def progress(self, done: bool = False) -> None:
+        """Mark the current tick as useful; done=True records time to settle"""
+        self._progressed = True
+        if done:
+            self.metrics.time_to_settle = self.elapsed()
+
+    def _next_delay(self) -> Optional[float]:
+        """Seconds to sleep before the next attempt, None when out of budget"""
+        if not self._progressed:
+            self.metrics.wasted_polls += 1
+        self._progressed = False
+        if self.max_attempts is not None and self.metrics.attempts >= self.max_attempts:
+            return None
+        remaining = self.remaining()
+        if remaining <= 0:
+            return None
+        delay = min(
+            self.max_delay,
+            self.initial_delay * self.factor ** (self.metrics.attempts - 1),
+        )
+        delay *= 1 + random.uniform(-self.jitter, self.jitter)
+        return max(0.0, min(delay, remaining))
+
+    def _start(self) -> None:
+        self._started = time.monotonic()
+        self.metrics = PollMetrics()
+        self._progressed = False
+
+    def ticks(self) -> Iterator[int]:
+        """Yield attempt numbers, sleeping with backoff between them"""
+        self._start()
+        while True:
+            self.metrics.attempts += 1
+            yield self.metrics.attempts
+            delay = self._next_delay()
+            if delay is None:
+                return
+            time.sleep(delay)
+
+    async def ticks_async(self) -> AsyncIterator[int]:
+        self._start()
+        while True:
+            self.metrics.attempts += 1
+            yield self.metrics.attempts
+            delay = self._next_delay()
+            if delay is None:
+                return
+            await asyncio.sleep(delay)
+
+    def _settled(
+        self,
+        result: T,
+        until: Callable[[T], bool],
+        stop_when: Optional[Callable[[T], bool]],
+    ) -> bool:
+        if until(result):
+            self.progress(done=True)
+            return True
+        if stop_when is not None and stop_when(result):
+            self.progress(done=True)
+            self.metrics.stopped_early = True
+            return True
+        return False
+
+    def _timeout_error(self, description: str) -> TimeoutError:
+        return TimeoutError(
+            f"{description} not reached after {self.metrics.attempts} attempts "
+            f"in {self.elapsed():.1f}s"
+        )
+
+    def poll(
+        self,
+        action: Callable[[], T],
+        until: Callable[[T], bool],
+        stop_when: Optional[Callable[[T], bool]] = None,
+        description: str = "condition",
+    ) -> T:
+        """Call action until until(result); stop_when(result) returns it early"""
+        for _ in self.ticks():
+            result = action()
+            if self._settled(result, until, stop_when):
+                logging.debug(f"{description}: {self.metrics}")
+                return result
+        raise self._timeout_error(description)
+
+    async def poll_async(
+        self,
+        action: Callable[[], Awaitable[T]],
+        until: Callable[[T], bool],
+        stop_when: Optional[Callable[[T], bool]] = None,
+        description: str = "condition",
+    ) -> T:
+        async for _ in self.ticks_async():
+            result = await action()
+            if self._settled(result, until, stop_when):
+                logging.debug(f"{description}: {self.metrics}")
+                return result
+        raise self._timeout_error(description)
@@ -1,6 +1,6 @@
-import time
 from typing import Callable, TypeVar
 
+from src.main.api.utils.poller import Poller
 from src.main.api.utils.step_logger import StepLogger
 
 T = TypeVar("T")
@@ -19,15 +19,27 @@ class RetryUtils:
         """
         Повторяет action до тех пор, пока condition(result) не станет True.
         Каждый шаг логируется (Allure ui_log при наличии page).
+        Выполняются все max_attempts попыток; пауза между ними, как и раньше,
+        постоянна: delay_seconds (+/- jitter из poll.jitter).
         """
-        result: T | None = None
-        for attempt in range(1, max_attempts + 1):
-            result = StepLogger.ui_log(
-                title=f"Attempt {attempt}: {title}",
-                page=page,
-                action=action,
+        poller = Poller(
+            max_attempts=max_attempts,
+            initial_delay=delay_seconds,
+            max_delay=delay_seconds,
+            factor=1,
+        )
+        try:
+            return poller.poll(
+                lambda: StepLogger.ui_log(
+                    title=f"Attempt {poller.metrics.attempts}: {title}",
+                    page=page,
+                    action=action,
+                ),
+                until=condition,
+                description=title,
             )
-            if condition(result):
-                return result
-            time.sleep(delay_seconds)
-        raise TimeoutError(f"Retry failed after {max_attempts} attempts: {title}")
+        except TimeoutError as e:
+            raise TimeoutError(
+                f"Retry failed after {poller.metrics.attempts} attempts "
+                f"in {poller.elapsed():.1f}s: {title}"
+            ) from e
@@ -0,0 +1,169 @@
+import logging
+import threading
+from dataclasses import dataclass, field
+from http import HTTPStatus
+from typing import Dict, Tuple
+
+import requests
+
+from src.main.api.configs.config import Config
+from src.main.api.requests.skeleton.endpoint import Endpoint
+from src.main.api.requests.skeleton.requesters.crud_requester import CrudRequester
+from src.main.api.requests.skeleton.requesters.validated_crud_requester import (
+    ValidatedCrudRequester,
+)
+from src.main.api.specs.request_specs import RequestSpecs
+from src.main.api.specs.response_specs import ResponseSpecs
+from src.main.api.steps.agent_steps import AgentSteps
+from src.main.api.utils.poller import Poller
+
+# Failed or rejected agent calls (response specs assert, models raise
+# ValueError): recorded as the check's result and retried
+_CHECK_ERRORS = (requests.RequestException, AssertionError, ValueError)
+
+
+class ServerNotReady(RuntimeError):
+    """A health check failed; the message is the diagnosis"""
+
+
+class _Fatal(Exception):
+    """A failure waiting cannot fix, e.g. a rejected token"""
+
+
+@dataclass
+class HealthReport:
+    server: str
+    ok: bool = False
+    # check -> "ok" or what is wrong, in the order the checks ran
+    checks: Dict[str, str] = field(default_factory=dict)
+    attempts: int = 0
+    elapsed: float = 0.0
+
+    def diagnosis(self) -> str:
+        lines = [f"  {name}: {result}" for name, result in self.checks.items()]
+        state = "ready" if self.ok else "NOT ready"
+        return "\n".join(
+            [
+                f"TeamCity {self.server} {state} after {self.attempts} checks "
+                f"in {self.elapsed:.1f}s",
+                *lines,
+            ]
+        )
+
+
+class ServerHealth:
+    """Session-wide readiness gate for the TeamCity server.
+
+    Checks in order: server up, maintenance off, admin token valid and, when
+    min_agents > 0, that many agents connected, authorized and enabled
+    (prepare_agents=True authorizes/enables connected agents along the way).
+    Waits with Poller backoff; a rejected token fails at once. Results are
+    cached per (server, min_agents): later calls return the report, or raise
+    the same diagnosis, without a request. Settings from config.properties:
+    - health.timeout   -> seconds to wait for readiness (default 180)
+    - health.minAgents -> agents the build fixtures need (default 1)
+    """
+
+    DEFAULT_TIMEOUT = 180.0
+    DEFAULT_MIN_AGENTS = 1
+
+    _reports: Dict[Tuple[str, int], HealthReport] = {}
+    _lock = threading.Lock()
+
+    @classmethod
+    def ensure(cls, min_agents: int = 0, prepare_agents: bool = False) -> HealthReport:
+        server = str(Config.get("server"))
+        key = (server, min_agents)
+        with cls._lock:
+            report = cls._reports.get(key)
+            if report is None:
+                report = cls._reports[key] = cls._wait(
+                    server, min_agents, prepare_agents
+                )
+        if not report.ok:
+            raise ServerNotReady(report.diagnosis())
+        return report
+
+    @classmethod
+    def _wait(cls, server: str, min_agents: int, prepare_agents: bool):
+        report = HealthReport(server)
+        poller = Poller(float(Config.get("health.timeout", cls.DEFAULT_TIMEOUT)))
+        try:
+            poller.poll(
+                lambda: cls._check(report, min_agents, prepare_agents),
+                until=bool,
+                description="Server health",
+            )
+            report.ok = True
+        except (TimeoutError, _Fatal):
+            pass
+        report.attempts = poller.metrics.attempts
+        report.elapsed = poller.elapsed()
+        log = logging.info if report.ok else logging.error
+        log(report.diagnosis())
+        return report
+
+    @staticmethod
+    def _check(report: HealthReport, min_agents: int, prepare_agents: bool) -> bool:
+        checks = report.checks
+        checks.clear()
+        try:
+            response = CrudRequester(
+                RequestSpecs.admin_auth_spec(),
+                Endpoint.SERVER_INFO,
+                ResponseSpecs.any_status(),
+            ).get()
+        except requests.RequestException as e:
+            checks["server up"] = f"no response: {e}"
+            return False
+        checks["server up"] = "ok"
+
+        status = response.status_code
+        if status == HTTPStatus.SERVICE_UNAVAILABLE or "/mnt" in response.url:
+            checks["maintenance off"] = f"starting up or in maintenance ({status})"
+            return False
+        checks["maintenance off"] = "ok"
+
+        if status in (HTTPStatus.UNAUTHORIZED, HTTPStatus.FORBIDDEN):
+            checks["admin token valid"] = (
+                f"rejected with {status}; check admin.bearerToken "
+                "(TC_ADMIN_BEARERTOKEN)"
+            )
+            raise _Fatal()
+        if status != HTTPStatus.OK:
+            checks["admin token valid"] = f"unexpected status {status}"
+            return False
+        checks["admin token valid"] = "ok"
+
+        if min_agents <= 0:
+            return True
+        name = f"{min_agents}+ agents connected, authorized, enabled"
+        try:
+            agents = (
+                ValidatedCrudRequester(
+                    RequestSpecs.admin_auth_spec(),
+                    Endpoint.AGENTS_LIST,
+                    ResponseSpecs.request_returns_ok(),
+                )
+                .get(
+                    query_params={"locator": "connected:true,authorized:any"},
+                    fields="count,agent(id,authorized,enabled)",
+                )
+                .agent
+            )
+        except _CHECK_ERRORS as e:
+            checks[name] = f"agents list failed: {type(e).__name__}: {e}"
+            return False
+        ready = sum(1 for agent in agents if agent.authorized and agent.enabled)
+        if ready >= min_agents:
+            checks[name] = "ok"
+            return True
+        checks[name] = f"{ready} ready of {len(agents)} connected"
+        if prepare_agents:
+            try:
+                agent_steps = AgentSteps([])
+                agent_steps.authorize_all_agents()
+                agent_steps.enable_all_agents()
+            except _CHECK_ERRORS as e:
+                checks["prepare agents"] = f"failed: {type(e).__name__}: {e}"
+        return False
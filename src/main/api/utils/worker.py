@@ -0,0 +1,23 @@
+import itertools
+import os
+import uuid
+
+_counter = itertools.count()
+# Shared by all workers of one xdist run; random per run without xdist
+_RUN_TOKEN = os.environ.get("PYTEST_XDIST_TESTRUNUID", uuid.uuid4().hex)[:6]
+
+
+def worker_id() -> str:
+    """xdist worker name (gw0, gw1, ...) or "master" in a plain run"""
+    return os.environ.get("PYTEST_XDIST_WORKER", "master")
+
+
+def unique_suffix() -> str:
+    """Collision-free id part: run token + worker + per-process counter.
+
+    Two workers never share a worker part and one process never repeats a
+    counter value, so ids cannot collide within a run whatever the timing.
+    """
+    worker = worker_id()
+    worker_part = "m" if worker == "master" else f"w{worker.removeprefix('gw')}"
+    return f"{_RUN_TOKEN}{worker_part}n{next(_counter)}"
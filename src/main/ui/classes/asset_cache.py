@@ -0,0 +1,160 @@
+import hashlib
+import json
+import os
+import re
+from pathlib import Path
+from typing import Dict, List, Optional, Tuple
+
+import requests
+from playwright.sync_api import Route
+
+from src.main.api.configs.config import Config
+from src.main.api.requests.skeleton.endpoint import Endpoint
+from src.main.api.requests.skeleton.requesters.crud_requester import CrudRequester
+from src.main.api.specs.request_specs import RequestSpecs
+from src.main.api.specs.response_specs import ResponseSpecs
+
+
+class AssetCache:
+    """Disk cache of TeamCity static assets served to Playwright routes.
+
+    Intercepted routes disable the browser's HTTP cache, so without this every
+    test downloads the JS bundles again. The first GET of a static asset goes
+    to the server; a 200 response is stored and later requests are fulfilled
+    from disk. Bodies are stored once per content hash (blobs/<sha256>) and an
+    index entry per URL points at them, so workers and sessions share one
+    copy. Entries are kept per server version and build number: an upgraded
+    server starts with an empty cache, and a server whose version cannot be
+    read is not cached at all. Settings:
+    - ui.assetCache      -> "true" (default) or "false"
+    - ui.assetCache.dir  -> directory, relative to the project root
+    - ui.assetCache.paths -> comma-separated path fragments that are cached
+      (default /js/,/css/,/img/)
+    """
+
+    DEFAULT_DIR = ".pytest_cache/assets"
+    DEFAULT_PATHS = "/js/,/css/,/img/"
+    # Dropped on replay: the stored body is already decoded and complete
+    SKIPPED_HEADERS = {"content-encoding", "content-length", "transfer-encoding"}
+
+    hits = 0
+    misses = 0
+    # server -> "<version>_<buildNumber>", None when it could not be read
+    _versions: Dict[str, Optional[str]] = {}
+
+    @classmethod
+    def enabled(cls) -> bool:
+        if str(Config.get("ui.assetCache", "true")).lower() != "true":
+            return False
+        return cls.server_version() is not None
+
+    @classmethod
+    def server_version(cls) -> Optional[str]:
+        """Version and build of the server, read once per session"""
+        server = str(Config.get("server"))
+        if server not in cls._versions:
+            try:
+                info = CrudRequester(
+                    RequestSpecs.admin_auth_spec(),
+                    Endpoint.SERVER_INFO,
+                    ResponseSpecs.request_returns_ok(),
+                ).get()
+                info = info.json()
+                version = f"{info['version']}_{info['buildNumber']}"
+                cls._versions[server] = re.sub(r"\W+", "_", version).strip("_")
+            except (requests.RequestException, AssertionError, ValueError, KeyError):
+                cls._versions[server] = None
+        return cls._versions[server]
+
+    @classmethod
+    def root(cls) -> Path:
+        root = Path(str(Config.get("ui.assetCache.dir", cls.DEFAULT_DIR)))
+        root = root if root.is_absolute() else Config.BASE_DIR / root
+        server = re.sub(r"\W+", "_", str(Config.get("server"))).strip("_")
+        return root / server / str(cls.server_version())
+
+    @classmethod
+    def url_pattern(cls) -> "re.Pattern[str]":
+        """URLs cacheable() may accept, for routing only those to Python.
+
+        Matched by the Playwright driver, so it must be JavaScript-compatible.
+        """
+        server = re.escape(str(Config.get("server")).rstrip("/"))
+        paths = "|".join(re.escape(path) for path in cls._paths())
+        return re.compile(f"^{server}[^?#]*(?:{paths})")
+
+    @classmethod
+    def cacheable(cls, method: str, url: str) -> bool:
+        if method != "GET":
+            return False
+        server = str(Config.get("server")).rstrip("/")
+        if not url.startswith(server):
+            return False
+        path = url[len(server) :]
+        return any(part in path for part in cls._paths())
+
+    @classmethod
+    def _paths(cls) -> List[str]:
+        paths = str(Config.get("ui.assetCache.paths", cls.DEFAULT_PATHS))
+        return [part.strip() for part in paths.split(",") if part.strip()]
+
+    @classmethod
+    def serve(cls, route: Route) -> None:
+        """Fulfil the route from disk, fetching and storing it on a miss"""
+        url = route.request.url
+        cached = cls._load(url)
+        if cached is not None:
+            status, headers, body = cached
+            cls.hits += 1
+            route.fulfill(status=status, headers=headers, body=body)
+            return
+        cls.misses += 1
+        response = route.fetch()
+        cache_control = response.headers.get("cache-control", "")
+        if response.status == 200 and "no-store" not in cache_control:
+            cls._store(url, response.status, response.headers, response.body())
+        route.fulfill(response=response)
+
+    # ---- storage -----------------------------------------------------------
+
+    @classmethod
+    def _index_path(cls, url: str) -> Path:
+        key = hashlib.sha256(url.encode("utf-8")).hexdigest()
+        return cls.root() / "index" / f"{key}.json"
+
+    @classmethod
+    def _load(cls, url: str) -> Optional[Tuple[int, Dict[str, str], bytes]]:
+        try:
+            entry = json.loads(cls._index_path(url).read_text(encoding="utf-8"))
+            body = (cls.root() / "blobs" / entry["sha256"]).read_bytes()
+        except (OSError, ValueError, KeyError):
+            return None
+        if hashlib.sha256(body).hexdigest() != entry["sha256"]:
+            return None
+        return entry["status"], entry["headers"], body
+
+    @classmethod
+    def _store(cls, url: str, status: int, headers: Dict[str, str], body: bytes):
+        digest = hashlib.sha256(body).hexdigest()
+        blob = cls.root() / "blobs" / digest
+        if not blob.is_file():
+            cls._write(blob, body)
+        entry = {
+            "url": url,
+            "status": status,
+            "sha256": digest,
+            "headers": {
+                name: value
+                for name, value in headers.items()
+                if name.lower() not in cls.SKIPPED_HEADERS
+            },
+        }
+        cls._write(cls._index_path(url), json.dumps(entry).encode("utf-8"))
+
+    @staticmethod
+    def _write(path: Path, data: bytes) -> None:
+        """Atomic write: concurrent workers never see a half-written file"""
+        path.parent.mkdir(parents=True, exist_ok=True)
+        tmp = path.with_name(f"{path.name}.{os.getpid()}.tmp")
+        tmp.write_bytes(data)
+        os.replace(tmp, path)
@@ -0,0 +1,108 @@
+import logging
+import re
+import threading
+import time
+from pathlib import Path
+
+from playwright.sync_api import Browser, BrowserContext, Response
+
+from src.main.api.configs.config import Config
+from src.main.api.utils.worker import worker_id
+from src.main.ui.pages.login_page import LoginPage
+
+
+class AuthStateCache:
+    """Playwright storage_state files, one per worker, server and user.
+
+    The first context for a user logs in through the form once and saves
+    cookies + localStorage to disk. Later contexts are created from that file
+    and start logged in. A state is dropped when a context seeded from it
+    gets a 401 or lands on the login page, and on the next use when a
+    cookie-authenticated GET /app/rest/server is refused. Settings:
+    - ui.authCache    -> "true" (default) or "false" to log in per test
+    - ui.authStateDir -> directory, relative to the project root
+    - ui.authStateTtl -> seconds a saved state is trusted (default 3600)
+    """
+
+    DEFAULT_DIR = ".pytest_cache/auth"
+    DEFAULT_TTL = 3600.0
+
+    _lock = threading.Lock()
+    logins = 0
+
+    @staticmethod
+    def enabled() -> bool:
+        return str(Config.get("ui.authCache", "true")).lower() == "true"
+
+    @classmethod
+    def path(cls, username: str) -> Path:
+        root = Path(str(Config.get("ui.authStateDir", cls.DEFAULT_DIR)))
+        root = root if root.is_absolute() else Config.BASE_DIR / root
+        server = re.sub(r"\W+", "_", str(Config.get("server"))).strip("_")
+        return root / worker_id() / server / f"{username}.json"
+
+    @classmethod
+    def state(cls, browser: Browser, username: str, password: str) -> Path:
+        """Path of a fresh storage_state for the user, logging in if needed"""
+        path = cls.path(username)
+        ttl = float(Config.get("ui.authStateTtl", cls.DEFAULT_TTL))
+        with cls._lock:
+            if path.is_file() and time.time() - path.stat().st_mtime < ttl:
+                return path
+            cls._login(browser, username, password, path)
+            return path
+
+    @classmethod
+    def invalidate(cls, username: str) -> None:
+        cls.path(username).unlink(missing_ok=True)
+
+    @classmethod
+    def _login(cls, browser: Browser, username: str, password: str, path: Path):
+        context = browser.new_context()
+        try:
+            login_page = LoginPage(context.new_page()).open()
+            login_page.login(username, password)
+            if "login" in login_page.page.url.lower():
+                raise RuntimeError(f"Login as {username} failed; state not cached")
+            path.parent.mkdir(parents=True, exist_ok=True)
+            context.storage_state(path=str(path))
+        finally:
+            context.close()
+        cls.logins += 1
+        logging.info(f"Saved storage state for {username}: {path}")
+
+    @classmethod
+    def is_valid(cls, context: BrowserContext) -> bool:
+        """Cheap check of the seeded session: one cookie-authenticated REST call"""
+        server = str(Config.get("server")).rstrip("/")
+        response = context.request.get(
+            f"{server}{Config.get('apiVersion')}/server",
+            headers={"Accept": "application/json"},
+            max_redirects=0,
+        )
+        return response.status == 200
+
+    @classmethod
+    def seed(cls, new_context, browser: Browser, username: str, password: str):
+        """New context seeded with the user's cached state, re-logging in once if stale"""
+        context = new_context(storage_state=str(cls.state(browser, username, password)))
+        if not cls.is_valid(context):
+            logging.info(f"Cached storage state for {username} is stale")
+            cls.invalidate(username)
+            context.close()
+            context = new_context(
+                storage_state=str(cls.state(browser, username, password))
+            )
+        cls._watch(context, username)
+        return context
+
+    @classmethod
+    def _watch(cls, context: BrowserContext, username: str) -> None:
+        def on_response(response: Response) -> None:
+            if response.request.resource_type != "document":
+                return
+            if response.status == 401 or "/login.html" in response.url:
+                logging.info(f"Session of {username} ended; dropping its state")
+                cls.invalidate(username)
+
+        context.on("response", on_response)
@@ -0,0 +1,151 @@
+import logging
+import threading
+from typing import Callable, Dict, List, Optional, Tuple
+
+import pytest
+from playwright.sync_api import Browser, BrowserContext, Error
+
+from src.main.api.configs.config import Config
+from src.main.ui.classes.auth_state_cache import AuthStateCache
+
+
+class ContextPool:
+    """Idle browser contexts kept per worker, browser and logged-in user.
+
+    A test takes a context with acquire() and gives it back with release(),
+    which resets it cheaply instead of closing it: pages are closed, routes
+    and permissions dropped, the server origin's localStorage/sessionStorage
+    cleared (from a blank page of that origin, whichever page set them) and,
+    for anonymous contexts, cookies cleared. Logged-in contexts keep their
+    session cookie. A context is reused only while its browser is connected
+    and, if logged in, while AuthStateCache still holds that user's state.
+
+    The pool is off when pytest-playwright needs a context per test (tracing,
+    video or screenshots) and for tests marked browser_context_args. Settings:
+    - ui.contextPool.size -> idle contexts kept per browser and user
+      (default 2, 0 disables the pool)
+    """
+
+    DEFAULT_SIZE = 2
+    # pytest-playwright options that record per-context artifacts
+    ARTIFACT_OPTIONS = ("--tracing", "--video", "--screenshot")
+    # Served for the server origin while its storage is cleared
+    BLANK_PAGE = "<!doctype html><title>reset</title>"
+
+    _idle: Dict[Tuple[int, Optional[str]], List[BrowserContext]] = {}
+    _lock = threading.Lock()
+    created = 0
+    reused = 0
+
+    @classmethod
+    def size(cls) -> int:
+        return int(Config.get("ui.contextPool.size", cls.DEFAULT_SIZE))
+
+    @classmethod
+    def enabled(cls, request: pytest.FixtureRequest) -> bool:
+        if cls.size() <= 0:
+            return False
+        if request.node.get_closest_marker("browser_context_args"):
+            return False
+        return all(
+            request.config.getoption(option, default="off") == "off"
+            for option in cls.ARTIFACT_OPTIONS
+        )
+
+    @classmethod
+    def acquire(
+        cls,
+        browser: Browser,
+        username: Optional[str],
+        create: Callable[[], BrowserContext],
+    ) -> BrowserContext:
+        """Healthy idle context for the user, or a new one from create()"""
+        while True:
+            with cls._lock:
+                idle = cls._idle.get((id(browser), username))
+                context = idle.pop() if idle else None
+            if context is None:
+                cls.created += 1
+                return create()
+            if cls._healthy(browser, username, context):
+                cls.reused += 1
+                return context
+            cls._close(context)
+
+    @classmethod
+    def release(
+        cls, browser: Browser, username: Optional[str], context: BrowserContext
+    ) -> None:
+        """Reset the context and keep it, or close it when broken or the pool is full"""
+        if not cls._reset(context, keep_cookies=username is not None):
+            cls._close(context)
+            return
+        with cls._lock:
+            idle = cls._idle.setdefault((id(browser), username), [])
+            if len(idle) < cls.size():
+                idle.append(context)
+                return
+        cls._close(context)
+
+    @classmethod
+    def close(cls, browser: Browser) -> None:
+        """Close the browser's idle contexts (before the browser itself closes)"""
+        with cls._lock:
+            keys = [key for key in cls._idle if key[0] == id(browser)]
+            contexts = [context for key in keys for context in cls._idle.pop(key)]
+        for context in contexts:
+            cls._close(context)
+
+    @staticmethod
+    def _healthy(
+        browser: Browser, username: Optional[str], context: BrowserContext
+    ) -> bool:
+        if not browser.is_connected():
+            return False
+        if username is not None and not AuthStateCache.path(username).is_file():
+            # The session ended while the context was in use
+            return False
+        try:
+            context.cookies()
+        except Error:
+            return False
+        return True
+
+    @classmethod
+    def _reset(cls, context: BrowserContext, keep_cookies: bool) -> bool:
+        try:
+            for page in context.pages:
+                page.close()
+            context.unroute_all(behavior="ignoreErrors")
+            cls._clear_storage(context)
+            context.clear_permissions()
+            if not keep_cookies:
+                context.clear_cookies()
+        except Error as e:
+            logging.info(f"Browser context not reusable: {e}")
+            return False
+        return True
+
+    @classmethod
+    def _clear_storage(cls, context: BrowserContext) -> None:
+        """Clear the server origin's storage without loading a server page"""
+        server = str(Config.get("server")).rstrip("/")
+        page = context.new_page()
+        try:
+            page.route(
+                f"{server}/**",
+                lambda route: route.fulfill(
+                    content_type="text/html", body=cls.BLANK_PAGE
+                ),
+            )
+            page.goto(f"{server}/", wait_until="domcontentloaded")
+            page.evaluate("() => { localStorage.clear(); sessionStorage.clear(); }")
+        finally:
+            page.close()
+
+    @staticmethod
+    def _close(context: BrowserContext) -> None:
+        try:
+            context.close()
+        except Error:
+            pass
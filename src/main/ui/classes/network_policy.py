@@ -0,0 +1,103 @@
+import re
+from dataclasses import dataclass
+from fnmatch import fnmatch
+from typing import Iterable, Tuple
+
+import pytest
+from playwright.sync_api import BrowserContext, Route
+
+from src.main.api.configs.config import Config
+from src.main.ui.classes.asset_cache import AssetCache
+
+# "analytics" in block means requests to these URLs, whatever their type
+ANALYTICS_PATTERNS = (
+    "*google-analytics.com/*",
+    "*googletagmanager.com/*",
+    "*hotjar.com/*",
+    "*segment.io/*",
+    "*sentry.io/*",
+    "*/telemetry*",
+)
+
+
+def _glob_regex(patterns: Iterable[str]) -> "re.Pattern[str]":
+    """One regex for fnmatch-style globs, matchable by the Playwright driver"""
+    parts = (re.escape(pattern).replace(r"\*", ".*") for pattern in patterns)
+    return re.compile(f"^(?:{'|'.join(parts)})$")
+
+
+def _split(value) -> Tuple[str, ...]:
+    if isinstance(value, str):
+        value = value.split(",")
+    return tuple(str(item).strip() for item in value or () if str(item).strip())
+
+
+@dataclass(frozen=True)
+class NetworkPolicy:
+    """What a test's browser context may load.
+
+    - block: Playwright resource types to abort (image, font, media, ...)
+      plus "analytics" for ANALYTICS_PATTERNS
+    - deny:  URL globs to abort
+    - allow: URL globs exempt from block and deny
+    - cache: serve static assets through AssetCache
+
+    Defaults come from ui.network.block / ui.network.deny; a test overrides
+    them with @pytest.mark.network(block=(...), deny=(...), allow=(...),
+    cache=False).
+
+    Every routed request is a round trip to Python, so only what the policy
+    needs is routed: the analytics URLs and the server's static assets by
+    default, every request only when deny globs or resource types are set.
+    """
+
+    block: Tuple[str, ...] = ()
+    deny: Tuple[str, ...] = ()
+    allow: Tuple[str, ...] = ()
+    cache: bool = True
+
+    blocked = 0
+
+    @classmethod
+    def for_test(cls, request: pytest.FixtureRequest) -> "NetworkPolicy":
+        mark = request.node.get_closest_marker("network")
+        options = mark.kwargs if mark else {}
+        return cls(
+            block=_split(options.get("block", Config.get("ui.network.block", ""))),
+            deny=_split(options.get("deny", Config.get("ui.network.deny", ""))),
+            allow=_split(options.get("allow", ())),
+            cache=bool(options.get("cache", True)) and AssetCache.enabled(),
+        )
+
+    def apply(self, context: BrowserContext) -> None:
+        if self.deny or set(self.block) - {"analytics"}:
+            # Resource types and arbitrary globs are only known per request
+            context.route("**/*", self._handle)
+            return
+        if "analytics" in self.block:
+            context.route(_glob_regex(ANALYTICS_PATTERNS), self._handle)
+        if self.cache:
+            context.route(AssetCache.url_pattern(), self._handle)
+
+    def _handle(self, route: Route) -> None:
+        request = route.request
+        url = request.url
+        if not self._matches(url, self.allow):
+            if (
+                self._matches(url, self.deny)
+                or request.resource_type in self.block
+                or (
+                    "analytics" in self.block and self._matches(url, ANALYTICS_PATTERNS)
+                )
+            ):
+                NetworkPolicy.blocked += 1
+                route.abort("blockedbyclient")
+                return
+        if self.cache and AssetCache.cacheable(request.method, url):
+            AssetCache.serve(route)
+            return
+        route.fallback()
+
+    @staticmethod
+    def _matches(url: str, patterns: Iterable[str]) -> bool:
+        return any(fnmatch(url, pattern) for pattern in patterns)
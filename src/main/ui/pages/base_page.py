@@ -1,5 +1,4 @@
 import logging
-import time
 from abc import ABC, abstractmethod
 from typing import Callable, List, Type, TypeVar
 
@@ -12,6 +11,7 @@ from src.main.api.utils.step_logger import StepLogger
 from src.main.ui.pages.conditions import Condition
 from src.main.ui.pages.selectors import ALERT_SELECTOR
 from src.main.ui.pages.ui_element import UIElement
+from src.main.ui.pages.ui_wait import UIWait
 
 T = TypeVar("T", bound="BasePage")
 logger = logging.getLogger(__name__)
@@ -128,11 +128,10 @@ class BasePage(ABC):
 
     def should_not_have_url_part(self: T, part: str, timeout: int = 5000) -> T:
         def _action():
-            deadline = time.time() + (timeout / 1000)
-            while time.time() < deadline:
-                if part.lower() not in (self.page.url or "").lower():
-                    return self
-                time.sleep(0.1)
+            if UIWait(self.page).url(
+                lambda url: part.lower() not in url.lower(), timeout
+            ):
+                return self
             raise AssertionError(f"URL still contains '{part}': {self.page.url}")
 
         return self._step(title=f"Check URL does not contain: {part}", action=_action)
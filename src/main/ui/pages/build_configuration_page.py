@@ -149,14 +149,18 @@ class BuildConfigurationPage(BasePage):
         )
 
     def should_have_build_completed_successfully(
-        self, build_type_id: str, api_manager, timeout: int = 10
+        self,
+        build_type_id: str,
+        api_manager,
+        timeout: int = 10,
+        after_build_id: Optional[int] = None,
     ):
         """Verify build completed successfully via API. Uses short timeout since UI already confirmed."""
 
         def _action():
             try:
                 completed_build = api_manager.build_steps.get_latest_build_and_wait(
-                    build_type_id, timeout
+                    build_type_id, timeout, after_build_id
                 )
                 assert (
                     completed_build.state == "finished"
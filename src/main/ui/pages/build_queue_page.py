@@ -1,4 +1,3 @@
-import time
 from contextlib import suppress
 
 import pytest
@@ -7,39 +6,37 @@ from src.main.ui.pages.base_page import BasePage
 from src.main.ui.pages.selectors import (
     BUILD_QUEUE_BUILD_TYPE_CELL,
     BUILD_QUEUE_CANCEL_BUTTON,
+    BUILD_QUEUE_FALLBACK_ROWS,
     BUILD_QUEUE_ROWS,
     BUILD_QUEUE_TIME_CELL,
     BUILD_QUEUE_TITLE,
 )
+from src.main.ui.pages.ui_wait import UIWait
 
 
 class BuildQueuePage(BasePage):
     def url(self) -> str:
         return "/queue.html"
 
+    def _rows_selector(self) -> str:
+        if self.page.locator(BUILD_QUEUE_ROWS).count() > 0:
+            return BUILD_QUEUE_ROWS
+        return BUILD_QUEUE_FALLBACK_ROWS
+
     def _rows(self):
-        primary = self.page.locator(BUILD_QUEUE_ROWS)
-        if primary.count() > 0:
-            return primary
-        # Fallback for classic TeamCity markup when queue rows have no stable classes.
-        return self.page.locator("table tr:has(a[href*='buildTypeId'])")
+        return self.page.locator(self._rows_selector())
 
     def wait_for_rows(self, min_rows: int = 1, timeout: int = 20_000):
         def _action():
-            start = time.time()
-            while int((time.time() - start) * 1000) < timeout:
-                if self._rows().count() >= min_rows:
-                    return self
-                title = self.page.locator(BUILD_QUEUE_TITLE)
-                if title.count() > 0:
-                    title_text = (title.first.inner_text() or "").strip().lower()
-                    if (
-                        "build in queue" in title_text
-                        or "builds in queue" in title_text
-                    ):
-                        return self
-                self.page.wait_for_timeout(500)
-            raise AssertionError(f"Expected at least {min_rows} queue rows")
+            count = UIWait(self.page).count_at_least(
+                f"{BUILD_QUEUE_ROWS}, {BUILD_QUEUE_FALLBACK_ROWS}",
+                min_rows,
+                timeout,
+                or_text=(BUILD_QUEUE_TITLE, ["build in queue", "builds in queue"]),
+            )
+            if count is None:
+                raise AssertionError(f"Expected at least {min_rows} queue rows")
+            return self
 
         return self._step(
             title=f"Wait for at least {min_rows} queue rows",
@@ -81,7 +78,8 @@ class BuildQueuePage(BasePage):
 
     def cancel_first_build_for_type(self, build_type_id: str):
         def _action():
-            before = self._rows().count()
+            rows_selector = self._rows_selector()
+            before = self.page.locator(rows_selector).count()
             if before == 0:
                 pytest.skip("No visible queue rows available for cancel action")
 
@@ -103,13 +101,8 @@ class BuildQueuePage(BasePage):
             self.page.once("dialog", lambda dialog: dialog.accept())
             cancel_btn.click()
 
-            start = time.time()
-            while int((time.time() - start) * 1000) < 15_000:
-                if self._rows().count() < before:
-                    return self
-                self.page.wait_for_timeout(500)
-
             # Some TeamCity versions don't instantly refresh row count.
+            UIWait(self.page).count_below(rows_selector, before, 15_000)
             return self
 
         return self._step(
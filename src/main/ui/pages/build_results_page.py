@@ -5,13 +5,14 @@ from pathlib import Path
 from typing import Iterable
 from urllib.parse import parse_qs, urlencode, urlparse, urlunparse
 
+from src.main.api.utils.build_log_streamer import BuildLogStreamer
+from src.main.api.utils.mapped_file import MappedFile
 from src.main.ui.pages.base_page import BasePage
 from src.main.ui.pages.selectors import (
     BUILD_ARTIFACT_DOWNLOAD_LINK,
     BUILD_ARTIFACTS_LIST,
     BUILD_ARTIFACTS_TAB,
     BUILD_LOG_CONTAINER,
-    BUILD_LOG_LINE,
     BUILD_LOG_TAB,
     BUILD_LOG_TIMESTAMP,
     BUILD_RESULTS_STATUS_TEXT,
@@ -19,9 +20,17 @@ from src.main.ui.pages.selectors import (
     BUILD_STOP_CONFIRM_BUTTON,
 )
 from src.main.ui.pages.ui_element import UIElement
+from src.main.ui.pages.ui_wait import UIWait
 
 logger = logging.getLogger(__name__)
 
+STOP_SELECTORS = [
+    BUILD_STOP_BUTTON,
+    '#mainContent button:has-text("Stop")',
+    '#mainContent [class*="BuildOverviewProgress-module__stop"]',
+    '#mainContent [class*="StopBuild-module__stopBuild"]',
+]
+
 
 class BuildResultsPage(BasePage):
     def __init__(self, page, build_id: int):
@@ -60,21 +69,22 @@ class BuildResultsPage(BasePage):
                         return True
         return False
 
+    def _wait_and_click_first_visible(self, selectors: list[str], timeout: int):
+        index = UIWait(self.page).first_visible(selectors, timeout)
+        return index is not None and self._click_first_visible(selectors[index:])
+
     def open_build_log_tab(self):
         def _action():
-            start = time.time()
-            while int((time.time() - start) * 1000) < 10_000:
-                clicked = self._click_first_visible(
-                    [
-                        BUILD_LOG_TAB,
-                        '#mainContent span.ring-tabs-visible:has-text("Build Log")',
-                        '#mainContent span:has-text("Build Log")',
-                    ]
-                )
-                if clicked:
-                    self.page.wait_for_load_state("domcontentloaded", timeout=10_000)
-                    return self
-                self.page.wait_for_timeout(500)
+            if self._wait_and_click_first_visible(
+                [
+                    BUILD_LOG_TAB,
+                    '#mainContent span.ring-tabs-visible:has-text("Build Log")',
+                    '#mainContent span:has-text("Build Log")',
+                ],
+                timeout=10_000,
+            ):
+                self.page.wait_for_load_state("domcontentloaded", timeout=10_000)
+                return self
 
             # Fallback: open log tab via URL parameter.
             parsed = urlparse(self.page.url)
@@ -93,19 +103,16 @@ class BuildResultsPage(BasePage):
 
     def open_artifacts_tab(self):
         def _action():
-            start = time.time()
-            while int((time.time() - start) * 1000) < 10_000:
-                clicked = self._click_first_visible(
-                    [
-                        BUILD_ARTIFACTS_TAB,
-                        '#mainContent span.ring-tabs-visible:has-text("Artifacts")',
-                        '#mainContent span:has-text("Artifacts")',
-                    ]
-                )
-                if clicked:
-                    self.page.wait_for_load_state("domcontentloaded", timeout=10_000)
-                    return self
-                self.page.wait_for_timeout(500)
+            if self._wait_and_click_first_visible(
+                [
+                    BUILD_ARTIFACTS_TAB,
+                    '#mainContent span.ring-tabs-visible:has-text("Artifacts")',
+                    '#mainContent span:has-text("Artifacts")',
+                ],
+                timeout=10_000,
+            ):
+                self.page.wait_for_load_state("domcontentloaded", timeout=10_000)
+                return self
 
             parsed = urlparse(self.page.url)
             query = parse_qs(parsed.query)
@@ -124,35 +131,50 @@ class BuildResultsPage(BasePage):
     def should_have_realtime_log_updates(
         self,
         timeout: int = 15_000,
-        poll_interval_ms: int = 1_000,
+        sample_size: int = 2,
     ):
+        """Lines the build logs after this call show up without a reload.
+
+        New lines are read from the REST log stream; only a small sample of
+        them is looked up in the DOM instead of counting every rendered line.
+        One timeout covers the stream and the DOM checks. A build that
+        finishes after logging at least one new line passes with that line.
+        """
+
         def _action():
+            deadline = time.monotonic() + timeout / 1000
             container = self.page.locator(BUILD_LOG_CONTAINER).first
             with suppress(Exception):
                 container.wait_for(state="visible", timeout=5_000)
 
-            lines = self.page.locator(BUILD_LOG_LINE)
-            start = time.time()
-            initial_count = lines.count()
-
-            # Allow small warm-up for first lines to appear.
-            while (
-                initial_count == 0 and int((time.time() - start) * 1000) < timeout // 3
-            ):
-                self.page.wait_for_timeout(300)
-                initial_count = lines.count()
-
-            current_max = initial_count
-            while int((time.time() - start) * 1000) < timeout:
-                self.page.wait_for_timeout(poll_interval_ms)
-                current_count = lines.count()
-                if current_count > current_max:
-                    return self
-                current_max = max(current_max, current_count)
-
-            raise AssertionError(
-                f"Build log did not update in realtime: initial={initial_count}, final={current_max}"
-            )
+            streamer = BuildLogStreamer(self.build_id)
+            streamer.read_new()  # skip what was logged before the check
+            new_lines = []
+            with suppress(TimeoutError):
+                for line in streamer.lines(max(0.0, deadline - time.monotonic())):
+                    if line.message:
+                        new_lines.append(line)
+                    if len(new_lines) >= sample_size:
+                        break
+            if not new_lines:
+                raise AssertionError(
+                    f"Build {self.build_id} logged no new lines within "
+                    f"{timeout} ms; stream: {streamer.metrics}"
+                )
+            wait = UIWait(self.page)
+            for line in new_lines:
+                remaining = int((deadline - time.monotonic()) * 1000)
+                if not wait.text_contains_any(
+                    f"{BUILD_LOG_CONTAINER}, #mainContent",
+                    [line.message],
+                    # at least one check, even when the stream used the budget
+                    max(remaining, UIWait.POLLING_MS),
+                ):
+                    raise AssertionError(
+                        f"Build log did not update in realtime: '{line.message}' "
+                        f"(line {line.number}) not shown; stream: {streamer.metrics}"
+                    )
+            return self
 
         return self._step(
             title=f"Check realtime log updates for build {self.build_id}",
@@ -175,31 +197,11 @@ class BuildResultsPage(BasePage):
 
     def stop_running_build(self):
         def _action():
-            start = time.time()
-            clicked = False
-            while int((time.time() - start) * 1000) < 10_000 and not clicked:
-                clicked = self._click_first_visible(
-                    [
-                        BUILD_STOP_BUTTON,
-                        '#mainContent button:has-text("Stop")',
-                        '#mainContent [class*="BuildOverviewProgress-module__stop"]',
-                        '#mainContent [class*="StopBuild-module__stopBuild"]',
-                    ]
-                )
-                if not clicked:
-                    self.page.wait_for_timeout(500)
-
+            clicked = self._wait_and_click_first_visible(STOP_SELECTORS, 10_000)
             if not clicked:
                 # In some layouts stop control is only visible on Build Log tab.
                 self.open_build_log_tab()
-                clicked = self._click_first_visible(
-                    [
-                        BUILD_STOP_BUTTON,
-                        '#mainContent button:has-text("Stop")',
-                        '#mainContent [class*="BuildOverviewProgress-module__stop"]',
-                        '#mainContent [class*="StopBuild-module__stopBuild"]',
-                    ]
-                )
+                clicked = self._click_first_visible(STOP_SELECTORS)
 
             if not clicked:
                 raise AssertionError(
@@ -207,13 +209,13 @@ class BuildResultsPage(BasePage):
                 )
 
             # Some TeamCity skins use an in-page confirm control.
-            self.page.wait_for_timeout(500)
-            self._click_first_visible(
+            self._wait_and_click_first_visible(
                 [
                     BUILD_STOP_CONFIRM_BUTTON,
                     '#stopBuildFormDialog input[value="Stop"]',
                     "#stopBuildFormDialog .submitButton",
-                ]
+                ],
+                timeout=1_000,
             )
 
             return self
@@ -229,14 +231,8 @@ class BuildResultsPage(BasePage):
         allowed = [status.lower() for status in allowed_statuses]
 
         def _action():
-            start = time.time()
-            while int((time.time() - start) * 1000) < timeout:
-                page_text = (
-                    self.page.locator("#mainContent").inner_text() or ""
-                ).lower()
-                if any(status in page_text for status in allowed):
-                    return self
-                self.page.wait_for_timeout(500)
+            if UIWait(self.page).text_contains_any("#mainContent", allowed, timeout):
+                return self
 
             raise AssertionError(
                 f"Expected one of statuses {list(allowed_statuses)} in UI"
@@ -287,3 +283,20 @@ class BuildResultsPage(BasePage):
         self.last_download_path = target_path
         logger.info("Artifact downloaded to %s", target_path)
         return target_path
+
+    def downloaded_artifact_should_contain(self, pattern: bytes):
+        """Search the last download through a memory map, not read into memory"""
+
+        def _action():
+            assert self.last_download_path is not None, "No artifact downloaded yet"
+            with MappedFile(self.last_download_path) as artifact:
+                assert artifact.contains(pattern), (
+                    f"{pattern!r} not found in {self.last_download_path} "
+                    f"({len(artifact)} bytes)"
+                )
+            return self
+
+        return self._step(
+            title=f"Check downloaded artifact contains {pattern!r}",
+            action=_action,
+        )
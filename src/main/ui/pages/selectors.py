@@ -30,6 +30,8 @@ BUILD_RUN_BUTTON = '[data-test="run-build"], button:has-text("Run"), .runButton'
 BUILD_STATUS_INDICATOR = '[data-test="build-status"], .build-status, .statusIcon'
 BUILD_STATE_TEXT = '[data-test="build-state"], .buildStateText, .status-text'
 BUILD_QUEUE_ROWS = '[data-test="queue-row"], .buildQueueRow, table tr:has(td)'
+# Classic TeamCity markup, when queue rows have no stable classes
+BUILD_QUEUE_FALLBACK_ROWS = "table tr:has(a[href*='buildTypeId'])"
 BUILD_QUEUE_TITLE = '[data-test="queue-title"], .queueTitle, h1'
 BUILD_QUEUE_BUILD_TYPE_CELL = (
     '[data-test="build-type-cell"], td:first-child, .buildTypeName'
@@ -1,8 +1,9 @@
 import logging
-import time
 
 from playwright.sync_api import Locator
 
+from src.main.ui.pages.ui_wait import UIWait
+
 logger = logging.getLogger(__name__)
 
 
@@ -46,13 +47,8 @@ class UIElement:
     def wait_for_text_not_empty(self, timeout: int = 5000) -> str:
         """Wait until element text becomes non-empty."""
         self.locator.wait_for(state="visible", timeout=timeout)
-        start_time = time.time()
-        while time.time() - start_time < timeout / 1000:
-            text = self.locator.inner_text().strip()
-            if text:
-                return text
-            time.sleep(0.1)
-        return self.locator.inner_text()
+        text = UIWait(self.locator.page).element_text(self.locator, timeout)
+        return text if text is not None else self.locator.inner_text()
 
     def is_visible(self) -> bool:
         return self.locator.is_visible()
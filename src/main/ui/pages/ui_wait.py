@@ -0,0 +1,194 @@
+import time
+from typing import Any, Callable, Iterable, Optional
+
+from playwright.sync_api import Locator, Page
+from playwright.sync_api import TimeoutError as PlaywrightTimeoutError
+
+# Elements matching a selector list. Top-level comma parts are queried one by
+# one, so a part the browser cannot parse is skipped instead of failing the
+# whole list; a trailing Playwright :has-text("...") becomes a case-insensitive
+# substring filter on the text content.
+_QUERY_JS = r"""
+(selector) => {
+    const found = new Set();
+    for (let part of selector.split(/,(?![^()]*\))/)) {
+        part = part.trim();
+        let text = null;
+        const match = part.match(/:has-text\((['"])(.*)\1\)$/);
+        if (match) {
+            text = match[2].toLowerCase();
+            part = part.slice(0, match.index) || "*";
+        }
+        let nodes;
+        try {
+            nodes = document.querySelectorAll(part);
+        } catch (e) {
+            continue;
+        }
+        for (const node of nodes) {
+            const content = (node.textContent || "").replace(/\s+/g, " ").toLowerCase();
+            if (text === null || content.includes(text)) found.add(node);
+        }
+    }
+    return [...found];
+}
+"""
+
+# Same rule as Playwright: a non-empty box and not visibility:hidden
+_VISIBLE_JS = r"""
+(node) => {
+    const box = node.getBoundingClientRect();
+    return box.width > 0 && box.height > 0
+        && getComputedStyle(node).visibility !== "hidden";
+}
+"""
+
+_COUNT_JS = f"""
+({{ selector, atLeast, below, textSelector, needles }}) => {{
+    const query = {_QUERY_JS};
+    const count = query(selector).length;
+    if (atLeast !== null && count >= atLeast) return {{ count }};
+    if (below !== null && count < below) return {{ count }};
+    if (textSelector) {{
+        const text = query(textSelector).map((n) => n.innerText || "").join("\\n");
+        const lower = text.toLowerCase();
+        if (needles.some((needle) => lower.includes(needle))) return {{ count }};
+    }}
+    return null;
+}}
+"""
+
+_TEXT_ANY_JS = f"""
+({{ selector, needles }}) => {{
+    const query = {_QUERY_JS};
+    const text = query(selector).map((n) => n.innerText || "").join("\\n").toLowerCase();
+    return needles.find((needle) => text.includes(needle)) || null;
+}}
+"""
+
+_FIRST_VISIBLE_JS = f"""
+(selectors) => {{
+    const query = {_QUERY_JS};
+    const visible = {_VISIBLE_JS};
+    const index = selectors.findIndex((selector) => query(selector).some(visible));
+    return index >= 0 ? {{ index }} : null;
+}}
+"""
+
+_ELEMENT_TEXT_JS = """
+(node) => {
+    if (!node.isConnected) return { detached: true };
+    const text = (node.innerText || "").trim();
+    return text ? { text } : null;
+}
+"""
+
+
+class UIWait:
+    """Waits evaluated inside the browser with page.wait_for_function.
+
+    The condition is re-checked in the page every POLLING_MS, so a wait costs
+    one round trip instead of a count()/inner_text() call per tick. Each wait
+    returns its result, or None when the timeout (ms) passes; callers decide
+    whether that is a failure. Selectors are CSS lists, optionally with a
+    trailing :has-text("...") per part.
+    """
+
+    POLLING_MS = 100
+
+    def __init__(self, page: Page):
+        self.page = page
+
+    def count_at_least(
+        self,
+        selector: str,
+        minimum: int,
+        timeout: int,
+        or_text: Optional[tuple[str, Iterable[str]]] = None,
+    ) -> Optional[int]:
+        """Element count once it reaches minimum, or as soon as the text
+        of or_text=(selector, needles) contains a needle"""
+        return self._count(selector, timeout, at_least=minimum, or_text=or_text)
+
+    def count_below(self, selector: str, limit: int, timeout: int) -> Optional[int]:
+        return self._count(selector, timeout, below=limit)
+
+    def count_increased(
+        self, selector: str, baseline: int, timeout: int
+    ) -> Optional[int]:
+        """Element count once it exceeds baseline, e.g. new log lines"""
+        return self._count(selector, timeout, at_least=baseline + 1)
+
+    def text_contains_any(
+        self, selector: str, needles: Iterable[str], timeout: int
+    ) -> Optional[str]:
+        """First needle found (case-insensitively) in the elements' text"""
+        return self._wait(
+            _TEXT_ANY_JS,
+            {"selector": selector, "needles": [n.lower() for n in needles]},
+            timeout,
+        )
+
+    def first_visible(self, selectors: list[str], timeout: int) -> Optional[int]:
+        """Index of the first selector with a visible match"""
+        result = self._wait(_FIRST_VISIBLE_JS, selectors, timeout)
+        return result["index"] if result else None
+
+    def element_text(self, locator: Locator, timeout: int) -> Optional[str]:
+        """Non-empty inner text of the element; re-resolved if it is re-rendered"""
+        deadline = time.monotonic() + timeout / 1000
+        while True:
+            remaining = int((deadline - time.monotonic()) * 1000)
+            if remaining <= 0:
+                return None
+            try:
+                handle = locator.element_handle(timeout=remaining)
+            except PlaywrightTimeoutError:
+                return None
+            result = self._wait(_ELEMENT_TEXT_JS, handle, remaining)
+            handle.dispose()
+            if result is None:
+                return None
+            if "text" in result:
+                return result["text"]
+
+    def url(self, predicate: Callable[[str], bool], timeout: int) -> Optional[str]:
+        """Current URL once predicate(url) holds; driven by navigation events"""
+        try:
+            self.page.wait_for_url(predicate, timeout=timeout, wait_until="commit")
+        except PlaywrightTimeoutError:
+            return None
+        return self.page.url
+
+    def _count(
+        self,
+        selector: str,
+        timeout: int,
+        at_least: Optional[int] = None,
+        below: Optional[int] = None,
+        or_text: Optional[tuple[str, Iterable[str]]] = None,
+    ) -> Optional[int]:
+        text_selector, needles = or_text or (None, ())
+        result = self._wait(
+            _COUNT_JS,
+            {
+                "selector": selector,
+                "atLeast": at_least,
+                "below": below,
+                "textSelector": text_selector,
+                "needles": [n.lower() for n in needles],
+            },
+            timeout,
+        )
+        return result["count"] if result else None
+
+    def _wait(self, expression: str, arg: Any, timeout: int) -> Any:
+        try:
+            handle = self.page.wait_for_function(
+                expression, arg=arg, polling=self.POLLING_MS, timeout=timeout
+            )
+        except PlaywrightTimeoutError:
+            return None
+        value = handle.json_value()
+        handle.dispose()
+        return value
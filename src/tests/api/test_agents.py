@@ -3,6 +3,7 @@ import pytest
 from src.main.api.classes.api_manager import ApiManager
 
 
+@pytest.fixture
 def agent_with_state(api_manager: ApiManager):
     """
     Fixture that provides an agent and restores its state after test.
@@ -21,6 +22,7 @@ def agent_with_state(api_manager: ApiManager):
 
 
 @pytest.mark.api
+@pytest.mark.exclusive("agents")
 class TestAgentsPositive:
     def test_get_list_of_available_agents_success(self, api_manager: ApiManager):
         agents = api_manager.agent_steps.get_all_agents()
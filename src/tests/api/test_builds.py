@@ -1,9 +1,13 @@
+from pathlib import Path
+
 import pytest
 
 from src.main.api.classes.api_manager import ApiManager
 from src.main.api.models.alert_messages import AlertMessages
 from src.main.api.models.build_response import BuildResponse
 from src.main.api.models.start_build_request import BuildTypeRef, StartBuildRequest
+from src.main.api.utils.build_log_streamer import BuildLogStreamer
+from src.main.api.utils.mapped_file import MappedFile
 
 
 @pytest.mark.api
@@ -57,6 +61,29 @@ class TestGetBuildPositive:
         ], f"Invalid state: {retrieved_build.state}"
         assert retrieved_build.status is not None, "Status should not be None"
 
+    def test_build_log_streams_in_realtime(
+        self,
+        api_manager: ApiManager,
+        long_running_build_type: tuple[str, str],
+        build_tracker: list[int],
+    ):
+        build_type_id, _ = long_running_build_type
+        build = api_manager.build_steps.trigger_build(build_type_id)
+        build_tracker.append(build.id)
+
+        streamer = BuildLogStreamer(build.id)
+        progress = []
+        for line in streamer.lines(timeout=120):
+            if line.message.startswith("Progress"):
+                progress.append(line)
+            if len(progress) == 3:
+                break
+
+        assert len(progress) == 3, f"Expected progress lines, got: {progress}"
+        assert (
+            progress[-1].received_at > progress[0].received_at
+        ), f"Log lines arrived in one batch, not in realtime: {streamer.metrics}"
+
     def test_get_builds_by_buildtype_success(
         self,
         api_manager: ApiManager,
@@ -71,6 +98,30 @@ class TestGetBuildPositive:
         for build_id in build_ids:
             assert build_id in retrieved_ids, f"Build {build_id} not found in results"
 
+    def test_download_build_artifacts_success(
+        self,
+        api_manager: ApiManager,
+        artifact_build_type: tuple[str, str],
+        tmp_path: Path,
+    ):
+        build_type_id, _ = artifact_build_type
+        build = api_manager.build_steps.trigger_build(build_type_id)
+        api_manager.build_steps.wait_for_build_completion(build.id, timeout=240)
+
+        artifacts = api_manager.build_steps.list_artifacts(build.id)
+        assert [artifact.fullName for artifact in artifacts] == [
+            "result.txt"
+        ], f"Unexpected artifacts: {artifacts}"
+
+        (result,) = api_manager.build_steps.download_artifacts(
+            build.id, tmp_path, artifacts
+        )
+        result.verify(sha256=MappedFile.file_digest(result.path))
+        with MappedFile(result.path) as artifact:
+            assert (
+                artifact.find(b"Artifact created") == 0
+            ), f"Unexpected artifact content: {artifact.line_at(0)!r}"
+
     def test_get_build_status_success(self, api_manager: ApiManager, build_type: str):
         build = api_manager.build_steps.trigger_build(build_type)
         completed_build = api_manager.build_steps.wait_for_build_completion(build.id)
@@ -104,6 +155,7 @@ class TestBuildQueuePositive:
                 "finished",
             ], f"Build {build.id} not in queue and not running/finished"
 
+    @pytest.mark.exclusive("build_queue")
     def test_cancel_queued_build_success(
         self, api_manager: ApiManager, queued_build: BuildResponse
     ):
@@ -1,4 +1,3 @@
-import time
 from typing import Iterable
 
 import pytest
@@ -6,6 +5,8 @@ import pytest
 from src.main.api.classes.api_manager import ApiManager
 from src.main.api.models.build_response import BuildResponse
 
+BUILD_FIELDS = "id,buildTypeId,state,status,statusText"
+
 
 def wait_for_build_state(
     api_manager: ApiManager,
@@ -14,16 +15,24 @@ def wait_for_build_state(
     timeout: int = 120,
 ) -> BuildResponse:
     expected = {state.lower() for state in expected_states}
-    start = time.time()
-    while (time.time() - start) < timeout:
-        build = api_manager.build_steps.get_build_by_id(
-            build_id,
-            fields="id,buildTypeId,state,status,statusText",
+    try:
+        return next(
+            api_manager.build_steps.wait_for_builds(
+                [build_id],
+                lambda build: build.state.lower() in expected,
+                timeout=timeout,
+                fields=BUILD_FIELDS,
+            )
         )
-        if build.state.lower() in expected:
-            return build
-        time.sleep(1)
-    raise TimeoutError(f"Build {build_id} did not reach states {expected_states}")
+    except TimeoutError:
+        raise TimeoutError(f"Build {build_id} did not reach states {expected_states}")
+
+
+def _is_canceled(build: BuildResponse) -> bool:
+    status_text = (build.statusText or "").lower()
+    return build.state == "finished" and (
+        "cancel" in status_text or "stop" in status_text
+    )
 
 
 def wait_for_canceled_build(
@@ -31,20 +40,15 @@ def wait_for_canceled_build(
     build_ids: list[int],
     timeout: int = 120,
 ) -> BuildResponse:
-    start = time.time()
-    while (time.time() - start) < timeout:
-        for build_id in build_ids:
-            build = api_manager.build_steps.get_build_by_id(
-                build_id,
-                fields="id,buildTypeId,state,status,statusText",
+    try:
+        # First build of the set to settle as canceled/stopped
+        return next(
+            api_manager.build_steps.wait_for_builds(
+                build_ids, _is_canceled, timeout=timeout, fields=BUILD_FIELDS
             )
-            status_text = (build.statusText or "").lower()
-            if build.state == "finished" and (
-                "cancel" in status_text or "stop" in status_text
-            ):
-                return build
-        time.sleep(1)
-    raise TimeoutError(f"No canceled/stopped build found for ids {build_ids}")
+        )
+    except TimeoutError:
+        raise TimeoutError(f"No canceled/stopped build found for ids {build_ids}")
 
 
 def trigger_build_ids(
@@ -52,10 +56,8 @@ def trigger_build_ids(
     build_type_id: str,
     count: int,
 ) -> list[int]:
-    build_ids: list[int] = []
-    for _ in range(count):
-        build_ids.append(api_manager.build_steps.trigger_build(build_type_id).id)
-    return build_ids
+    builds = api_manager.build_steps.trigger_builds(build_type_id, count)
+    return [build.id for build in builds]
 
 
 def ensure_any_queued_or_skip(
@@ -63,29 +65,41 @@ def ensure_any_queued_or_skip(
     build_ids: list[int],
     timeout: int = 60,
 ) -> None:
-    start = time.time()
-    while (time.time() - start) < timeout:
-        states = [
-            api_manager.build_steps.get_build_by_id(
-                build_id,
-                fields="id,buildTypeId,state,status,statusText",
-            ).state
-            for build_id in build_ids
-        ]
-        if any(state == "queued" for state in states):
-            return
-        time.sleep(1)
+    try:
+        # Running builds block; the first queued one wins, all finished -> skip
+        for build in api_manager.build_steps.wait_for_builds(
+            build_ids,
+            lambda found: found.state != "running",
+            timeout=timeout,
+            fields=BUILD_FIELDS,
+        ):
+            if build.state == "queued":
+                return
+    except TimeoutError:
+        pass
     pytest.skip("No queued builds found for queue UI validation")
 
 
 def cleanup_triggered_builds(api_manager: ApiManager, build_ids: list[int]) -> None:
     tracked = api_manager.build_steps.created_objects
+    try:
+        states = {
+            build.id: build.state
+            for build in api_manager.build_steps.get_builds_by_ids(
+                build_ids, BUILD_FIELDS
+            )
+        }
+    except Exception:
+        # Batch lookup failed: each build is looked up on its own below
+        states = {}
+
     for build_id in build_ids:
         try:
-            state = api_manager.build_steps.get_build_by_id(
-                build_id,
-                fields="id,buildTypeId,state,status,statusText",
-            ).state
+            state = states.get(build_id)
+            if state is None:
+                state = api_manager.build_steps.get_build_by_id(
+                    build_id, fields=BUILD_FIELDS
+                ).state
             if state == "queued":
                 api_manager.build_steps.cancel_queued_build(
                     build_id, comment="Queue test cleanup"
@@ -95,7 +109,8 @@ def cleanup_triggered_builds(api_manager: ApiManager, build_ids: list[int]) -> N
                     build_id, comment="Queue test cleanup"
                 )
         except Exception:
-            pass
+            # State unknown or cancel failed: leave it to generic object cleanup
+            continue
 
         # Remove this build from generic object cleanup to avoid delete-on-running failures.
         for obj in list(tracked):
@@ -4,6 +4,7 @@ import pytest
 from playwright.sync_api import Page
 
 from src.main.api.classes.api_manager import ApiManager
+from src.main.api.utils.mapped_file import MappedFile
 from src.main.ui.pages.build_configuration_page import BuildConfigurationPage
 from src.main.ui.pages.build_queue_page import BuildQueuePage
 from src.main.ui.pages.build_results_page import BuildResultsPage
@@ -26,11 +27,14 @@ class TestBuilds:
         build_type: tuple[str, str],
     ):
         build_type_id, project_id = build_type
+        previous_build_id = api_manager.build_steps.latest_build_id(build_type_id)
         (
             BuildConfigurationPage(page, build_type_id, project_id)
             .open()
             .run_build()
-            .should_have_build_completed_successfully(build_type_id, api_manager)
+            .should_have_build_completed_successfully(
+                build_type_id, api_manager, after_build_id=previous_build_id
+            )
             .should_show_status(TeamCityAlert.BUILD_STATUS_SUCCESS.value)
         )
 
@@ -109,7 +113,24 @@ class TestBuilds:
         assert (
             artifact_path.stat().st_size > 0
         ), f"Downloaded artifact is empty: {artifact_path}"
+        results_page.downloaded_artifact_should_contain(b"Artifact created")
 
+        # The browser checks one link; the same file over REST must match it
+        api_copies = {
+            result.path.name: result
+            for result in api_manager.build_steps.download_artifacts(
+                build.id, tmp_path / "api"
+            )
+        }
+        assert (
+            artifact_path.name in api_copies
+        ), f"{artifact_path.name} not in REST artifacts: {sorted(api_copies)}"
+        api_copies[artifact_path.name].verify(
+            size=artifact_path.stat().st_size,
+            sha256=MappedFile.file_digest(artifact_path),
+        )
+
+    @pytest.mark.exclusive("build_queue")
     def test_view_build_queue(
         self,
         api_manager: ApiManager,
@@ -118,7 +139,11 @@ class TestBuilds:
         build_tracker: list[int],
     ):
         build_type_id, _ = long_running_build_type
-        build_ids = trigger_build_ids(api_manager, build_type_id, count=4)
+        build_ids = trigger_build_ids(
+            api_manager,
+            build_type_id,
+            count=api_manager.agent_steps.builds_to_saturate(),
+        )
         build_tracker.extend(build_ids)
         ensure_any_queued_or_skip(api_manager, build_ids, timeout=60)
 
@@ -0,0 +1,11 @@
+import pytest
+
+
+@pytest.fixture(autouse=True)
+def admin_session_autologin():
+    """Unit tests need no browser: shadows the page-based autologin fixture"""
+
+
+@pytest.fixture(autouse=True)
+def exclusive_resource_lock():
+    """Unit tests touch no server resources"""
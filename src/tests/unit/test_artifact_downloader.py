@@ -0,0 +1,118 @@
+import asyncio
+import hashlib
+import re
+import threading
+from http.server import BaseHTTPRequestHandler, ThreadingHTTPServer
+
+import pytest
+
+from src.main.api.models.artifact_response import ArtifactFile, ArtifactHref
+from src.main.api.utils.artifact_downloader import ArtifactDownloader
+
+BODY = bytes(range(256)) * 256
+
+
+def _handler(ranges: bool, short: int = 0):
+    class Handler(BaseHTTPRequestHandler):
+        def do_GET(self):
+            match = re.fullmatch(r"bytes=(\d+)-(\d+)", self.headers.get("Range", ""))
+            if ranges and match:
+                first, last = int(match[1]), int(match[2])
+                # short drops bytes from each part, with a matching Content-Length
+                body = BODY[first : last + 1 - short]
+                self.send_response(206)
+                self.send_header("Content-Range", f"bytes {first}-{last}/{len(BODY)}")
+            else:
+                body = BODY
+                self.send_response(200)
+            self.send_header("Content-Length", str(len(body)))
+            self.end_headers()
+            self.wfile.write(body)
+
+        def log_message(self, *args):
+            pass
+
+    return Handler
+
+
+def _serve(monkeypatch, handler):
+    server = ThreadingHTTPServer(("127.0.0.1", 0), handler)
+    threading.Thread(target=server.serve_forever, daemon=True).start()
+    url = f"http://127.0.0.1:{server.server_port}/artifact"
+    monkeypatch.setattr(ArtifactDownloader, "content_url", lambda self, name: url)
+    downloader = ArtifactDownloader(build_id=1)
+    downloader.chunk_size = 1024
+    return server, downloader
+
+
+@pytest.fixture(params=[True, False], ids=["ranges", "no-ranges"])
+def downloader(request, monkeypatch):
+    server, downloader = _serve(monkeypatch, _handler(ranges=request.param))
+    yield downloader
+    server.shutdown()
+    server.server_close()
+
+
+@pytest.fixture
+def short_downloader(monkeypatch):
+    server, downloader = _serve(monkeypatch, _handler(ranges=True, short=10))
+    yield downloader
+    server.shutdown()
+    server.server_close()
+
+
+def _in_running_loop(call):
+    # As under Playwright's sync API: the caller's thread has a running loop
+    async def caller():
+        return call()
+
+    return asyncio.run(caller())
+
+
+@pytest.mark.unit
+class TestArtifactDownloader:
+    def test_fetch_ranged_inside_running_loop(self, downloader, tmp_path):
+        result = _in_running_loop(
+            lambda: downloader.fetch_ranged("big.bin", tmp_path / "big.bin", len(BODY))
+        )
+
+        result.verify(size=len(BODY), sha256=hashlib.sha256(BODY).hexdigest())
+        assert (tmp_path / "big.bin").read_bytes() == BODY
+        assert not list(tmp_path.glob("*.part")), "Temporary parts must be renamed"
+
+    def test_download_all_inside_running_loop(self, downloader, tmp_path):
+        artifacts = [
+            ArtifactFile(
+                name=name,
+                fullName=f"dir/{name}",
+                size=len(BODY),
+                content=ArtifactHref(href=name),
+            )
+            for name in ("a.bin", "b.bin", "c.bin")
+        ]
+
+        results = _in_running_loop(lambda: downloader.download_all(tmp_path, artifacts))
+
+        assert [result.name for result in results] == [a.fullName for a in artifacts]
+        for result in results:
+            result.verify(size=len(BODY), sha256=hashlib.sha256(BODY).hexdigest())
+
+    def test_short_range_fails_the_download(self, short_downloader, tmp_path):
+        with pytest.raises(AssertionError, match="expected .* bytes, got"):
+            short_downloader.fetch_ranged("big.bin", tmp_path / "big.bin", len(BODY))
+
+        assert not list(tmp_path.iterdir()), "A failed download must leave no file"
+
+    @pytest.mark.parametrize(
+        "name", ["../escape.bin", "dir/../../escape.bin", "/escape.bin", ""]
+    )
+    def test_names_outside_target_dir_are_rejected(self, tmp_path, name):
+        downloader = ArtifactDownloader(build_id=1)
+        target_dir = tmp_path / "artifacts"
+        artifact = ArtifactFile(name="escape.bin", fullName=name, size=len(BODY))
+
+        with pytest.raises(ValueError, match="points outside"):
+            downloader.download(artifact, target_dir)
+        with pytest.raises(ValueError, match="points outside"):
+            downloader.download_all(target_dir, [artifact])
+        assert not (tmp_path / "escape.bin").exists()
@@ -0,0 +1,47 @@
+import asyncio
+
+import pytest
+
+from src.main.api.requests.skeleton.async_session_pool import AsyncSessionPool
+
+
+async def _answer():
+    await asyncio.sleep(0)
+    return 42
+
+
+@pytest.mark.unit
+class TestAsyncSessionPoolRun:
+    def test_run_without_running_loop(self):
+        assert AsyncSessionPool.run(_answer()) == 42
+
+    def test_run_while_a_loop_is_running(self):
+        # Playwright's sync API keeps its loop set as running in the test thread
+        async def caller():
+            return AsyncSessionPool.run(_answer())
+
+        assert asyncio.run(caller()) == 42
+
+    def test_failed_gather_cancels_siblings_before_closing_clients(self):
+        events = []
+
+        async def sibling():
+            AsyncSessionPool.get("http://localhost:1")
+            try:
+                await asyncio.sleep(10)
+            except asyncio.CancelledError:
+                events.append(("cancelled", len(AsyncSessionPool._clients)))
+                raise
+
+        async def failing():
+            await asyncio.sleep(0)
+            raise ValueError("boom")
+
+        async def fan_out():
+            await asyncio.gather(sibling(), failing())
+
+        with pytest.raises(ValueError, match="boom"):
+            AsyncSessionPool.run(fan_out())
+
+        assert events == [("cancelled", 1)], "Sibling must stop before clients close"
+        assert not AsyncSessionPool._clients, "Clients of the loop must be closed"
@@ -0,0 +1,109 @@
+import time
+
+import pytest
+
+from src.main.api.models.build_response import BuildResponse
+from src.main.api.steps.build_steps import BuildSteps
+from src.main.api.utils.build_state_cache import (
+    BuildStateCache,
+    BuildStateCacheUnavailable,
+)
+
+
+def _build(build_id: int, state: str) -> BuildResponse:
+    return BuildResponse(id=build_id, buildTypeId="Bt", state=state)
+
+
+class FakeServer:
+    """Build 1 runs for a few ticks, then finishes; counts calls per endpoint"""
+
+    def __init__(self, ticks_running: int = 3, failing: bool = False):
+        self.ticks_running = ticks_running
+        self.failing = failing
+        self.calls = {"queue": 0, "recent": 0, "ids": 0}
+
+    def queue(self):
+        self.calls["queue"] += 1
+        return []
+
+    def recent(self):
+        self.calls["recent"] += 1
+        return []
+
+    def ids(self, build_ids):
+        self.calls["ids"] += 1
+        if self.failing:
+            raise ConnectionError("server down")
+        state = "running" if self.calls["ids"] <= self.ticks_running else "finished"
+        return [_build(build_id, state) for build_id in build_ids]
+
+
+@pytest.fixture
+def server():
+    return FakeServer()
+
+
+@pytest.fixture
+def cache(server):
+    cache = BuildStateCache(server.queue, server.recent, server.ids)
+    cache.interval = cache.max_interval = 0.01
+    return cache
+
+
+@pytest.mark.unit
+class TestBuildStateCache:
+    def test_single_waiter_costs_one_request_per_tick(self, cache, server):
+        build = cache.wait(1, lambda b: b.state == "finished", timeout=5)
+
+        assert build.state == "finished"
+        assert server.calls == {"queue": 0, "recent": 0, "ids": 4}
+        assert cache.requests == 4
+
+    def test_many_watched_builds_read_the_lists(self, cache, server):
+        cache.direct_ids = 1
+
+        builds = list(cache.wait_many([1, 2], lambda b: b.state == "finished", 5))
+
+        assert sorted(build.id for build in builds) == [1, 2]
+        assert server.calls["queue"] == server.calls["recent"] > 0
+
+    def test_recovers_after_cooldown(self, cache, server):
+        server.failing = True
+        cache.cooldown = 0.2
+
+        with pytest.raises(BuildStateCacheUnavailable):
+            cache.wait(1, lambda b: b.state == "finished", timeout=5)
+        assert not cache.available
+
+        server.failing = False
+        with pytest.raises(BuildStateCacheUnavailable):
+            cache.wait(1, lambda b: b.state == "finished", timeout=5)
+
+        time.sleep(cache.cooldown)
+        assert cache.wait(1, lambda b: b.state == "finished", timeout=5)
+
+
+@pytest.mark.unit
+class TestLatestBuildFromCache:
+    def test_stale_cached_build_is_skipped(self, monkeypatch):
+        queue_calls = []
+
+        def queue():
+            queue_calls.append(1)
+            # The build the test triggered shows up on the third tick
+            return [_build(7, "queued")] if len(queue_calls) >= 3 else []
+
+        cache = BuildStateCache(queue, lambda: [], lambda ids: [])
+        cache.interval = cache.max_interval = 0.01
+        with cache._lock:
+            # Left over from an earlier test on the same pooled build type
+            cache._store(_build(5, "finished"), time.monotonic())
+
+        steps = BuildSteps([])
+        monkeypatch.setattr(BuildSteps, "_state_cache", classmethod(lambda c: cache))
+        monkeypatch.setattr(steps, "latest_build_id", lambda *args: None)
+        monkeypatch.setattr(
+            steps, "wait_for_build_completion", lambda build_id, timeout: build_id
+        )
+
+        assert steps.get_latest_build_and_wait("Bt", timeout=5) == 7
@@ -0,0 +1,57 @@
+import threading
+from collections import deque
+
+import pytest
+
+from src.main.api.utils.build_type_pool import BuildTypePool, PooledBuildType
+
+
+@pytest.fixture
+def pool(monkeypatch):
+    pool = BuildTypePool()
+    pool.failures = 0
+    created = threading.Event()
+
+    def create(profile):
+        if pool.failures:
+            pool.failures -= 1
+            raise ConnectionError("server down")
+        created.set()
+        return PooledBuildType(profile, project=None, build_type_id=f"Bt_{profile}")
+
+    monkeypatch.setattr(pool, "_create", create)
+    pool.created = created
+    yield pool
+    pool._closed = True
+    pool._wake.set()
+
+
+def _refill(pool: BuildTypePool) -> threading.Thread:
+    with pool._lock:
+        pool._idle.setdefault("simple", deque())
+        pool._refilling["simple"] = True
+    pool._ensure_filler()
+    return pool._thread
+
+
+@pytest.mark.unit
+class TestBuildTypePoolRefill:
+    def test_filler_backs_off_and_restarts_after_giving_up(self, pool):
+        pool.failures = BuildTypePool.MAX_FAILURES
+
+        _refill(pool).join(timeout=10)
+
+        assert pool._thread is None, "A stopped filler must be restartable"
+        assert not pool.created.is_set()
+
+        _refill(pool)
+
+        assert pool.created.wait(timeout=10), "Restarted filler must create pairs"
+
+    def test_filler_retries_a_transient_failure(self, pool):
+        pool.failures = 1
+
+        _refill(pool)
+
+        assert pool.created.wait(timeout=10)
+        assert pool._thread is not None
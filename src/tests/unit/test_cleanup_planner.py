@@ -0,0 +1,88 @@
+import pytest
+
+from src.main.api.utils import cleanup_planner
+from src.main.api.utils.cleanup_planner import CleanupPlanner, CleanupTarget
+
+
+@pytest.fixture
+def deleted(monkeypatch):
+    calls = []
+
+    def recorder(kind):
+        def delete(target_id):
+            if target_id == "broken":
+                raise RuntimeError("404")
+            calls.append((kind, target_id))
+
+        return delete
+
+    for kind in list(cleanup_planner._DELETES):
+        monkeypatch.setitem(cleanup_planner._DELETES, kind, recorder(kind))
+    return calls
+
+
+def _plan(*targets):
+    return CleanupPlanner.from_targets(targets)
+
+
+@pytest.mark.unit
+class TestCleanupPlanner:
+    def test_children_of_deleted_parents_are_pruned(self):
+        planner = _plan(
+            CleanupTarget("project", "P"),
+            CleanupTarget("project", "P_Sub", ("project", "P")),
+            CleanupTarget("buildType", "P_Sub_Bt", ("project", "P_Sub")),
+            CleanupTarget("build", 1, ("buildType", "P_Sub_Bt")),
+            CleanupTarget("user", "u"),
+        )
+
+        levels = planner.plan()
+
+        assert [[t.key for t in level] for level in levels] == [
+            [("user", "u")],
+            [],
+            [("project", "P")],
+        ]
+        assert (planner.report.planned, planner.report.pruned) == (2, 3)
+
+    def test_build_type_owner_from_id_prefix(self):
+        planner = _plan(
+            CleanupTarget("project", "Proj"),
+            CleanupTarget("buildType", "Proj_Build"),
+            CleanupTarget("buildType", "Other_Build"),
+        )
+
+        assert planner.ancestors(CleanupTarget("buildType", "Proj_Build")) == [
+            ("project", "Proj")
+        ]
+        assert [t.id for level in planner.plan() for t in level] == [
+            "Other_Build",
+            "Proj",
+        ]
+
+    def test_run_deletes_level_by_level(self, deleted):
+        report = _plan(
+            CleanupTarget("project", "A"),
+            CleanupTarget("buildType", "B_Bt", ("project", "B")),
+            CleanupTarget("build", 7, ("buildType", "C_Bt")),
+            CleanupTarget("user", "u"),
+        ).run()
+
+        kinds = [kind for kind, _ in deleted]
+        assert sorted(kinds[:2]) == ["build", "user"]
+        assert kinds[2:] == ["buildType", "project"]
+        assert report.deleted == 4 and not report.failed
+
+    def test_failures_are_reported_not_raised(self, deleted):
+        report = _plan(
+            CleanupTarget("user", "broken"), CleanupTarget("user", "ok")
+        ).run()
+
+        assert deleted == [("user", "ok")]
+        assert [target.id for target, _ in report.failed] == ["broken"]
+        assert report.deleted == 1
+
+    def test_duplicate_objects_are_deleted_once(self):
+        planner = _plan(CleanupTarget("user", "u"), CleanupTarget("user", "u"))
+
+        assert planner.report.tracked == 1
@@ -0,0 +1,73 @@
+import pytest
+
+from src.main.api.configs.config import Config
+from src.main.ui.classes.context_pool import ContextPool
+
+
+class _Page:
+    def __init__(self, context, url="about:blank"):
+        self.context = context
+        self.url = url
+        self.routes = []
+        self.scripts = []
+
+    def route(self, url, handler):
+        self.routes.append(url)
+
+    def goto(self, url, **kwargs):
+        self.url = url
+
+    def evaluate(self, script):
+        self.scripts.append((self.url, script))
+
+    def close(self):
+        self.context.open.remove(self)
+        self.context.closed.append(self)
+
+
+class _Context:
+    def __init__(self, *urls):
+        self.open = [_Page(self, url) for url in urls]
+        self.closed = []
+        self.cookies_cleared = False
+
+    @property
+    def pages(self):
+        # A copy, as in Playwright
+        return list(self.open)
+
+    def new_page(self):
+        page = _Page(self)
+        self.open.append(page)
+        return page
+
+    def unroute_all(self, behavior=None):
+        pass
+
+    def clear_permissions(self):
+        pass
+
+    def clear_cookies(self):
+        self.cookies_cleared = True
+
+
+@pytest.mark.unit
+class TestContextPoolReset:
+    @pytest.mark.parametrize(
+        "urls",
+        [(), ("https://example.org/",), ("about:blank", "https://example.org/")],
+        ids=str,
+    )
+    def test_origin_storage_is_cleared_whatever_pages_are_left(self, urls):
+        server = str(Config.get("server")).rstrip("/")
+        context = _Context(*urls)
+
+        assert ContextPool._reset(context, keep_cookies=True) is True
+
+        assert context.pages == [], "Every page must be closed"
+        scripts = [script for page in context.closed for script in page.scripts]
+        assert len(scripts) == 1
+        url, script = scripts[0]
+        assert url.startswith(server)
+        assert "localStorage.clear()" in script and "sessionStorage.clear()" in script
+        assert not context.cookies_cleared
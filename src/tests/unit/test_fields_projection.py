@@ -0,0 +1,109 @@
+import re
+from typing import List
+
+import pytest
+from pydantic import ConfigDict
+
+from src.main.api.models.agent_response import AgentsListResponse
+from src.main.api.models.base_model import BaseModel
+from src.main.api.models.build_list_response import BuildListResponse
+from src.main.api.models.create_user_response import (
+    CreateUserResponse,
+    UsersListResponse,
+)
+from src.main.api.requests.skeleton.endpoint import Endpoint
+from src.main.api.requests.skeleton.fields_projection import (
+    _inner_model,
+    fields_projection,
+    with_fields,
+)
+
+
+class _Open(BaseModel):
+    model_config = ConfigDict(extra="allow")
+    id: str
+
+
+class _Holder(BaseModel):
+    id: str
+    items: List[_Open] = []
+
+
+@pytest.mark.unit
+class TestFieldsProjection:
+    def test_nested_list_of_models(self):
+        assert fields_projection(BuildListResponse) == (
+            "build(buildTypeId,finishDate,id,queuedDate,startDate,state,status,"
+            "statusText),count"
+        )
+
+    def test_list_elements_get_every_field(self):
+        assert fields_projection(CreateUserResponse) == (
+            "groups,href,id,name,properties,roles,username"
+        )
+        assert fields_projection(UsersListResponse) == (
+            "count,user(groups,href,id,name,properties,roles,username)"
+        )
+
+    def test_agents_come_back_with_their_state(self):
+        # Short-form agents would parse with connected/authorized defaults
+        assert fields_projection(AgentsListResponse) == (
+            "agent(authorized,build,connected,enabled,href,id,name,properties,"
+            "typeId,webUrl),count"
+        )
+
+    @pytest.mark.parametrize(
+        "endpoint",
+        [e for e in Endpoint if fields_projection(e.value.response_model)],
+        ids=lambda e: e.name,
+    )
+    def test_every_declared_field_is_requested(self, endpoint):
+        projection = fields_projection(endpoint.value.response_model)
+
+        def covered(model, fields):
+            for name, field in model.model_fields.items():
+                if (field.json_schema_extra or {}).get("local"):
+                    continue
+                match = re.search(rf"(?:^|[,(]){name}(\(|,|\)|$)", fields)
+                assert match, f"{model.__name__}.{name} missing from {fields}"
+                inner = _inner_model(field.annotation)
+                if inner is not None:
+                    # The element's own fields follow inside its parentheses
+                    assert match.group(1) == "(", f"{name} requested in short form"
+                    covered(inner, fields[match.end() :])
+
+        covered(endpoint.value.response_model, projection)
+
+    def test_local_fields_are_not_requested(self):
+        assert "password" not in fields_projection(CreateUserResponse)
+
+    def test_extra_allow_models_want_everything(self):
+        assert fields_projection(_Open) is None
+        assert fields_projection(_Holder) == "id,items(id)"
+
+    def test_non_models_get_no_projection(self):
+        assert fields_projection(dict) is None
+
+
+@pytest.mark.unit
+class TestWithFields:
+    def test_derived_projection_is_added(self):
+        assert with_fields({"locator": "x"}, "/app/rest/builds", BuildListResponse) == {
+            "locator": "x",
+            "fields": fields_projection(BuildListResponse),
+        }
+
+    def test_explicit_fields_win(self):
+        assert with_fields(None, "/app/rest/builds", BuildListResponse, "id") == {
+            "fields": "id"
+        }
+
+    def test_empty_fields_ask_for_the_default_representation(self):
+        assert with_fields(None, "/app/rest/builds", BuildListResponse, "") is None
+
+    def test_fields_already_in_url_or_params_are_kept(self):
+        params = {"fields": "count"}
+        assert with_fields(params, "/app/rest/builds", BuildListResponse) is params
+        assert (
+            with_fields(None, "/app/rest/builds?fields=id", BuildListResponse) is None
+        )
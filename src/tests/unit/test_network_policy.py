@@ -0,0 +1,97 @@
+from types import SimpleNamespace
+
+import pytest
+import requests
+
+from src.main.ui.classes import asset_cache
+from src.main.ui.classes.asset_cache import AssetCache
+from src.main.ui.classes.network_policy import NetworkPolicy
+
+
+class _Context:
+    def __init__(self):
+        self.routes = []
+
+    def route(self, url, handler):
+        self.routes.append(url)
+
+
+def _server_info(info):
+    class Requester:
+        def __init__(self, *args):
+            pass
+
+        def get(self):
+            if isinstance(info, Exception):
+                raise info
+            return SimpleNamespace(json=lambda: info)
+
+    return Requester
+
+
+@pytest.fixture(autouse=True)
+def versions(monkeypatch):
+    monkeypatch.setattr(AssetCache, "_versions", {})
+    monkeypatch.setattr(
+        asset_cache,
+        "CrudRequester",
+        _server_info({"version": "2024.12 (build 174331)", "buildNumber": "174331"}),
+    )
+
+
+@pytest.mark.unit
+class TestNetworkPolicyRoutes:
+    def test_default_policy_routes_only_analytics_and_assets(self):
+        context = _Context()
+        NetworkPolicy(block=("analytics",), cache=True).apply(context)
+
+        assert "**/*" not in context.routes
+        analytics, assets = context.routes
+        assert analytics.search("https://www.google-analytics.com/g/collect?v=2")
+        assert not analytics.search("http://localhost:8111/app/rest/builds")
+        assert assets.search("http://localhost:8111/js/bundle.js")
+        assert not assets.search("http://localhost:8111/app/rest/builds?x=/js/")
+
+    @pytest.mark.parametrize(
+        "policy",
+        [
+            NetworkPolicy(block=("analytics",), deny=("*/avatars/*",)),
+            NetworkPolicy(block=("analytics", "image")),
+        ],
+        ids=["deny", "resource-type"],
+    )
+    def test_catch_all_only_for_deny_and_resource_types(self, policy):
+        context = _Context()
+        policy.apply(context)
+
+        assert context.routes == ["**/*"]
+
+    def test_nothing_routed_without_a_policy(self):
+        context = _Context()
+        NetworkPolicy(cache=False).apply(context)
+
+        assert context.routes == []
+
+
+@pytest.mark.unit
+class TestAssetCacheVersion:
+    def test_entries_are_kept_per_server_version(self, monkeypatch):
+        old = AssetCache.root()
+        monkeypatch.setattr(AssetCache, "_versions", {})
+        monkeypatch.setattr(
+            asset_cache,
+            "CrudRequester",
+            _server_info(
+                {"version": "2025.03 (build 186049)", "buildNumber": "186049"}
+            ),
+        )
+
+        assert AssetCache.root() != old
+        assert AssetCache.root().parent == old.parent
+
+    def test_unknown_version_disables_the_cache(self, monkeypatch):
+        monkeypatch.setattr(
+            asset_cache, "CrudRequester", _server_info(requests.ConnectionError())
+        )
+
+        assert AssetCache.enabled() is False
@@ -0,0 +1,77 @@
+import time
+
+import pytest
+
+from src.main.api.utils import poller as poller_module
+from src.main.api.utils.poller import Poller
+
+
+@pytest.fixture
+def sleeps(monkeypatch):
+    recorded = []
+    monkeypatch.setattr(poller_module.time, "sleep", recorded.append)
+    return recorded
+
+
+@pytest.mark.unit
+class TestPoller:
+    def test_needs_a_bound(self):
+        with pytest.raises(ValueError):
+            Poller()
+
+    def test_exponential_backoff_up_to_max_delay(self, sleeps):
+        poller = Poller(
+            max_attempts=6, initial_delay=0.5, max_delay=3, factor=2, jitter=0
+        )
+
+        with pytest.raises(TimeoutError, match="6 attempts"):
+            poller.poll(lambda: None, until=lambda result: False)
+
+        assert sleeps == [0.5, 1.0, 2.0, 3.0, 3.0]
+        assert poller.metrics.wasted_polls == 6
+
+    def test_jitter_stays_within_share_of_delay(self, sleeps):
+        poller = Poller(max_attempts=50, initial_delay=1, max_delay=1, jitter=0.2)
+
+        with pytest.raises(TimeoutError):
+            poller.poll(lambda: None, until=lambda result: False)
+
+        assert all(0.8 <= delay <= 1.2 for delay in sleeps)
+
+    def test_returns_when_condition_holds(self, sleeps):
+        results = iter(range(10))
+        poller = Poller(max_attempts=10, initial_delay=0.1, jitter=0)
+
+        assert poller.poll(lambda: next(results), until=lambda r: r == 3) == 3
+        assert poller.metrics.attempts == 4
+        assert poller.metrics.time_to_settle is not None
+
+    def test_stop_when_returns_early(self, sleeps):
+        poller = Poller(max_attempts=10, initial_delay=0.1, jitter=0)
+
+        result = poller.poll(
+            lambda: "failed", until=lambda r: r == "ok", stop_when=lambda r: True
+        )
+
+        assert result == "failed"
+        assert poller.metrics.stopped_early
+
+    def test_timeout_never_sleeps_past_the_deadline(self):
+        poller = Poller(timeout=0.3, initial_delay=0.2, max_delay=10, jitter=0)
+        started = time.monotonic()
+
+        with pytest.raises(TimeoutError):
+            poller.poll(lambda: None, until=lambda result: False)
+
+        assert time.monotonic() - started < 0.5
+        assert poller.remaining() == 0
+
+    def test_ticks_count_progress(self, sleeps):
+        poller = Poller(max_attempts=3, initial_delay=0.1, jitter=0)
+
+        for attempt in poller.ticks():
+            if attempt == 2:
+                poller.progress()
+
+        assert poller.metrics.attempts == 3
+        assert poller.metrics.wasted_polls == 2
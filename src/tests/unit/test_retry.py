@@ -0,0 +1,33 @@
+import pytest
+
+from src.main.api.utils import poller as poller_module
+from src.main.api.utils.retry import RetryUtils
+
+
+@pytest.mark.unit
+class TestRetryUtils:
+    def test_returns_once_condition_holds(self):
+        results = iter([1, 2, 3])
+
+        result = RetryUtils.retry(
+            "count", lambda: next(results), lambda r: r == 3, delay_seconds=0.01
+        )
+
+        assert result == 3
+
+    def test_every_attempt_runs_with_a_constant_delay(self, monkeypatch):
+        sleeps, calls = [], []
+        monkeypatch.setattr(poller_module.time, "sleep", sleeps.append)
+
+        with pytest.raises(TimeoutError, match="after 10 attempts") as error:
+            RetryUtils.retry(
+                "never",
+                lambda: calls.append(1),
+                lambda r: False,
+                max_attempts=10,
+                delay_seconds=1.0,
+            )
+
+        assert len(calls) == 10
+        assert all(0.7 <= delay <= 1.3 for delay in sleeps)
+        assert isinstance(error.value.__cause__, TimeoutError)
@@ -0,0 +1,68 @@
+from types import SimpleNamespace
+
+import pytest
+import requests
+
+from src.main.api.utils import server_health
+from src.main.api.utils.server_health import HealthReport, ServerHealth
+
+
+class _ServerInfo:
+    def __init__(self, *args):
+        pass
+
+    def get(self):
+        return SimpleNamespace(status_code=200, url="http://tc/app/rest/server")
+
+
+def _agents(*agents):
+    class Requester:
+        def __init__(self, *args):
+            pass
+
+        def get(self, **kwargs):
+            if isinstance(agents[0], Exception):
+                raise agents[0]
+            return SimpleNamespace(agent=list(agents))
+
+    return Requester
+
+
+class _BrokenAgentSteps:
+    def __init__(self, created_objects):
+        pass
+
+    def authorize_all_agents(self):
+        raise requests.ConnectionError("connection reset")
+
+
+@pytest.fixture(autouse=True)
+def server_up(monkeypatch):
+    monkeypatch.setattr(server_health, "CrudRequester", _ServerInfo)
+
+
+@pytest.mark.unit
+class TestServerHealthCheck:
+    @pytest.mark.parametrize(
+        "error",
+        [requests.ConnectionError("refused"), AssertionError("expected 200, got 500")],
+        ids=["request", "response-spec"],
+    )
+    def test_agents_list_failure_is_recorded(self, monkeypatch, error):
+        monkeypatch.setattr(server_health, "ValidatedCrudRequester", _agents(error))
+        report = HealthReport("http://tc")
+
+        assert ServerHealth._check(report, min_agents=1, prepare_agents=False) is False
+        assert (
+            "agents list failed"
+            in report.checks["1+ agents connected, authorized, enabled"]
+        )
+
+    def test_prepare_agents_failure_is_recorded(self, monkeypatch):
+        idle = SimpleNamespace(id=1, authorized=False, enabled=True)
+        monkeypatch.setattr(server_health, "ValidatedCrudRequester", _agents(idle))
+        monkeypatch.setattr(server_health, "AgentSteps", _BrokenAgentSteps)
+        report = HealthReport("http://tc")
+
+        assert ServerHealth._check(report, min_agents=1, prepare_agents=True) is False
+        assert "connection reset" in report.checks["prepare agents"]
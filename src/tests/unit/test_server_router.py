@@ -0,0 +1,64 @@
+import pytest
+
+from src.main.api.configs.server_router import ServerRouter
+
+SERVERS = {
+    "servers": "http://tc-a:8111/, http://tc-b:8111",
+    "servers.1.bearerToken": "token-b",
+}
+
+
+@pytest.fixture
+def worker(monkeypatch):
+    def set_worker(name):
+        if name is None:
+            monkeypatch.delenv("PYTEST_XDIST_WORKER", raising=False)
+        else:
+            monkeypatch.setenv("PYTEST_XDIST_WORKER", name)
+
+    return set_worker
+
+
+@pytest.mark.unit
+class TestServerRouter:
+    @pytest.mark.parametrize(
+        "name, url",
+        [
+            ("gw0", "http://tc-a:8111"),
+            ("gw1", "http://tc-b:8111"),
+            ("gw2", "http://tc-a:8111"),
+            ("gw5", "http://tc-b:8111"),
+            (None, "http://tc-a:8111"),
+        ],
+    )
+    def test_worker_routes_to_server_by_index(self, worker, name, url):
+        worker(name)
+
+        assert ServerRouter.resolve("server", SERVERS.get) == url
+
+    def test_per_server_key_of_the_routed_server(self, worker):
+        worker("gw1")
+
+        assert ServerRouter.resolve("admin.bearerToken", SERVERS.get) == "token-b"
+
+    def test_missing_per_server_key_falls_back_to_single_server_key(self, worker):
+        worker("gw0")
+
+        assert ServerRouter.resolve("admin.bearerToken", SERVERS.get) is None
+        assert ServerRouter.resolve("admin.password", SERVERS.get) is None
+
+    def test_server_index_pins_the_run(self, worker):
+        worker("gw0")
+        lookup = {**SERVERS, "server.index": "3"}.get
+
+        assert ServerRouter.resolve("server", lookup) == "http://tc-b:8111"
+
+    def test_without_servers_nothing_is_routed(self, worker):
+        worker("gw1")
+
+        assert ServerRouter.resolve("server", {}.get) is None
+
+    def test_other_keys_are_not_routed(self, worker):
+        worker("gw1")
+
+        assert ServerRouter.resolve("apiVersion", SERVERS.get) is None